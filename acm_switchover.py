@@ -31,7 +31,19 @@
     __version_date__,
     setup_logging,
 )
-from lib.constants import EXIT_FAILURE, EXIT_INTERRUPT, EXIT_SUCCESS, STALE_STATE_THRESHOLD
+from lib.constants import (
+    DEFAULT_STATE_DIR,
+    EXIT_FAILURE,
+    EXIT_INTERRUPT,
+    EXIT_SUCCESS,
+    KLUSTERLET_VERIFY_CONCURRENCY,
+    PREFLIGHT_CACHE_DIRNAME,
+    RBAC_CACHE_DIRNAME,
+    STALE_STATE_THRESHOLD,
+    STATE_DIR_ENV_VAR,
+    STATE_FLUSH_INTERVAL,
+)
+from lib.kubeconfig_store import resolve_context_server
 from lib.validation import InputValidator, ValidationError
 from modules import (
     Decommission,
@@ -42,8 +54,6 @@
 )
 from modules.preflight_coordinator import PreflightValidator
 
-STATE_DIR_ENV_VAR = "ACM_SWITCHOVER_STATE_DIR"
-
 PhaseHandler = Callable[
     [argparse.Namespace, StateManager, KubeClient, KubeClient, logging.Logger],
     bool,
@@ -139,6 +149,21 @@ def parse_args():
             "(defaults to $ACM_SWITCHOVER_STATE_DIR/switchover-<primary>__<secondary>.json when set, otherwise .state/...)"
         ),
     )
+    parser.add_argument(
+        "--state-journal",
+        action="store_true",
+        help="Append state changes to a journal next to the state file instead of rewriting it on every step",
+    )
+    parser.add_argument(
+        "--state-flush-interval",
+        type=float,
+        default=STATE_FLUSH_INTERVAL,
+        metavar="SECONDS",
+        help=(
+            "Write routine state updates from a background thread, coalescing those made within this window; "
+            "phase changes and errors are still written immediately (default: 0, write synchronously)"
+        ),
+    )
     parser.add_argument(
         "--reset-state",
         action="store_true",
@@ -207,6 +232,34 @@ def parse_args():
         action="store_true",
         help="Non-interactive mode for decommission (dangerous)",
     )
+    parser.add_argument(
+        "--managed-cluster-cache",
+        action="store_true",
+        help=(
+            "Serve ManagedCluster reads from a watch-backed cache instead of re-listing on every poll "
+            "(recommended for large fleets)"
+        ),
+    )
+    parser.add_argument(
+        "--no-preflight-cache",
+        action="store_true",
+        help="Re-list every resource during pre-flight instead of reusing unchanged lists cached under the state dir",
+    )
+    parser.add_argument(
+        "--no-rbac-cache",
+        action="store_true",
+        help="Re-check every RBAC permission instead of reusing recent verdicts cached under the state dir",
+    )
+    parser.add_argument(
+        "--klusterlet-concurrency",
+        type=int,
+        default=KLUSTERLET_VERIFY_CONCURRENCY,
+        metavar="N",
+        help=(
+            "Maximum managed clusters checked concurrently during klusterlet verification "
+            f"(default: {KLUSTERLET_VERIFY_CONCURRENCY})"
+        ),
+    )
 
     # Logging
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
@@ -371,7 +424,14 @@ def _run_phase_preflight(
 
     state.set_phase(Phase.PREFLIGHT)
 
-    validator = PreflightValidator(primary, secondary, args.method, skip_rbac_validation=args.skip_rbac_validation)
+    validator = PreflightValidator(
+        primary,
+        secondary,
+        args.method,
+        skip_rbac_validation=args.skip_rbac_validation,
+        cache_dir=_get_preflight_cache_dir(args),
+        rbac_cache_dir=_get_rbac_cache_dir(args),
+    )
     passed, config = validator.validate_all()
 
     if not passed:
@@ -475,6 +535,7 @@ def _run_phase_post_activation(
         state,
         state.get_config("secondary_has_observability", False),
         dry_run=args.dry_run,
+        klusterlet_concurrency=getattr(args, "klusterlet_concurrency", KLUSTERLET_VERIFY_CONCURRENCY),
     )
 
     if not verification.verify():
@@ -660,7 +721,11 @@ def main():
             logger.error("\n✗ Setup failed!")
             sys.exit(EXIT_FAILURE)
 
-    state = StateManager(resolved_state_file)
+    state = StateManager(
+        resolved_state_file,
+        journal=getattr(args, "state_journal", False),
+        flush_interval=getattr(args, "state_flush_interval", STATE_FLUSH_INTERVAL),
+    )
 
     if args.reset_state:
         logger.warning("Resetting state file...")
@@ -699,27 +764,61 @@ def _initialize_clients(
 ) -> Tuple[KubeClient, Optional[KubeClient]]:
     """Create Kubernetes clients for provided contexts."""
 
-    logger.info("Connecting to primary hub: %s", args.primary_context)
+    # Resolve both contexts up front (served from the kubeconfig index on warm runs)
+    primary_server = resolve_context_server(args.primary_context)
+    secondary_server = resolve_context_server(args.secondary_context) if args.secondary_context else ""
+
+    logger.info("Connecting to primary hub: %s", _context_label(args.primary_context, primary_server))
     primary = KubeClient(args.primary_context, dry_run=args.dry_run)
 
     secondary = None
     if args.secondary_context:
-        logger.info("Connecting to secondary hub: %s", args.secondary_context)
+        logger.info("Connecting to secondary hub: %s", _context_label(args.secondary_context, secondary_server))
         secondary = KubeClient(args.secondary_context, dry_run=args.dry_run)
 
+    if getattr(args, "managed_cluster_cache", False):
+        for hub in (primary, secondary):
+            if hub is not None and not hub.enable_managed_cluster_cache():
+                logger.warning("ManagedCluster cache not ready for %s; reading from API server", hub.context)
+
     return primary, secondary
 
 
+def _context_label(context: str, server: str) -> str:
+    """Format a context for logging, with its API server when known."""
+    return f"{context} ({server})" if server else context
+
+
 def _sanitize_context_identifier(value: str) -> str:
     """Sanitize context string to be filesystem friendly."""
     return InputValidator.sanitize_context_identifier(value)
 
 
+def _get_state_dir(args: argparse.Namespace) -> str:
+    """Return the directory holding the state file and the caches kept next to it."""
+    state_dir = os.path.dirname(args.state_file) if getattr(args, "state_file", None) else _get_default_state_dir()
+    return state_dir or "."
+
+
+def _get_preflight_cache_dir(args: argparse.Namespace) -> Optional[str]:
+    """Return the pre-flight list cache directory (next to the state file), or None if disabled."""
+    if getattr(args, "no_preflight_cache", False):
+        return None
+    return os.path.join(_get_state_dir(args), PREFLIGHT_CACHE_DIRNAME)
+
+
+def _get_rbac_cache_dir(args: argparse.Namespace) -> Optional[str]:
+    """Return the RBAC verdict cache directory (next to the state file), or None if disabled."""
+    if getattr(args, "no_rbac_cache", False):
+        return None
+    return os.path.join(_get_state_dir(args), RBAC_CACHE_DIRNAME)
+
+
 def _get_default_state_dir() -> str:
     env_state_dir = os.environ.get(STATE_DIR_ENV_VAR)
     if env_state_dir and env_state_dir.strip():
         return env_state_dir.strip()
-    return ".state"
+    return DEFAULT_STATE_DIR
 
 
 def _resolve_state_file(requested_path: Optional[str], primary_ctx: str, secondary_ctx: Optional[str]) -> str:
@@ -7,11 +7,24 @@
 """
 
 import argparse
+import fnmatch
+import json
 import logging
+import os
 import sys
 import traceback
 
 from lib import KubeClient, RBACValidator, __version__, __version_date__, setup_logging
+from lib.constants import (
+    DEFAULT_STATE_DIR,
+    RBAC_CACHE_DIRNAME,
+    RBAC_FLEET_CHECK_TIMEOUT,
+    RBAC_FLEET_CONCURRENCY,
+    STATE_DIR_ENV_VAR,
+)
+from lib.kubeconfig_store import get_kubeconfig_store, resolve_context_server
+from lib.rbac_cache import RBACVerdictCache
+from lib.rbac_validator import prefetch_permissions, validate_managed_cluster_fleet
 
 
 def parse_args():
@@ -47,6 +60,15 @@ def parse_args():
 
   # Validate read-only access on managed cluster
   %(prog)s --context prod1 --managed-cluster --role validator
+
+  # Validate a fleet of managed clusters concurrently (JSON summary on stdout)
+  %(prog)s --contexts prod1,prod2,prod3 --role operator > rbac-summary.json
+
+  # Validate every kubeconfig context matching a pattern
+  %(prog)s --context-pattern 'prod-*' --concurrency 100 --context-timeout 30
+
+  # Re-check every permission instead of reusing recent cached verdicts
+  %(prog)s --no-rbac-cache
         """,
     )
 
@@ -78,12 +100,45 @@ def parse_args():
         help="Validate as a managed cluster (check open-cluster-management-agent namespace "
         "instead of hub namespaces). Use this when checking RBAC on spoke clusters.",
     )
+    parser.add_argument(
+        "--contexts",
+        metavar="CONTEXTS",
+        help="Comma-separated managed cluster contexts to validate concurrently (fleet mode, implies "
+        "--managed-cluster). Prints a JSON summary with per-cluster results and timings to stdout.",
+    )
+    parser.add_argument(
+        "--context-pattern",
+        metavar="GLOB",
+        help="Validate every kubeconfig context matching this shell-style pattern, e.g. 'prod-*' "
+        "(fleet mode; may be combined with --contexts)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=RBAC_FLEET_CONCURRENCY,
+        metavar="N",
+        help=f"Maximum managed cluster contexts validated at once in fleet mode (default: {RBAC_FLEET_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--context-timeout",
+        type=float,
+        default=RBAC_FLEET_CHECK_TIMEOUT,
+        metavar="SECONDS",
+        help="Seconds allowed per managed cluster context in fleet mode before it is reported as timed out "
+        f"(default: {RBAC_FLEET_CHECK_TIMEOUT})",
+    )
     parser.add_argument(
         "--role",
         choices=["operator", "validator"],
         default="operator",
         help="Role to validate permissions for (default: operator). " "Use 'validator' for read-only service accounts.",
     )
+    parser.add_argument(
+        "--no-rbac-cache",
+        action="store_true",
+        help="Re-check every permission instead of reusing verdicts cached in the last "
+        "few minutes (by this script or acm_switchover.py) under the state dir",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -91,7 +146,46 @@ def parse_args():
         help="Enable verbose logging",
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.contexts or args.context_pattern:
+        if args.context or args.primary_context or args.secondary_context:
+            parser.error(
+                "--contexts/--context-pattern cannot be combined with --context, --primary-context "
+                "or --secondary-context"
+            )
+        if args.concurrency < 1:
+            parser.error("--concurrency must be at least 1")
+        if args.context_timeout <= 0:
+            parser.error("--context-timeout must be positive")
+    return args
+
+
+def get_rbac_cache(args):
+    """Return the RBAC verdict cache shared with acm_switchover.py, or None if disabled."""
+    if args.no_rbac_cache:
+        return None
+    state_dir = (os.environ.get(STATE_DIR_ENV_VAR) or "").strip() or DEFAULT_STATE_DIR
+    return RBACVerdictCache(os.path.join(state_dir, RBAC_CACHE_DIRNAME))
+
+
+def select_fleet_contexts(args):
+    """Return the contexts named by --contexts and matched by --context-pattern, without duplicates.
+
+    Raises:
+        ValueError: If a named context is not in the kubeconfig or the pattern matches nothing
+    """
+    selected = [context.strip() for context in (args.contexts or "").split(",") if context.strip()]
+    for context in selected:
+        resolve_context_server(context)
+
+    if args.context_pattern:
+        index = get_kubeconfig_store().lookup(max_size=0)
+        matched = sorted(name for name in index.contexts if fnmatch.fnmatchcase(name, args.context_pattern))
+        if not matched:
+            raise ValueError(f"No kubeconfig context matches '{args.context_pattern}'")
+        selected.extend(matched)
+
+    return list(dict.fromkeys(selected))
 
 
 def main():
@@ -103,21 +197,49 @@ def main():
     logger = logging.getLogger("acm_switchover")
 
     logger.info("ACM Switchover RBAC Checker v%s (%s)", __version__, __version_date__)
+    cache = get_rbac_cache(args)
 
     try:
         # Determine which contexts to check
-        if args.primary_context and args.secondary_context:
+        if args.contexts or args.context_pattern:
+            # Fleet mode: managed cluster checks on many spokes, one JSON summary
+            contexts = select_fleet_contexts(args)
+            summary = validate_managed_cluster_fleet(
+                contexts,
+                role=args.role,
+                concurrency=args.concurrency,
+                timeout=args.context_timeout,
+                cache=cache,
+            )
+            print(json.dumps(summary, indent=2))
+            sys.exit(0 if summary["passed"] == summary["contexts"] else 1)
+
+        elif args.primary_context and args.secondary_context:
             # Check both hubs
             logger.info("Checking RBAC permissions on both hubs...")
 
+            # Fail fast on unknown contexts (resolved from the kubeconfig index on warm runs)
+            resolve_context_server(args.primary_context)
+            resolve_context_server(args.secondary_context)
+
             primary_client = KubeClient(context=args.primary_context)
             secondary_client = KubeClient(context=args.secondary_context)
+            primary_validator = RBACValidator(primary_client, role=args.role, use_rules_review=True)
+            secondary_validator = RBACValidator(secondary_client, role=args.role, use_rules_review=True)
+
+            # Resolve both hubs' reviews concurrently; the reports below reuse the verdicts
+            prefetch_permissions(
+                [
+                    (primary_validator, args.include_decommission, args.skip_observability),
+                    (secondary_validator, False, args.skip_observability),
+                ],
+                cache=cache,
+            )
 
             # Validate primary
             logger.info("\n" + "=" * 80)
             logger.info("PRIMARY HUB (%s) - Role: %s", args.primary_context, args.role)
             logger.info("=" * 80)
-            primary_validator = RBACValidator(primary_client, role=args.role)
             primary_valid, _ = primary_validator.validate_all_permissions(
                 include_decommission=args.include_decommission,
                 skip_observability=args.skip_observability,
@@ -132,7 +254,6 @@ def main():
             logger.info("\n" + "=" * 80)
             logger.info("SECONDARY HUB (%s) - Role: %s", args.secondary_context, args.role)
             logger.info("=" * 80)
-            secondary_validator = RBACValidator(secondary_client, role=args.role)
             secondary_valid, _ = secondary_validator.validate_all_permissions(
                 include_decommission=False,
                 skip_observability=args.skip_observability,
@@ -155,15 +276,23 @@ def main():
         else:
             # Check single context
             context = args.context or args.primary_context or args.secondary_context
+            server = resolve_context_server(context)
             if context:
                 logger.info("Checking RBAC permissions on context: %s", context)
             else:
                 logger.info("Checking RBAC permissions on current context")
+            if server:
+                logger.info("API server: %s", server)
 
             client = KubeClient(context=context)
-            validator = RBACValidator(client, role=args.role)
+            validator = RBACValidator(client, role=args.role, use_rules_review=True)
 
             logger.info("Validating for role: %s", args.role)
+            prefetch_permissions(
+                [(validator, args.include_decommission, args.skip_observability)],
+                managed_cluster=args.managed_cluster,
+                cache=cache,
+            )
 
             # Check if this is a managed cluster validation
             if args.managed_cluster:
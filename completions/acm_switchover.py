@@ -67,7 +67,7 @@
 
     # Option list completion
     if [[ "$cur" == -* ]]; then
-        local opts="--primary-context --secondary-context --validate-only --dry-run --decommission --method --manage-auto-import-strategy --state-file --reset-state --old-hub-action --skip-observability-checks --skip-rbac-validation --non-interactive --verbose -v --log-format --help -h"
+        local opts="--primary-context --secondary-context --validate-only --dry-run --decommission --method --manage-auto-import-strategy --state-file --state-journal --state-flush-interval --reset-state --old-hub-action --skip-observability-checks --skip-rbac-validation --managed-cluster-cache --no-preflight-cache --no-rbac-cache --klusterlet-concurrency --non-interactive --verbose -v --log-format --help -h"
         _acm_complete_from_list "$opts"
         return
     fi
@@ -10,10 +10,17 @@
     prev="${COMP_WORDS[COMP_CWORD-1]}"
 
     case "$prev" in
-        --context|--primary-context|--secondary-context)
+        --context|--primary-context|--secondary-context|--contexts)
             _acm_complete_from_list "$(_acm_get_contexts)"
             return
             ;;
+        --role)
+            _acm_complete_from_list "operator validator"
+            return
+            ;;
+        --context-pattern|--concurrency|--context-timeout)
+            return
+            ;;
     esac
 
     if [[ "$cur" == --context=* ]]; then
@@ -36,7 +43,7 @@
     fi
 
     if [[ "$cur" == -* ]]; then
-        local opts="--context --primary-context --secondary-context --include-decommission --skip-observability --verbose -v --help -h"
+        local opts="--context --primary-context --secondary-context --include-decommission --skip-observability --managed-cluster --contexts --context-pattern --concurrency --context-timeout --role --no-rbac-cache --verbose -v --help -h"
         _acm_complete_from_list "$opts"
         return
     fi
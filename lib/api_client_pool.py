@@ -0,0 +1,108 @@
+"""
+Thread-safe pool of Kubernetes ApiClients keyed by kubeconfig context.
+
+Managed-cluster helpers (klusterlet verification and reconnect) talk to many
+spoke clusters from worker threads. Building a client per call re-parses the
+kubeconfig, mutates the process-wide default configuration, and opens a new
+TLS connection pool each time. The pool builds one ApiClient per context from
+already-parsed kubeconfig data, with its own Configuration, and reuses it so
+keep-alive connections are shared across calls.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from kubernetes import client, config
+from kubernetes.config.config_exception import ConfigException
+
+logger = logging.getLogger("acm_switchover")
+
+
+class ApiClientPool:
+    """Cache of ApiClient objects, one per kubeconfig context.
+
+    ApiClient (and its urllib3 pool manager) is safe to share between threads,
+    so a single client per context serves all concurrent callers.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: Dict[str, client.ApiClient] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def get(self, context_name: str, kubeconfig_data: Optional[Dict[str, Any]] = None) -> client.ApiClient:
+        """Return the pooled ApiClient for a context, building it on first use.
+
+        Args:
+            context_name: Kubeconfig context name
+            kubeconfig_data: Parsed (merged) kubeconfig with contexts/clusters/users.
+                             When missing or unusable (e.g., relative certificate
+                             paths), the client is built from the kubeconfig files.
+
+        Returns:
+            ApiClient configured for the context
+
+        Raises:
+            ConfigException: If the context cannot be loaded
+        """
+        with self._lock:
+            existing = self._clients.get(context_name)
+        if existing is not None:
+            return existing
+
+        # Build outside the lock so slow auth plugins don't serialize other contexts
+        api_client = self._build(context_name, kubeconfig_data)
+
+        with self._lock:
+            existing = self._clients.get(context_name)
+            if existing is None:
+                self._clients[context_name] = api_client
+                return api_client
+        # Another thread won the race; keep its client
+        api_client.close()
+        return existing
+
+    @staticmethod
+    def _build(context_name: str, kubeconfig_data: Optional[Dict[str, Any]]) -> client.ApiClient:
+        if kubeconfig_data:
+            configuration = client.Configuration()
+            try:
+                config.load_kube_config_from_dict(
+                    config_dict=kubeconfig_data,
+                    context=context_name,
+                    client_configuration=configuration,
+                    persist_config=False,
+                )
+                logger.debug("Built API client for context %s from parsed kubeconfig", context_name)
+                return client.ApiClient(configuration)
+            except (ConfigException, OSError, ValueError) as e:
+                logger.debug(
+                    "Could not build API client for context %s from parsed kubeconfig (%s); loading from files",
+                    context_name,
+                    e,
+                )
+        return config.new_client_from_config(context=context_name, persist_config=False)
+
+    def reset(self) -> None:
+        """Drop all pooled clients without closing them (e.g., after the kubeconfig changed).
+
+        Threads still using a dropped client finish their requests on it; its
+        connections are released once nothing references it.
+        """
+        with self._lock:
+            self._clients = {}
+
+    def clear(self) -> None:
+        """Close and drop all pooled clients (when done with them; see reset())."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients = {}
+        for api_client in clients:
+            try:
+                api_client.close()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug("Error closing API client: %s", e)
@@ -0,0 +1,122 @@
+"""
+Bounded asyncio fan-out for blocking per-item work.
+
+Klusterlet verification talks to every spoke cluster. With thousands of spokes
+a fixed ten-thread pool leaves most requests queued behind a few slow or dead
+clusters. ``run_bounded`` drives the work from an asyncio event loop instead:
+a semaphore caps how many items are in flight, each item gets its own timeout
+after which its fallback result is used, and a progress counter is logged as
+items complete.
+
+The Kubernetes Python client is synchronous, so each item runs on a worker
+thread sized to the concurrency level and is awaited from the loop. A thread
+cannot be interrupted, so a timed-out item keeps its slot until ``func``
+returns: ``func`` must bound its own requests (``_request_timeout``) or enough
+hung items will still stall the batch and delay interpreter exit.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("acm_switchover")
+
+# Log progress roughly every tenth of the batch, but not more often than this
+PROGRESS_LOG_INTERVAL = 5.0
+
+
+class _Progress:
+    """Completion counter that logs periodically."""
+
+    def __init__(self, total: int, label: str) -> None:
+        self.total = total
+        self.label = label
+        self.done = 0
+        self._step = max(1, total // 10)
+        self._last_log = time.monotonic()
+
+    def advance(self) -> None:
+        self.done += 1
+        now = time.monotonic()
+        if self.done == self.total or (self.done % self._step == 0 and now - self._last_log >= PROGRESS_LOG_INTERVAL):
+            self._last_log = now
+            logger.info("%s: %d/%d complete", self.label, self.done, self.total)
+
+
+def run_bounded(
+    func: Callable[..., Any],
+    items: Sequence[Tuple],
+    concurrency: int,
+    timeout: Optional[float] = None,
+    on_timeout: Optional[Callable[..., Any]] = None,
+    label: str = "Progress",
+) -> List[Any]:
+    """Run ``func(*item)`` for every item with bounded concurrency.
+
+    Args:
+        func: Blocking callable invoked once per item with the item's fields
+        items: Argument tuples, one per call
+        concurrency: Maximum number of items in flight
+        timeout: Per-item timeout in seconds (None waits indefinitely), counted
+                 from when the item gets a slot, not from when it was queued
+        on_timeout: Called with the item's fields to produce a result when the
+                    item times out; if None, the TimeoutError is re-raised
+        label: Prefix for progress log messages
+
+    Returns:
+        Results in the same order as ``items``
+
+    Note:
+        A timed-out call keeps running on its worker thread until the
+        underlying request returns, and its slot is only handed to the next
+        item once that thread is free, so at most ``concurrency`` threads are
+        ever busy. The timeout only bounds how long the result is waited for;
+        ``func`` must time out its own requests to free the slot.
+    """
+    if not items:
+        return []
+    concurrency = max(1, min(int(concurrency), len(items)))
+    return asyncio.run(_run_bounded(func, list(items), concurrency, timeout, on_timeout, label))
+
+
+async def _run_bounded(
+    func: Callable[..., Any],
+    items: List[Tuple],
+    concurrency: int,
+    timeout: Optional[float],
+    on_timeout: Optional[Callable[..., Any]],
+    label: str,
+) -> List[Any]:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    progress = _Progress(len(items), label)
+
+    def release_slot(_future) -> None:
+        # Runs on the worker thread; the loop may already be gone after a timeout
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            pass
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def run_one(item: Tuple) -> Any:
+        await semaphore.acquire()
+        future = executor.submit(func, *item)
+        future.add_done_callback(release_slot)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            if on_timeout is None:
+                raise
+            return on_timeout(*item)
+        finally:
+            progress.advance()
+
+    try:
+        return await asyncio.gather(*(run_one(item) for item in items))
+    finally:
+        # Don't block on calls that outlived their timeout
+        executor.shutdown(wait=False, cancel_futures=True)
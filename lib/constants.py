@@ -29,7 +29,11 @@
 
 # ManagedCluster deletion wait (for finalizers to complete before MCH deletion)
 MANAGED_CLUSTER_DELETE_TIMEOUT = 300
-MANAGED_CLUSTER_DELETE_INTERVAL = 10
+MANAGED_CLUSTER_DELETE_INTERVAL = 10  # seconds between removal progress reports / watch resyncs
+# Concurrent ManagedCluster deletion (Decommission._delete_managed_clusters)
+MANAGED_CLUSTER_DELETE_MAX_WORKERS = 10
+MANAGED_CLUSTER_DELETE_QPS = 20.0  # sustained DELETE requests per second
+MANAGED_CLUSTER_DELETE_BURST = 40  # DELETE requests allowed before QPS limiting applies
 
 # ACM operator pod prefix (these pods remain after MCH deletion)
 ACM_OPERATOR_POD_PREFIX = "multiclusterhub-operator"
@@ -47,6 +51,48 @@
 # Parallel cluster verification settings
 CLUSTER_VERIFY_MAX_WORKERS = 10
 
+# Klusterlet verification fan-out across spoke clusters (lib/async_runner.run_bounded)
+KLUSTERLET_VERIFY_CONCURRENCY = 100  # spoke checks in flight (--klusterlet-concurrency)
+KLUSTERLET_CHECK_TIMEOUT = 30  # seconds per spoke before it is reported unreachable
+
+# RBAC validation fan-out (lib/rbac_validator.prefetch_permissions); each review also takes a
+# token from its context's shared API rate limiter
+RBAC_CHECK_MAX_WORKERS = 16
+# Managed cluster fleet validation (check_rbac.py --contexts / --context-pattern, lib/async_runner.run_bounded)
+RBAC_FLEET_CONCURRENCY = 50  # spoke contexts validated in flight (--concurrency)
+RBAC_FLEET_CHECK_TIMEOUT = 60  # seconds per spoke context before it is reported as timed out
+
+# Client-side API rate limiting, shared per kubeconfig context (client-go style)
+API_CLIENT_QPS = 50.0  # sustained requests per second
+API_CLIENT_BURST = 100  # requests allowed before QPS limiting applies
+# Upper bound on a server-requested Retry-After delay (429 / API Priority and Fairness)
+RETRY_AFTER_MAX_SECONDS = 60
+
+# Bulk ManagedCluster patching (KubeClient.bulk_patch_managed_clusters)
+MANAGED_CLUSTER_PATCH_MAX_WORKERS = 10  # rate limited by the context limiter (API_CLIENT_QPS/_BURST)
+
+# Page size for streaming list calls (KubeClient.iter_custom_resources)
+LIST_PAGE_SIZE = 500
+
+# Read size for streamed pod logs (KubeClient.iter_pod_log_lines)
+POD_LOG_CHUNK_SIZE = 64 * 1024
+
+# On-disk pre-flight list cache, created next to the state file (lib/list_cache.py)
+PREFLIGHT_CACHE_DIRNAME = "preflight-cache"
+
+# Cross-run RBAC verdict cache, created next to the state file (lib/rbac_cache.py)
+RBAC_CACHE_DIRNAME = "rbac-cache"
+RBAC_CACHE_TTL = 900  # seconds a granted permission is reused without re-checking
+
+# Independent pre-flight validators run concurrently (modules/preflight/scheduler.py)
+PREFLIGHT_MAX_WORKERS = 8
+
+# ManagedCluster informer cache (opt-in list+watch)
+INFORMER_SYNC_TIMEOUT = 60  # seconds to wait for the initial list
+INFORMER_WATCH_TIMEOUT = 300  # server-side watch timeout before resuming
+INFORMER_RETRY_INTERVAL = 5  # seconds between watch reconnect attempts
+INFORMER_MAX_WATCH_FAILURES = 3  # consecutive watch failures before reads bypass the (stale) cache
+
 # Maximum kubeconfig file size (10MB default) to prevent memory exhaustion
 # Can be overridden via ACM_KUBECONFIG_MAX_SIZE environment variable (bytes)
 # Set to 0 or negative to disable size checking
@@ -61,6 +107,17 @@
     # Invalid value in environment variable, use default
     MAX_KUBECONFIG_SIZE = DEFAULT_KUBECONFIG_SIZE
 
+# On-disk kubeconfig context index (lib/kubeconfig_store.py)
+# Defaults to $XDG_CACHE_HOME/acm-switchover/kubeconfig-index.json (~/.cache if unset)
+# Override the path via ACM_KUBECONFIG_INDEX; set it to an empty value to disable
+KUBECONFIG_INDEX_ENV_VAR = "ACM_KUBECONFIG_INDEX"
+KUBECONFIG_INDEX_FILENAME = "kubeconfig-index.json"
+KUBECONFIG_INDEX_MAX_FILES = 32  # kubeconfig files remembered in the index
+
+# State directory (state files and the caches kept next to them)
+STATE_DIR_ENV_VAR = "ACM_SWITCHOVER_STATE_DIR"
+DEFAULT_STATE_DIR = ".state"
+
 # Namespaces
 BACKUP_NAMESPACE = "open-cluster-management-backup"
 OBSERVABILITY_NAMESPACE = "open-cluster-management-observability"
@@ -137,10 +194,28 @@
     )
     STALE_STATE_THRESHOLD = DEFAULT_STALE_STATE_THRESHOLD_HOURS * 3600
 
+# State journal mode (StateManager(journal=True) / --state-journal)
+STATE_JOURNAL_SUFFIX = ".journal"  # JSON-lines journal kept next to the state file
+STATE_JOURNAL_COMPACT_RECORDS = 200  # journal records before folding them into the snapshot
+
+# Background state writer (StateManager(flush_interval=...) / --state-flush-interval)
+STATE_FLUSH_INTERVAL = 0.0  # seconds of updates coalesced per write; 0 writes synchronously
+STATE_WRITER_STOP_TIMEOUT = 10  # seconds to wait for an in-flight background write on close
+
+# Per-item progress of bulk steps (StateManager.step_progress), persisted in batches
+STEP_PROGRESS_FLUSH_ITEMS = 100
+
+# ACM backup schedule type label on Velero Backups (used as a server-side label selector)
+BACKUP_SCHEDULE_TYPE_LABEL = "cluster.open-cluster-management.io/backup-schedule-type"
+BACKUP_SCHEDULE_TYPE_MANAGED_CLUSTERS = "managedClusters"
+
 # Backup verification settings
 BACKUP_VERIFY_TIMEOUT = 600
 BACKUP_POLL_INTERVAL = 30
+BACKUP_WATCH_TIMEOUT = 300  # server-side timeout of the new-backup watch before resuming
 BACKUP_INTEGRITY_MAX_AGE_SECONDS = 600
+VELERO_LOG_LOOKBACK_MARGIN = 60  # seconds of Velero logs read before a backup's start (clock skew)
+VELERO_LOG_TAIL_LINES = 2000  # fallback window when the backup start time is unknown
 
 # MultiClusterHub verification settings
 MCH_VERIFY_TIMEOUT = 300
@@ -0,0 +1,405 @@
+"""
+Watch-backed informer cache for cluster-scoped custom resources.
+
+The informer performs a single LIST to seed an in-memory store, then keeps it
+current with a WATCH resumed from the list's resourceVersion (with bookmarks
+enabled so idle watches can resume without a relist). Reads are served from
+the store, indexed by name and by label key/value, which avoids re-listing
+large fleets (e.g., thousands of ManagedClusters) on every poll.
+
+If the watch expires (410 Gone) the informer transparently relists. After
+INFORMER_MAX_WATCH_FAILURES consecutive watch failures the store is marked
+unsynced, so reads go back to the API server instead of serving a snapshot that
+no longer changes; it is marked synced again once a watch succeeds. A 401/403
+(e.g. no ``watch`` permission) disables the informer for good.
+"""
+
+import copy
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from lib.constants import (
+    INFORMER_MAX_WATCH_FAILURES,
+    INFORMER_RETRY_INTERVAL,
+    INFORMER_SYNC_TIMEOUT,
+    INFORMER_WATCH_TIMEOUT,
+)
+
+logger = logging.getLogger("acm_switchover")
+
+HTTP_GONE = 410
+# Errors retrying cannot fix (missing credentials or list/watch permission)
+HTTP_FATAL_STATUSES = (401, 403)
+
+# Parsed equality-based selector term: (key, operator, value)
+SelectorTerm = Tuple[str, str, Optional[str]]
+
+
+def parse_label_selector(label_selector: Optional[str]) -> Optional[List[SelectorTerm]]:
+    """Parse an equality-based label selector.
+
+    Supports ``key=value``, ``key==value``, ``key!=value``, ``key`` and ``!key``
+    terms separated by commas. Set-based selectors (``in``/``notin``) are not
+    supported and return None so callers can fall back to the API server.
+
+    Args:
+        label_selector: Selector string (None or empty matches everything)
+
+    Returns:
+        List of (key, operator, value) terms, or None if unsupported
+    """
+    if not label_selector or not label_selector.strip():
+        return []
+
+    terms: List[SelectorTerm] = []
+    for raw in label_selector.split(","):
+        term = raw.strip()
+        if not term or "(" in term or " in " in term or " notin " in term:
+            return None
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            terms.append((key.strip(), "!=", value.strip()))
+        elif "==" in term:
+            key, value = term.split("==", 1)
+            terms.append((key.strip(), "=", value.strip()))
+        elif "=" in term:
+            key, value = term.split("=", 1)
+            terms.append((key.strip(), "=", value.strip()))
+        elif term.startswith("!"):
+            terms.append((term[1:].strip(), "!", None))
+        else:
+            terms.append((term, "exists", None))
+    return terms
+
+
+class ResourceInformer:
+    """List+watch cache for a cluster-scoped custom resource type.
+
+    Thread-safe: the watch runs on a daemon thread while callers read from the
+    store under a lock. Returned objects are deep copies so callers can mutate
+    them freely.
+    """
+
+    def __init__(
+        self,
+        custom_api: Any,
+        group: str,
+        version: str,
+        plural: str,
+        watch_timeout: int = INFORMER_WATCH_TIMEOUT,
+        retry_interval: float = INFORMER_RETRY_INTERVAL,
+        max_watch_failures: int = INFORMER_MAX_WATCH_FAILURES,
+    ) -> None:
+        """
+        Initialize informer.
+
+        Args:
+            custom_api: CustomObjectsApi instance used for list/watch
+            group: API group (e.g., 'cluster.open-cluster-management.io')
+            version: API version (e.g., 'v1')
+            plural: Resource plural (e.g., 'managedclusters')
+            watch_timeout: Server-side watch timeout before the watch is resumed
+            retry_interval: Delay before reconnecting after watch errors
+            max_watch_failures: Consecutive watch failures before reads bypass the cache
+        """
+        self.custom_api = custom_api
+        self.group = group
+        self.version = version
+        self.plural = plural
+        self.watch_timeout = watch_timeout
+        self.retry_interval = retry_interval
+        self.max_watch_failures = max(1, max_watch_failures)
+
+        self._lock = threading.RLock()
+        self._items: Dict[str, Dict] = {}
+        self._label_index: Dict[Tuple[str, str], Set[str]] = {}
+        self._resource_version: Optional[str] = None
+        self._synced = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+        self._watch_failures = 0
+        self._disabled = False
+
+    @property
+    def resource_version(self) -> Optional[str]:
+        """Last resourceVersion observed from a list, event, or bookmark."""
+        with self._lock:
+            return self._resource_version
+
+    def has_synced(self) -> bool:
+        """Return True while the store is populated and kept current by the watch."""
+        return self._synced.is_set()
+
+    @property
+    def disabled(self) -> bool:
+        """True after a 401/403 stopped the informer."""
+        return self._disabled
+
+    def is_running(self) -> bool:
+        """Return True while the watch thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+    def start(self, sync_timeout: float = INFORMER_SYNC_TIMEOUT) -> bool:
+        """Start the list+watch loop and wait for the initial sync.
+
+        Args:
+            sync_timeout: Seconds to wait for the initial list to complete
+
+        Returns:
+            True if the store synced within sync_timeout
+        """
+        if self.is_running():
+            return self.has_synced()
+
+        if self._disabled:
+            return False
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"informer-{self.plural}",
+            daemon=True,
+        )
+        self._thread.start()
+
+        # Wait for the initial sync, but return early if a fatal error ended the loop
+        deadline = time.monotonic() + sync_timeout
+        synced = self._synced.is_set()
+        while not synced and self._thread.is_alive():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            synced = self._synced.wait(timeout=min(0.1, remaining))
+        if not synced and not self._disabled:
+            logger.warning("Informer for %s did not sync within %ss", self.plural, sync_timeout)
+        return synced
+
+    def stop(self, join_timeout: float = 5.0) -> None:
+        """Stop the watch loop and wait for the thread to exit."""
+        self._stop_event.set()
+        current_watch = self._watch
+        if current_watch is not None:
+            current_watch.stop()
+        if self._thread is not None:
+            self._thread.join(timeout=join_timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Main loop: relist when needed, then watch until stopped."""
+        while not self._stop_event.is_set():
+            try:
+                if self.resource_version is None:
+                    self.relist()
+                self._watch_once()
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    logger.debug("Informer watch for %s expired (410 Gone); relisting", self.plural)
+                    with self._lock:
+                        self._resource_version = None
+                    continue
+                if e.status in HTTP_FATAL_STATUSES:
+                    self._disable(e)
+                    return
+                self._watch_failed(e)
+            except Exception as e:
+                self._watch_failed(e)
+
+    def _watch_failed(self, error: Exception) -> None:
+        """Count a failed list/watch; past the limit, stop serving the stale store."""
+        self._watch_failures += 1
+        logger.warning("Informer watch for %s failed (%d consecutive): %s", self.plural, self._watch_failures, error)
+        if self._watch_failures >= self.max_watch_failures and self._synced.is_set():
+            self._synced.clear()
+            logger.warning(
+                "Informer cache for %s is stale after %d failed watch(es); reading from the API server "
+                "until the watch recovers",
+                self.plural,
+                self._watch_failures,
+            )
+        self._stop_event.wait(self.retry_interval)
+
+    def _watch_healthy(self) -> None:
+        """Reset the failure count after a watch delivered events or ended normally."""
+        if self._watch_failures == 0:
+            return
+        self._watch_failures = 0
+        if not self._synced.is_set() and self.resource_version is not None:
+            self._synced.set()
+            logger.info("Informer watch for %s recovered; serving reads from the cache again", self.plural)
+
+    def _disable(self, error: ApiException) -> None:
+        """Stop the informer permanently (401/403); reads go to the API server."""
+        self._disabled = True
+        self._synced.clear()
+        self._stop_event.set()
+        logger.warning(
+            "Informer for %s disabled (%s %s; list and watch permissions are required); "
+            "reading from the API server instead",
+            self.plural,
+            error.status,
+            error.reason,
+        )
+
+    def relist(self) -> None:
+        """Replace the store with a fresh LIST and record its resourceVersion."""
+        items: List[Dict] = []
+        continue_token: Optional[str] = None
+        resource_version: Optional[str] = None
+
+        while True:
+            result = self.custom_api.list_cluster_custom_object(
+                group=self.group,
+                version=self.version,
+                plural=self.plural,
+                _continue=continue_token,
+            )
+            items.extend(result.get("items", []))
+            metadata = result.get("metadata") or {}
+            resource_version = metadata.get("resourceVersion") or resource_version
+            continue_token = metadata.get("continue")
+            if not continue_token:
+                break
+
+        with self._lock:
+            self._items = {}
+            self._label_index = {}
+            for item in items:
+                self._upsert_locked(item)
+            self._resource_version = resource_version
+        # While the watch keeps failing, a fresh list alone does not make the store current
+        if self._watch_failures < self.max_watch_failures:
+            self._synced.set()
+        logger.debug(
+            "Informer for %s synced %d item(s) at resourceVersion %s", self.plural, len(items), resource_version
+        )
+
+    def _watch_once(self) -> None:
+        """Run a single watch request until it times out or is stopped."""
+        self._watch = watch.Watch()
+        try:
+            for event in self._watch.stream(
+                self.custom_api.list_cluster_custom_object,
+                group=self.group,
+                version=self.version,
+                plural=self.plural,
+                resource_version=self.resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=self.watch_timeout,
+            ):
+                if event.get("type") != "ERROR":
+                    self._watch_healthy()
+                self.handle_event(event)
+                if self._stop_event.is_set():
+                    break
+            else:
+                # Server-side timeout: the watch worked, it is resumed from the last resourceVersion
+                self._watch_healthy()
+        finally:
+            self._watch.stop()
+            self._watch = None
+
+    # -----------------------------
+    # Store maintenance
+    # -----------------------------
+    def handle_event(self, event: Dict[str, Any]) -> None:
+        """Apply a single watch event to the store."""
+        event_type = event.get("type")
+        obj = event.get("raw_object") or event.get("object") or {}
+        if not isinstance(obj, dict):
+            return
+
+        resource_version = (obj.get("metadata") or {}).get("resourceVersion")
+        with self._lock:
+            if event_type in ("ADDED", "MODIFIED"):
+                self._upsert_locked(obj)
+            elif event_type == "DELETED":
+                self._remove_locked((obj.get("metadata") or {}).get("name"))
+            elif event_type != "BOOKMARK":
+                return
+            if resource_version:
+                self._resource_version = resource_version
+
+    def upsert(self, obj: Dict) -> None:
+        """Write-through an object returned by a mutating call (e.g., patch)."""
+        if not obj or not (obj.get("metadata") or {}).get("name"):
+            return
+        with self._lock:
+            self._upsert_locked(obj)
+
+    def _upsert_locked(self, obj: Dict) -> None:
+        name = (obj.get("metadata") or {}).get("name")
+        if not name:
+            return
+        self._remove_locked(name)
+        self._items[name] = obj
+        for key, value in ((obj.get("metadata") or {}).get("labels") or {}).items():
+            self._label_index.setdefault((key, value), set()).add(name)
+
+    def _remove_locked(self, name: Optional[str]) -> None:
+        if not name:
+            return
+        existing = self._items.pop(name, None)
+        if existing is None:
+            return
+        for key, value in ((existing.get("metadata") or {}).get("labels") or {}).items():
+            names = self._label_index.get((key, value))
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._label_index[(key, value)]
+
+    # -----------------------------
+    # Reads
+    # -----------------------------
+    def get(self, name: str) -> Optional[Dict]:
+        """Return a copy of the cached object by name, or None."""
+        with self._lock:
+            obj = self._items.get(name)
+            return copy.deepcopy(obj) if obj is not None else None
+
+    def list(self, label_selector: Optional[str] = None) -> Optional[List[Dict]]:
+        """Return copies of cached objects matching an equality-based selector.
+
+        Returns:
+            Matching objects sorted by name, or None if the selector is not
+            supported by the cache (callers should query the API server)
+        """
+        terms = parse_label_selector(label_selector)
+        if terms is None:
+            return None
+
+        with self._lock:
+            candidates: Optional[Set[str]] = None
+            for key, op, value in terms:
+                if op == "=":
+                    matched = self._label_index.get((key, value or ""), set())
+                    candidates = set(matched) if candidates is None else candidates & matched
+            names = candidates if candidates is not None else set(self._items)
+
+            results = []
+            for name in sorted(names):
+                obj = self._items[name]
+                labels = (obj.get("metadata") or {}).get("labels") or {}
+                if all(self._term_matches(labels, term) for term in terms):
+                    results.append(copy.deepcopy(obj))
+            return results
+
+    @staticmethod
+    def _term_matches(labels: Dict[str, str], term: SelectorTerm) -> bool:
+        key, op, value = term
+        if op == "=":
+            return labels.get(key) == value
+        if op == "!=":
+            return labels.get(key) != value
+        if op == "!":
+            return key not in labels
+        return key in labels
@@ -0,0 +1,450 @@
+"""
+Process-wide, indexed kubeconfig store.
+
+Merged kubeconfigs for large fleets hold thousands of contexts and are many
+megabytes of YAML. KubeClient, pre-flight kubeconfig checks and klusterlet
+verification all need to resolve contexts, and previously each of them parsed
+the files again. ``KubeconfigStore`` parses the KUBECONFIG files once, reuses
+the result until a file's mtime or size changes, and exposes O(1) lookups by
+context, cluster and user name and by normalized API server host.
+
+Files are merged the way kubectl merges them: for duplicate names the first
+file wins, and ``current-context`` comes from the first file that sets it.
+Relative certificate, key and token file paths are resolved against the
+directory of the file that declared them, so the merged data can be handed to
+``config.load_kube_config_from_dict``.
+
+Resolving a context (its API server, user and namespace, or the context that
+serves a ManagedCluster's API URL) does not need credentials, so
+``KubeconfigStore.lookup`` answers it from an on-disk index instead: a JSON
+sidecar holding, per kubeconfig file and keyed on path + mtime + size, only
+the context, cluster server and user names. Warm runs resolve contexts without
+parsing any YAML; files that changed are re-parsed (with libyaml's
+``CSafeLoader`` when available) and their entries rewritten. Credentials are
+never written to the index, so configuring a client still goes through
+``load()``.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import yaml
+
+from lib.constants import (
+    DEFAULT_KUBECONFIG_SIZE,
+    KUBECONFIG_INDEX_ENV_VAR,
+    KUBECONFIG_INDEX_FILENAME,
+    KUBECONFIG_INDEX_MAX_FILES,
+    MAX_KUBECONFIG_SIZE,
+)
+
+logger = logging.getLogger("acm_switchover")
+
+INDEX_FORMAT_VERSION = 1
+
+# libyaml-backed loader is several times faster on multi-megabyte kubeconfigs
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Kubeconfig fields holding file paths that kubectl resolves relative to the file
+_CLUSTER_PATH_FIELDS = ("certificate-authority",)
+_USER_PATH_FIELDS = ("client-certificate", "client-key", "tokenFile")
+
+
+def kubeconfig_paths() -> List[str]:
+    """Return the kubeconfig files in effect (KUBECONFIG, else ~/.kube/config)."""
+    kubeconfig_env = os.environ.get("KUBECONFIG", "")
+    if kubeconfig_env:
+        # Split on colon (Unix path separator for KUBECONFIG)
+        paths = [p.strip() for p in kubeconfig_env.split(":") if p.strip()]
+    else:
+        paths = ["~/.kube/config"]
+    return [os.path.expanduser(p) for p in paths]
+
+
+def default_index_path() -> Optional[str]:
+    """Return the on-disk index location, or None if disabled via ACM_KUBECONFIG_INDEX."""
+    override = os.environ.get(KUBECONFIG_INDEX_ENV_VAR)
+    if override is not None:
+        return os.path.expanduser(override.strip()) or None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "acm-switchover", KUBECONFIG_INDEX_FILENAME)
+
+
+def normalize_server_host(url: str) -> str:
+    """Reduce an API server URL to its lower-cased host name."""
+    if not url:
+        return ""
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    return (parsed.hostname or "").lower()
+
+
+class KubeconfigIndex:
+    """Merged kubeconfig data with name and API server host indexes.
+
+    ``credentials`` is False for indexes built from the on-disk summary: those
+    carry context, cluster server and user names only, so ``user_for_context``
+    returns empty sections and ``data`` cannot configure a client.
+    """
+
+    def __init__(self, data: Dict[str, Any], credentials: bool = True) -> None:
+        self.data = data
+        self.credentials = credentials
+        self.contexts: Dict[str, Dict[str, Any]] = {}
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self._contexts_by_cluster: Dict[str, List[str]] = {}
+        self._clusters_by_host: Dict[str, List[str]] = {}
+
+        for entry in data.get("clusters", []):
+            name = entry.get("name")
+            if name and name not in self.clusters:
+                self.clusters[name] = entry.get("cluster") or {}
+                host = normalize_server_host(self.clusters[name].get("server", ""))
+                if host:
+                    self._clusters_by_host.setdefault(host, []).append(name)
+        for entry in data.get("users", []):
+            name = entry.get("name")
+            if name and name not in self.users:
+                self.users[name] = entry.get("user") or {}
+        for entry in data.get("contexts", []):
+            name = entry.get("name")
+            if name and name not in self.contexts:
+                self.contexts[name] = entry.get("context") or {}
+                cluster = self.contexts[name].get("cluster")
+                if cluster:
+                    self._contexts_by_cluster.setdefault(cluster, []).append(name)
+
+    def __len__(self) -> int:
+        return len(self.contexts)
+
+    @property
+    def current_context(self) -> Optional[str]:
+        return self.data.get("current-context") or None
+
+    def _resolve(self, context_name: Optional[str]) -> Optional[str]:
+        return context_name or self.current_context
+
+    def has_context(self, context_name: Optional[str]) -> bool:
+        """Return True if the context (or the current context for None) is defined."""
+        name = self._resolve(context_name)
+        return name is not None and name in self.contexts
+
+    def cluster_for_context(self, context_name: Optional[str]) -> Dict[str, Any]:
+        """Return the ``cluster`` section used by a context ({} if unknown)."""
+        context = self.contexts.get(self._resolve(context_name) or "", {})
+        return self.clusters.get(context.get("cluster", ""), {})
+
+    def user_for_context(self, context_name: Optional[str]) -> Dict[str, Any]:
+        """Return the ``user`` section used by a context ({} if unknown)."""
+        context = self.contexts.get(self._resolve(context_name) or "", {})
+        return self.users.get(context.get("user", ""), {})
+
+    def server_for_context(self, context_name: Optional[str]) -> str:
+        """Return the API server URL of a context ("" if unknown)."""
+        return self.cluster_for_context(context_name).get("server", "")
+
+    def contexts_for_user(self, user_name: str) -> List[str]:
+        """Return the names of contexts that use a user entry."""
+        return [name for name, ctx in self.contexts.items() if ctx.get("user") == user_name]
+
+    def find_context_by_server(self, url: str) -> str:
+        """Return the first context whose cluster serves the URL's host ("" if none)."""
+        for cluster_name in self._clusters_by_host.get(normalize_server_host(url), []):
+            contexts = self._contexts_by_cluster.get(cluster_name)
+            if contexts:
+                return contexts[0]
+        return ""
+
+
+class KubeconfigStore:
+    """Parses the kubeconfig files once and re-parses only when they change."""
+
+    def __init__(self, index_path: Optional[str] = None, use_index: bool = True) -> None:
+        """
+        Args:
+            index_path: On-disk index file (default: default_index_path())
+            use_index: Set False to never read or write the on-disk index
+        """
+        self._index_path = index_path
+        self._use_index = use_index
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        # Parsed data per file, and files selected per effective size limit (None = unlimited)
+        self._parsed: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._selected: Dict[Optional[int], List[Tuple[str, int, int]]] = {}
+        # Full and summary-only indexes per effective size limit
+        self._indexes: Dict[Optional[int], KubeconfigIndex] = {}
+        self._lookups: Dict[Optional[int], KubeconfigIndex] = {}
+
+    @property
+    def index_path(self) -> Optional[str]:
+        if not self._use_index:
+            return None
+        return self._index_path if self._index_path is not None else default_index_path()
+
+    @staticmethod
+    def _signature_of(paths: List[str]) -> Tuple:
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        return tuple(signature)
+
+    @staticmethod
+    def _size_limit(max_size: Optional[int]) -> Optional[int]:
+        """Resolve max_size (None = MAX_KUBECONFIG_SIZE, <= 0 = unlimited)."""
+        if max_size is None:
+            return MAX_KUBECONFIG_SIZE if MAX_KUBECONFIG_SIZE > 0 else None
+        return max_size if max_size > 0 else None
+
+    def _reset_if_changed(self, signature: Optional[Tuple], force_reload: bool = False) -> None:
+        if signature != self._signature or force_reload:
+            self._signature = signature
+            self._parsed = {}
+            self._selected = {}
+            self._indexes = {}
+            self._lookups = {}
+
+    def load(self, max_size: Optional[int] = None, force_reload: bool = False) -> KubeconfigIndex:
+        """Return the index for the current KUBECONFIG files.
+
+        Args:
+            max_size: Maximum file size in bytes. If None, uses MAX_KUBECONFIG_SIZE.
+                     If 0 or negative, bypasses the size check (for critical operations).
+            force_reload: Re-parse even if no file changed
+
+        Returns:
+            KubeconfigIndex (empty if no kubeconfig could be read)
+        """
+        paths = kubeconfig_paths()
+        signature = self._signature_of(paths)
+        limit = self._size_limit(max_size)
+        with self._lock:
+            self._reset_if_changed(signature, force_reload)
+            index = self._indexes.get(limit)
+            if index is None:
+                selected = self._select(limit)
+                index = KubeconfigIndex(_merge([self._parse_file(path) for path, _, _ in selected]))
+                self._indexes[limit] = index
+                logger.debug("Indexed %d kubeconfig context(s) from %d file(s)", len(index), len(paths))
+                # Files were parsed anyway; keep the on-disk index current for later runs
+                self._summaries(selected)
+            return index
+
+    def lookup(self, max_size: Optional[int] = None) -> KubeconfigIndex:
+        """Return an index for resolving contexts, served from the on-disk index when current.
+
+        The result has ``credentials=False`` unless full data was already loaded
+        in this process. Use load() for anything that configures a client.
+
+        Args:
+            max_size: As for load()
+        """
+        paths = kubeconfig_paths()
+        signature = self._signature_of(paths)
+        limit = self._size_limit(max_size)
+        with self._lock:
+            self._reset_if_changed(signature)
+            index = self._indexes.get(limit) or self._lookups.get(limit)
+            if index is None:
+                index = KubeconfigIndex(_merge(self._summaries(self._select(limit))), credentials=False)
+                self._lookups[limit] = index
+                logger.debug("Resolved %d kubeconfig context(s) from %d file(s)", len(index), len(paths))
+            return index
+
+    def invalidate(self) -> None:
+        """Drop parsed data; the next load() re-reads the files."""
+        with self._lock:
+            self._reset_if_changed(None, force_reload=True)
+
+    def _select(self, size_limit: Optional[int]) -> List[Tuple[str, int, int]]:
+        """Return (path, mtime_ns, size) of the readable files within the size limit."""
+        selected = self._selected.get(size_limit)
+        if selected is not None:
+            return selected
+
+        selected = []
+        for path, mtime_ns, kubeconfig_size in self._signature or ():
+            if mtime_ns is None:
+                logger.debug("Kubeconfig path does not exist: %s", os.path.basename(path))
+                continue
+            # Check file size before loading to prevent memory exhaustion
+            if size_limit is not None and kubeconfig_size > size_limit:
+                logger.warning(
+                    "Kubeconfig file too large: %s (%d bytes, max %d bytes). Skipping.",
+                    os.path.basename(path),
+                    kubeconfig_size,
+                    size_limit,
+                )
+                continue
+            # Size check bypassed - only warn when the file exceeds the default limit
+            if size_limit is None and MAX_KUBECONFIG_SIZE > 0 and kubeconfig_size > DEFAULT_KUBECONFIG_SIZE:
+                logger.warning(
+                    "Kubeconfig file large: %s (%d bytes, exceeds default limit %d bytes). "
+                    "Loading anyway for critical operation.",
+                    os.path.basename(path),
+                    kubeconfig_size,
+                    DEFAULT_KUBECONFIG_SIZE,
+                )
+            selected.append((path, mtime_ns, kubeconfig_size))
+        self._selected[size_limit] = selected
+        return selected
+
+    def _parse_file(self, path: str) -> Optional[Dict[str, Any]]:
+        if path not in self._parsed:
+            self._parsed[path] = _read_kubeconfig(path)
+        return self._parsed[path]
+
+    def _summaries(self, selected: List[Tuple[str, int, int]]) -> List[Dict[str, Any]]:
+        """Return per-file summaries, parsing only files whose index entry is stale."""
+        index_path = self.index_path
+        entries = _read_index(index_path) if index_path else {}
+        summaries = []
+        stale = False
+        for path, mtime_ns, size in selected:
+            key = os.path.abspath(path)
+            entry = entries.get(key)
+            if not entry or entry.get("mtime_ns") != mtime_ns or entry.get("size") != size:
+                entry = {"mtime_ns": mtime_ns, "size": size, "summary": _summarize(self._parse_file(path))}
+                stale = True
+            # Re-insert so files in use are the last to be pruned
+            entries.pop(key, None)
+            entries[key] = entry
+            summaries.append(entry["summary"])
+        if stale and index_path:
+            _write_index(index_path, entries)
+        return summaries
+
+
+def _read_kubeconfig(path: str) -> Optional[Dict[str, Any]]:
+    """Parse one kubeconfig file, resolving relative file references; None if unreadable."""
+    try:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}  # nosec B506 - safe loader
+    except (OSError, yaml.YAMLError) as e:
+        logger.debug("Error loading kubeconfig %s: %s", os.path.basename(path), e)
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for entry in data.get("clusters") or []:
+        _absolutize(entry.get("cluster"), _CLUSTER_PATH_FIELDS, base_dir)
+    for entry in data.get("users") or []:
+        _absolutize(entry.get("user"), _USER_PATH_FIELDS, base_dir)
+    return data
+
+
+def _merge(parts: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Merge parsed kubeconfig files in KUBECONFIG order."""
+    merged: Dict[str, Any] = {"contexts": [], "clusters": [], "users": []}
+    for data in parts:
+        if not data:
+            continue
+        merged["contexts"].extend(data.get("contexts") or [])
+        merged["clusters"].extend(data.get("clusters") or [])
+        merged["users"].extend(data.get("users") or [])
+        if "current-context" not in merged and data.get("current-context"):
+            merged["current-context"] = data["current-context"]
+    return merged
+
+
+def _summarize(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduce parsed kubeconfig data to names and servers (no credentials)."""
+    if not data:
+        return {}
+
+    def named(entries: Any, section: str, fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        result = []
+        for entry in entries or []:
+            if isinstance(entry, dict) and entry.get("name"):
+                body = entry.get(section) or {}
+                result.append({"name": entry["name"], section: {f: body[f] for f in fields if f in body}})
+        return result
+
+    summary: Dict[str, Any] = {
+        "contexts": named(data.get("contexts"), "context", ("cluster", "user", "namespace")),
+        "clusters": named(data.get("clusters"), "cluster", ("server",)),
+        "users": named(data.get("users"), "user", ()),
+    }
+    if data.get("current-context"):
+        summary["current-context"] = data["current-context"]
+    return summary
+
+
+def _read_index(index_path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable kubeconfig index %s: %s", index_path, e)
+        return {}
+    if not isinstance(index, dict) or index.get("format") != INDEX_FORMAT_VERSION:
+        return {}
+    files = index.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _write_index(index_path: str, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically rewrite the on-disk index, dropping files that no longer exist.
+
+    Failures are logged and otherwise ignored; the index is an optimization.
+    """
+    live = [(path, entry) for path, entry in entries.items() if os.path.exists(path)]
+    index = {"format": INDEX_FORMAT_VERSION, "files": dict(live[-KUBECONFIG_INDEX_MAX_FILES:])}
+    directory = os.path.dirname(index_path) or "."
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write kubeconfig index %s: %s", index_path, e)
+
+
+def _absolutize(section: Optional[Dict[str, Any]], fields: Tuple[str, ...], base_dir: str) -> None:
+    if not isinstance(section, dict):
+        return
+    for field in fields:
+        value = section.get(field)
+        if isinstance(value, str) and value and not os.path.isabs(value):
+            section[field] = os.path.join(base_dir, os.path.expanduser(value))
+
+
+_store = KubeconfigStore()
+
+
+def get_kubeconfig_store() -> KubeconfigStore:
+    """Return the process-wide kubeconfig store."""
+    return _store
+
+
+def resolve_context_server(context: Optional[str]) -> str:
+    """Return the API server URL of a context, resolved from the on-disk index.
+
+    Lets the CLIs report a context's server and reject unknown contexts before
+    any kubeconfig YAML is parsed. No size limit, matching KubeClient.
+
+    Raises:
+        ValueError: If the kubeconfig files define contexts, but not this one
+    """
+    index = get_kubeconfig_store().lookup(max_size=0)
+    if len(index) and not index.has_context(context):
+        raise ValueError(f"Context '{context or 'current-context'}' not found in kubeconfig")
+    return index.server_for_context(context)
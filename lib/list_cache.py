@@ -0,0 +1,145 @@
+"""
+On-disk cache of custom resource list results.
+
+Pre-flight validation is run repeatedly (``--validate-only`` in the days before
+a switchover, then again at the start of the real run) and re-reads the same
+collections each time: Velero backups, BackupSchedules, ManagedClusters,
+ClusterDeployments. ``ListCache`` persists each list result under the state
+directory, keyed by context + group/version/plural + namespace + label
+selector, together with the collection's resourceVersion and a fingerprint of
+every item's uid and resourceVersion.
+
+KubeClient uses the cache in two steps before re-listing a collection:
+
+1. A ``limit=1`` list returns the current collection resourceVersion. If it
+   matches the cached one, nothing on the server has changed.
+2. Otherwise a metadata-only list is compared with the cached fingerprint.
+   The collection resourceVersion is the cluster-wide etcd revision, so it
+   moves on every unrelated write (e.g., Lease renewals). The per-item
+   fingerprint still detects whether this collection changed, while
+   transferring only metadata instead of full objects.
+
+Only when both checks fail is the full collection listed and the entry
+rewritten.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("acm_switchover")
+
+CACHE_FORMAT_VERSION = 1
+
+
+def fingerprint(items: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map each item's uid (or namespace/name) to its resourceVersion."""
+    result: Dict[str, str] = {}
+    for item in items:
+        metadata = item.get("metadata") or {}
+        ident = metadata.get("uid") or f"{metadata.get('namespace', '')}/{metadata.get('name', '')}"
+        result[ident] = str(metadata.get("resourceVersion", ""))
+    return result
+
+
+class ListCache:
+    """JSON files, one per (context, GVR, namespace, selector) list."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._lock = threading.Lock()
+        # Lists served from the cache vs. fetched in full (for reporting)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        context: Optional[str],
+        group: str,
+        version: str,
+        plural: str,
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Build the identity of a cached list."""
+        return {
+            "context": context or "default",
+            "group": group,
+            "version": version,
+            "plural": plural,
+            "namespace": namespace or "",
+            "label_selector": label_selector or "",
+        }
+
+    def record(self, hit: bool) -> None:
+        """Count a list served from the cache (hit) or fetched in full (miss)."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _path(self, key: Dict[str, str]) -> str:
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest[:32]}.json")
+
+    def load(self, key: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a key, or None if missing or unreadable.
+
+        Entries carry ``resource_version``, ``fingerprint`` and ``items``.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable list cache entry %s: %s", path, e)
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("format") != CACHE_FORMAT_VERSION
+            or entry.get("key") != key
+            or not isinstance(entry.get("items"), list)
+        ):
+            return None
+        return entry
+
+    def store(self, key: Dict[str, str], resource_version: str, items: List[Dict[str, Any]]) -> None:
+        """Write (or replace) the entry for a key.
+
+        Failures are logged and otherwise ignored; the cache is an optimization.
+        """
+        entry = {
+            "format": CACHE_FORMAT_VERSION,
+            "key": key,
+            "resource_version": resource_version,
+            "fingerprint": fingerprint(items),
+            "items": items,
+        }
+        path = self._path(key)
+        with self._lock:
+            try:
+                os.makedirs(self.directory, mode=0o700, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(entry, f, separators=(",", ":"))
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug("Could not write list cache entry %s: %s", path, e)
+
+    def touch(self, entry: Dict[str, Any], resource_version: str) -> None:
+        """Record a newer collection resourceVersion for an entry that is still valid."""
+        if entry.get("resource_version") != resource_version:
+            self.store(entry["key"], resource_version, entry["items"])
@@ -0,0 +1,156 @@
+"""
+Client-side rate limiting for Kubernetes API calls.
+
+Implements a token bucket in the style of client-go's ``flowcontrol`` limiter:
+tokens refill continuously at ``qps`` per second up to ``burst``, and each
+request consumes one token, blocking until a token is available. This keeps
+concurrent fan-out (e.g., bulk ManagedCluster patches) from overwhelming the
+API server or tripping API Priority and Fairness throttling.
+
+Limiters returned by ``get_context_limiter`` are shared process-wide per
+kubeconfig context, so every KubeClient talking to the same hub draws from
+the same budget. When the server answers 429, ``pause`` stops all callers on
+that context until the requested Retry-After has elapsed.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from lib.constants import API_CLIENT_BURST, API_CLIENT_QPS
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    A ``qps`` of zero or less disables limiting so callers can pass user
+    configuration straight through.
+    """
+
+    def __init__(
+        self,
+        qps: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            qps: Sustained requests per second (<= 0 disables limiting)
+            burst: Maximum tokens that can accumulate (minimum 1)
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.qps = float(qps)
+        self.burst = max(1, int(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last = clock()
+        self._paused_until = self._last
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when the bucket actually limits requests."""
+        return self.qps > 0
+
+    def _refill_locked(self) -> float:
+        """Add tokens accrued since the last refill; return the current time."""
+        now = self._clock()
+        # No tokens accrue while paused
+        elapsed = max(0.0, now - max(self._last, self._paused_until))
+        self._last = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.qps)
+        return now
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g., a server Retry-After).
+
+        The bucket is drained so callers resume at the sustained rate rather
+        than in a burst once the pause ends.
+        """
+        if not self.enabled or seconds <= 0:
+            return
+        with self._lock:
+            now = self._refill_locked()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+
+    def try_acquire(self) -> bool:
+        """Take a token without blocking; return False if none is available."""
+        if not self.enabled:
+            return True
+        with self._lock:
+            now = self._refill_locked()
+            if now >= self._paused_until and self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is available.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if a token was acquired, False if the timeout expired
+        """
+        if not self.enabled:
+            return True
+
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                now = self._refill_locked()
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = max(0.0, self._paused_until - now) + max(0.0, 1 - self._tokens) / self.qps
+
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            self._sleep(wait)
+
+
+_context_limiters: Dict[str, TokenBucket] = {}
+_context_limiters_lock = threading.Lock()
+
+
+def get_context_limiter(
+    context: Optional[str],
+    qps: float = API_CLIENT_QPS,
+    burst: int = API_CLIENT_BURST,
+) -> TokenBucket:
+    """Return the process-wide limiter for a kubeconfig context.
+
+    The first caller for a context decides its qps/burst; later callers share
+    that bucket.
+
+    Args:
+        context: Kubeconfig context name (None for the current context)
+        qps: Sustained requests per second for a newly created limiter
+        burst: Burst size for a newly created limiter
+
+    Returns:
+        Shared TokenBucket for the context
+    """
+    key = context or "default"
+    with _context_limiters_lock:
+        limiter = _context_limiters.get(key)
+        if limiter is None:
+            limiter = TokenBucket(qps, burst)
+            _context_limiters[key] = limiter
+        return limiter
+
+
+def reset_context_limiters() -> None:
+    """Forget all per-context limiters (used by tests)."""
+    with _context_limiters_lock:
+        _context_limiters.clear()
@@ -0,0 +1,216 @@
+"""
+On-disk cache of RBAC verdicts shared across runs.
+
+Operators usually run ``check_rbac.py`` and then, minutes later,
+``acm_switchover.py``, which validates the same permission matrix against the
+same hubs again. ``RBACVerdictCache`` stores the permissions a validator found
+granted under the state directory, keyed by:
+
+- kubeconfig context and API server
+- a hash of the credentials in use (bearer token, client certificate or
+  basic-auth user), so a different user or service account never reuses
+  another's verdicts
+- a hash of the permission matrix: RBACValidator's permission tables for the
+  role plus the role definitions under ``deploy/rbac``, so editing either
+  invalidates every entry
+
+Each granted permission keeps the time it was verified and is reused for at
+most ``RBAC_CACHE_TTL`` seconds; writing an entry back does not refresh the
+time of verdicts it was seeded with. Denials are never stored, so a permission
+fixed after a failed run is picked up immediately; a revoked permission is
+picked up once its verdict expires.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from lib.constants import RBAC_CACHE_TTL
+
+if TYPE_CHECKING:
+    from lib.rbac_validator import PermissionKey, RBACValidator
+
+logger = logging.getLogger("acm_switchover")
+
+CACHE_FORMAT_VERSION = 1
+
+# Role definitions shipped with the tool (deploy/rbac/*.yaml)
+DEFAULT_RBAC_DEFINITIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "deploy", "rbac"
+)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def credential_hash(kube_client: Any) -> Optional[str]:
+    """Hash the credentials a KubeClient authenticates with.
+
+    Args:
+        kube_client: KubeClient whose API client configuration is inspected
+
+    Returns:
+        Hex digest, or None if no credential could be identified (nothing is
+        cached then)
+    """
+    configuration = getattr(getattr(kube_client.core_v1, "api_client", None), "configuration", None)
+    if configuration is None:
+        return None
+
+    api_key = getattr(configuration, "api_key", None)
+    token = api_key.get("authorization") if isinstance(api_key, dict) else None
+    if isinstance(token, str) and token:
+        return _sha256(b"token:" + token.encode("utf-8"))
+
+    cert_file = getattr(configuration, "cert_file", None)
+    if isinstance(cert_file, str) and cert_file:
+        try:
+            with open(cert_file, "rb") as f:
+                return _sha256(b"cert:" + f.read())
+        except OSError as e:
+            logger.debug("Could not read client certificate %s for the RBAC cache: %s", cert_file, e)
+            return None
+
+    username = getattr(configuration, "username", None)
+    if isinstance(username, str) and username:
+        return _sha256(b"user:" + username.encode("utf-8"))
+    return None
+
+
+def role_definitions_hash(directory: Optional[str] = DEFAULT_RBAC_DEFINITIONS_DIR) -> str:
+    """Hash the YAML role definitions in a directory (empty digest if absent)."""
+    digest = hashlib.sha256()
+    if directory:
+        for path in sorted(glob.glob(os.path.join(directory, "*.yaml"))):
+            try:
+                with open(path, "rb") as f:
+                    content = f.read()
+            except OSError:
+                continue
+            digest.update(os.path.basename(path).encode("utf-8") + b"\0" + content + b"\0")
+    return digest.hexdigest()
+
+
+class RBACVerdictCache:
+    """JSON files, one per (context, server, credentials, permission matrix)."""
+
+    def __init__(
+        self,
+        directory: str,
+        ttl: float = RBAC_CACHE_TTL,
+        definitions_dir: Optional[str] = DEFAULT_RBAC_DEFINITIONS_DIR,
+    ) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        self._definitions_hash = role_definitions_hash(definitions_dir)
+        self._lock = threading.Lock()
+        # Verification time of every verdict seeded from disk, per entry path
+        self._seeded: Dict[str, Dict["PermissionKey", float]] = {}
+
+    def make_key(self, validator: "RBACValidator") -> Optional[Dict[str, str]]:
+        """Build the identity of a validator's entry, or None if it cannot be cached."""
+        identity = credential_hash(validator.client)
+        if identity is None:
+            return None
+        configuration = validator.client.core_v1.api_client.configuration
+        host = getattr(configuration, "host", "")
+        return {
+            "context": validator.client.context or "default",
+            "server": host if isinstance(host, str) else "",
+            "identity": identity,
+            "matrix": _sha256(f"{validator.permission_matrix_hash()}:{self._definitions_hash}".encode("utf-8")),
+        }
+
+    def _path(self, key: Dict[str, str]) -> str:
+        digest = _sha256(json.dumps(key, sort_keys=True).encode("utf-8"))
+        return os.path.join(self.directory, f"{digest[:32]}.json")
+
+    def load(self, validator: "RBACValidator") -> int:
+        """Seed a validator with the unexpired granted permissions cached for it.
+
+        Returns:
+            Number of permissions seeded
+        """
+        key = self.make_key(validator)
+        if key is None:
+            return 0
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable RBAC cache entry %s: %s", path, e)
+            return 0
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("format") != CACHE_FORMAT_VERSION
+            or entry.get("key") != key
+            or not isinstance(entry.get("granted"), list)
+        ):
+            return 0
+
+        now = time.time()
+        fresh: Dict["PermissionKey", float] = {}
+        for record in entry["granted"]:
+            try:
+                api_group, resource, verb, namespace, verified_at = record
+                verified_at = float(verified_at)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= now - verified_at < self.ttl:
+                fresh[(api_group, resource, verb, namespace)] = verified_at
+
+        with self._lock:
+            self._seeded[path] = fresh
+        validator.seed_granted_permissions(fresh)
+        if fresh:
+            logger.info(
+                "Reusing %d RBAC verdict(s) cached for context %s (verified less than %ds ago)",
+                len(fresh),
+                key["context"],
+                self.ttl,
+            )
+        return len(fresh)
+
+    def store(self, validator: "RBACValidator") -> None:
+        """Write the validator's granted permissions, keeping seeded verification times.
+
+        Failures are logged and otherwise ignored; the cache is an optimization.
+        """
+        key = self.make_key(validator)
+        if key is None:
+            return
+        path = self._path(key)
+        now = time.time()
+        with self._lock:
+            seeded = self._seeded.get(path, {})
+        granted = [
+            [api_group, resource, verb, namespace, seeded.get((api_group, resource, verb, namespace), now)]
+            for api_group, resource, verb, namespace in validator.granted_permissions()
+        ]
+        entry = {"format": CACHE_FORMAT_VERSION, "key": key, "granted": granted}
+
+        with self._lock:
+            try:
+                os.makedirs(self.directory, mode=0o700, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(entry, f, separators=(",", ":"))
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug("Could not write RBAC cache entry %s: %s", path, e)
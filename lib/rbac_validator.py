@@ -7,19 +7,79 @@
 The module supports two roles:
 - operator: Full permissions for executing switchover operations
 - validator: Read-only permissions for validation and dry-run operations
+
+Each permission is checked with a SelfSubjectAccessReview, or, in rules-review
+mode, namespaced permissions are evaluated locally against one
+SelfSubjectRulesReview per namespace. prefetch_permissions resolves the reviews
+for several clusters concurrently before the (serial) validate_* reporting runs.
+validate_managed_cluster_fleet checks many spoke contexts with bounded
+concurrency and a timeout per context.
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from lib import KubeClient
+from lib.async_runner import run_bounded
+from lib.constants import RBAC_CHECK_MAX_WORKERS, RBAC_FLEET_CHECK_TIMEOUT, RBAC_FLEET_CONCURRENCY
 from lib.exceptions import ValidationError
+from lib.rate_limiter import get_context_limiter
+from lib.rbac_cache import RBACVerdictCache
 
 logger = logging.getLogger("acm_switchover")
 
 # Valid roles for RBAC validation
 VALID_ROLES = ("operator", "validator")
 
+# Resource rules from a SelfSubjectRulesReview and whether the rule set is incomplete
+NamespaceRules = Tuple[List[Dict[str, List[str]]], bool]
+
+# (api_group, resource, verb, namespace) of one SelfSubjectAccessReview
+PermissionKey = Tuple[str, str, str, Optional[str]]
+
+# Outcome of one context in validate_managed_cluster_fleet
+FLEET_STATUSES = ("passed", "failed", "error", "timeout")
+
+
+def _rule_matches_resource(rule_resource: str, resource: str) -> bool:
+    """Match a rule resource against a requested resource, following RBAC semantics."""
+    if rule_resource in ("*", resource):
+        return True
+    # "*/scale" grants the scale subresource of every resource
+    _, _, subresource = resource.partition("/")
+    return bool(subresource) and rule_resource == f"*/{subresource}"
+
+
+def rule_allows(rule: Dict[str, List[str]], api_group: str, resource: str, verb: str) -> bool:
+    """Check whether a SelfSubjectRulesReview resource rule grants a permission.
+
+    Rules restricted to resourceNames never grant a permission on the whole
+    resource type, matching what a SelfSubjectAccessReview without a name reports.
+
+    Args:
+        rule: Resource rule with verbs, apiGroups, resources and resourceNames lists
+        api_group: API group (empty string for core)
+        resource: Resource type (plural form, optionally with "/subresource")
+        verb: Permission verb
+
+    Returns:
+        True if the rule grants the permission
+    """
+    if rule.get("resourceNames"):
+        return False
+    verbs = rule.get("verbs") or []
+    groups = rule.get("apiGroups") or []
+    if "*" not in verbs and verb not in verbs:
+        return False
+    if "*" not in groups and api_group not in groups:
+        return False
+    return any(_rule_matches_resource(r, resource) for r in rule.get("resources") or [])
+
 
 class RBACValidator:
     """Validates RBAC permissions for ACM switchover operations."""
@@ -30,7 +90,7 @@ class RBACValidator:
         ("", "nodes", ["get", "list"]),  # For cluster health validation per runbook
         ("config.openshift.io", "clusteroperators", ["get", "list"]),  # For OpenShift health
         ("config.openshift.io", "clusterversions", ["get", "list"]),  # For upgrade status check
-        ("cluster.open-cluster-management.io", "managedclusters", ["get", "list", "patch"]),
+        ("cluster.open-cluster-management.io", "managedclusters", ["get", "list", "watch", "patch"]),
         ("hive.openshift.io", "clusterdeployments", ["get", "list"]),
         ("operator.open-cluster-management.io", "multiclusterhubs", ["get", "list"]),
         ("observability.open-cluster-management.io", "multiclusterobservabilities", ["get", "list"]),
@@ -42,7 +102,7 @@ class RBACValidator:
         ("", "nodes", ["get", "list"]),
         ("config.openshift.io", "clusteroperators", ["get", "list"]),
         ("config.openshift.io", "clusterversions", ["get", "list"]),
-        ("cluster.open-cluster-management.io", "managedclusters", ["get", "list"]),  # No patch
+        ("cluster.open-cluster-management.io", "managedclusters", ["get", "list", "watch"]),  # No patch
         ("hive.openshift.io", "clusterdeployments", ["get", "list"]),
         ("operator.open-cluster-management.io", "multiclusterhubs", ["get", "list"]),
         ("observability.open-cluster-management.io", "multiclusterobservabilities", ["get", "list"]),
@@ -56,19 +116,19 @@ class RBACValidator:
         "open-cluster-management-backup": [
             ("", "configmaps", ["get", "list", "create", "patch", "delete"]),
             ("", "secrets", ["get"]),
-            ("", "pods", ["get", "list"]),  # For Velero pod health checks
+            ("", "pods", ["get", "list", "watch"]),  # For Velero pod health checks
             ("cluster.open-cluster-management.io", "backupschedules", ["get", "list", "create", "patch", "delete"]),
-            ("cluster.open-cluster-management.io", "restores", ["get", "list", "create", "patch", "delete"]),
-            ("velero.io", "backups", ["get", "list"]),
-            ("velero.io", "restores", ["get", "list"]),  # For monitoring restore status
+            ("cluster.open-cluster-management.io", "restores", ["get", "list", "watch", "create", "patch", "delete"]),
+            ("velero.io", "backups", ["get", "list", "watch"]),
+            ("velero.io", "restores", ["get", "list", "watch"]),  # For monitoring restore status
             ("velero.io", "backupstoragelocations", ["get", "list"]),  # For storage health check
             ("oadp.openshift.io", "dataprotectionapplications", ["get", "list"]),
         ],
         "open-cluster-management": [
-            ("", "pods", ["get", "list"]),  # For ACM pod health checks
+            ("", "pods", ["get", "list", "watch"]),  # For ACM pod health checks
         ],
         "open-cluster-management-observability": [
-            ("", "pods", ["get", "list"]),
+            ("", "pods", ["get", "list", "watch"]),
             ("", "secrets", ["get"]),  # For Thanos object storage config
             ("apps", "deployments", ["get", "patch"]),
             ("apps", "statefulsets", ["get", "patch"]),
@@ -85,19 +145,19 @@ class RBACValidator:
         "open-cluster-management-backup": [
             ("", "configmaps", ["get", "list"]),
             ("", "secrets", ["get"]),  # For Thanos config validation
-            ("", "pods", ["get", "list"]),
+            ("", "pods", ["get", "list", "watch"]),
             ("cluster.open-cluster-management.io", "backupschedules", ["get", "list"]),
-            ("cluster.open-cluster-management.io", "restores", ["get", "list"]),
-            ("velero.io", "backups", ["get", "list"]),
-            ("velero.io", "restores", ["get", "list"]),
+            ("cluster.open-cluster-management.io", "restores", ["get", "list", "watch"]),
+            ("velero.io", "backups", ["get", "list", "watch"]),
+            ("velero.io", "restores", ["get", "list", "watch"]),
             ("velero.io", "backupstoragelocations", ["get", "list"]),
             ("oadp.openshift.io", "dataprotectionapplications", ["get", "list"]),
         ],
         "open-cluster-management": [
-            ("", "pods", ["get", "list"]),
+            ("", "pods", ["get", "list", "watch"]),
         ],
         "open-cluster-management-observability": [
-            ("", "pods", ["get", "list"]),
+            ("", "pods", ["get", "list", "watch"]),
             ("", "secrets", ["get"]),
             ("apps", "deployments", ["get", "list"]),  # No patch for validator
             ("apps", "statefulsets", ["get", "list"]),  # No patch for validator
@@ -136,18 +196,28 @@ class RBACValidator:
         ("observability.open-cluster-management.io", "multiclusterobservabilities", ["delete"]),
     ]
 
-    def __init__(self, client: KubeClient, role: str = "operator"):
+    def __init__(self, client: KubeClient, role: str = "operator", use_rules_review: bool = False):
         """
         Initialize RBAC validator.
 
         Args:
             client: KubeClient instance to use for validation
             role: Role to validate for ("operator" or "validator")
+            use_rules_review: Evaluate namespaced permissions against one
+                              SelfSubjectRulesReview per namespace instead of one
+                              SelfSubjectAccessReview per verb. Cluster-scoped checks,
+                              and denials in incomplete rule sets, still use
+                              SelfSubjectAccessReview.
         """
         if role not in VALID_ROLES:
             raise ValueError(f"Invalid role '{role}'. Must be one of: {VALID_ROLES}")
         self.client = client
         self.role = role
+        self.use_rules_review = use_rules_review
+        self._namespace_rules: Dict[str, Optional[NamespaceRules]] = {}
+        # Access review verdicts, so repeated checks (and prefetched ones) cost no API call
+        self._verdicts: Dict[PermissionKey, Tuple[bool, str]] = {}
+        self._lock = threading.Lock()
 
     def _get_cluster_permissions(self) -> List[Tuple[str, str, List[str]]]:
         """Get cluster permissions based on role."""
@@ -186,6 +256,12 @@ def check_permission(
         Returns:
             Tuple of (has_permission, error_message)
         """
+        key = (api_group, resource, verb, namespace)
+        with self._lock:
+            cached = self._verdicts.get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Use kubectl auth can-i equivalent via Kubernetes API
             # SelfSubjectAccessReview to check permissions
@@ -206,19 +282,201 @@ def check_permission(
                 spec=k8s_client.V1SelfSubjectAccessReviewSpec(resource_attributes=resource_attrs)
             )
 
-            # Check permission
+            # Check permission (sharing the context's rate limit with its KubeClient)
+            get_context_limiter(self.client.context).acquire()
             response = api_instance.create_self_subject_access_review(body)
 
             if response.status.allowed:
-                return True, ""
+                verdict = (True, "")
             else:
                 reason = response.status.reason or "Permission denied"
-                return False, reason
+                verdict = (False, reason)
 
         except Exception as e:
             logger.warning("Failed to check permission %s/%s: %s", resource, verb, e)
             return False, f"Error checking permission: {str(e)}"
 
+        with self._lock:
+            self._verdicts[key] = verdict
+        return verdict
+
+    def get_namespace_rules(self, namespace: str) -> Optional[NamespaceRules]:
+        """
+        Fetch the current user's resource rules in a namespace (cached per validator).
+
+        Args:
+            namespace: Namespace to review
+
+        Returns:
+            Tuple of (resource rules, incomplete), or None if the review failed
+        """
+        if namespace in self._namespace_rules:
+            return self._namespace_rules[namespace]
+
+        rules: Optional[NamespaceRules] = None
+        try:
+            from kubernetes import client as k8s_client
+
+            api_instance = k8s_client.AuthorizationV1Api(self.client.core_v1.api_client)
+            body = k8s_client.V1SelfSubjectRulesReview(
+                spec=k8s_client.V1SelfSubjectRulesReviewSpec(namespace=namespace)
+            )
+            get_context_limiter(self.client.context).acquire()
+            status = api_instance.create_self_subject_rules_review(body).status
+
+            resource_rules = [
+                {
+                    "verbs": list(rule.verbs or []),
+                    "apiGroups": list(rule.api_groups or []),
+                    "resources": list(rule.resources or []),
+                    "resourceNames": list(rule.resource_names or []),
+                }
+                for rule in status.resource_rules or []
+            ]
+            incomplete = bool(status.incomplete)
+            if incomplete:
+                logger.debug(
+                    "SelfSubjectRulesReview for %s is incomplete (%s); denials will be confirmed individually",
+                    namespace,
+                    status.evaluation_error or "no reason given",
+                )
+            rules = (resource_rules, incomplete)
+        except Exception as e:
+            logger.warning(
+                "Failed to review rules in namespace %s, checking permissions individually: %s", namespace, e
+            )
+
+        self._namespace_rules[namespace] = rules
+        return rules
+
+    def check_namespaced_permission(self, api_group: str, resource: str, verb: str, namespace: str) -> Tuple[bool, str]:
+        """
+        Check a namespaced permission, using the namespace's rules review when enabled.
+
+        A permission granted by any rule is allowed without an API call. A denial
+        is final only when the rule set is complete; otherwise (and when rules
+        review is disabled or failed) a SelfSubjectAccessReview decides.
+
+        Args:
+            api_group: API group (empty string for core)
+            resource: Resource type (plural form)
+            verb: Permission verb
+            namespace: Namespace of the resource
+
+        Returns:
+            Tuple of (has_permission, error_message)
+        """
+        return self._local_verdict(api_group, resource, verb, namespace) or self.check_permission(
+            api_group, resource, verb, namespace
+        )
+
+    def _local_verdict(self, api_group: str, resource: str, verb: str, namespace: str) -> Optional[Tuple[bool, str]]:
+        """Decide a namespaced permission from known verdicts or the rules review, or None if an SSAR is needed."""
+        key = (api_group, resource, verb, namespace)
+        with self._lock:
+            cached = self._verdicts.get(key)
+        if cached is not None or not self.use_rules_review:
+            return cached
+        rules = self.get_namespace_rules(namespace)
+        if rules is None:
+            return None
+        resource_rules, incomplete = rules
+        if any(rule_allows(rule, api_group, resource, verb) for rule in resource_rules):
+            verdict = (True, "")
+        elif not incomplete:
+            verdict = (False, "Not granted by any rule in SelfSubjectRulesReview")
+        else:
+            return None
+        with self._lock:
+            self._verdicts[key] = verdict
+        return verdict
+
+    def _namespaces_needing_rules(self, skip_observability: bool = False, managed_cluster: bool = False) -> List[str]:
+        """Namespaces with a required permission that no known verdict decides yet."""
+        required = self._required_namespace_permissions(skip_observability, managed_cluster)
+        with self._lock:
+            return [
+                namespace
+                for namespace, permissions in required.items()
+                if any(
+                    (api_group, resource, verb, namespace) not in self._verdicts
+                    for api_group, resource, verbs in permissions
+                    for verb in verbs
+                )
+            ]
+
+    def permission_matrix_hash(self) -> str:
+        """Hash the permission tables this validator's role checks (for cross-run caching)."""
+        matrix = {
+            "role": self.role,
+            "cluster": self._get_cluster_permissions(),
+            "hub_namespaces": self._get_hub_namespace_permissions(),
+            "managed_cluster_namespaces": self._get_managed_cluster_namespace_permissions(),
+            "decommission": self.DECOMMISSION_PERMISSIONS,
+        }
+        return hashlib.sha256(json.dumps(matrix, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def granted_permissions(self) -> List[PermissionKey]:
+        """Permissions verified as granted so far."""
+        with self._lock:
+            return [key for key, (allowed, _) in self._verdicts.items() if allowed]
+
+    def seed_granted_permissions(self, keys: Iterable[PermissionKey]) -> None:
+        """Treat permissions verified elsewhere (e.g. a cached earlier run) as granted."""
+        with self._lock:
+            for key in keys:
+                self._verdicts.setdefault(key, (True, ""))
+
+    def _required_namespace_permissions(
+        self, skip_observability: bool = False, managed_cluster: bool = False
+    ) -> Dict[str, List[Tuple[str, str, List[str]]]]:
+        """Namespaced permissions checked by validate_namespace/managed_cluster_permissions."""
+        if managed_cluster:
+            return self._get_managed_cluster_namespace_permissions()
+        return {
+            namespace: permissions
+            for namespace, permissions in self._get_hub_namespace_permissions().items()
+            if not (skip_observability and "observability" in namespace)
+            and namespace != "open-cluster-management-agent"
+        }
+
+    def pending_access_reviews(
+        self, include_decommission: bool = False, skip_observability: bool = False, managed_cluster: bool = False
+    ) -> List[PermissionKey]:
+        """
+        List the SelfSubjectAccessReviews a validation run still needs.
+
+        Permissions decided by cached rules reviews or earlier verdicts are
+        left out, and identical checks appear once.
+
+        Args:
+            include_decommission: Whether decommission permissions will be checked
+            skip_observability: Whether observability checks will be skipped
+            managed_cluster: List the managed cluster checks instead of the hub ones
+
+        Returns:
+            Permission keys in check order
+        """
+        keys: List[PermissionKey] = []
+        if not managed_cluster:
+            for api_group, resource, verbs in self._get_cluster_permissions():
+                if not (skip_observability and "observability" in api_group):
+                    keys.extend((api_group, resource, verb, None) for verb in verbs)
+            if include_decommission and self.role == "operator":
+                for api_group, resource, verbs in self.DECOMMISSION_PERMISSIONS:
+                    keys.extend((api_group, resource, verb, None) for verb in verbs)
+
+        for namespace, permissions in self._required_namespace_permissions(skip_observability, managed_cluster).items():
+            for api_group, resource, verbs in permissions:
+                keys.extend(
+                    (api_group, resource, verb, namespace)
+                    for verb in verbs
+                    if self._local_verdict(api_group, resource, verb, namespace) is None
+                )
+
+        with self._lock:
+            return [key for key in dict.fromkeys(keys) if key not in self._verdicts]
+
     def validate_cluster_permissions(
         self, include_decommission: bool = False, skip_observability: bool = False
     ) -> Tuple[bool, List[str]]:
@@ -326,7 +584,7 @@ def validate_namespace_permissions(
 
             for api_group, resource, verbs in permissions:
                 for verb in verbs:
-                    has_perm, error = self.check_permission(api_group, resource, verb, namespace)
+                    has_perm, error = self.check_namespaced_permission(api_group, resource, verb, namespace)
                     if not has_perm:
                         all_valid = False
                         group_name = api_group if api_group else "core"
@@ -375,7 +633,7 @@ def validate_managed_cluster_permissions(self) -> Tuple[bool, List[str]]:
 
             for api_group, resource, verbs in permissions:
                 for verb in verbs:
-                    has_perm, error = self.check_permission(api_group, resource, verb, namespace)
+                    has_perm, error = self.check_namespaced_permission(api_group, resource, verb, namespace)
                     if not has_perm:
                         all_valid = False
                         group_name = api_group if api_group else "core"
@@ -477,11 +735,161 @@ def generate_permission_report(self, include_decommission: bool = False, skip_ob
         return "\n".join(report)
 
 
+def prefetch_permissions(
+    checks: Sequence[Tuple[RBACValidator, bool, bool]],
+    managed_cluster: bool = False,
+    max_workers: int = RBAC_CHECK_MAX_WORKERS,
+    cache: Optional[RBACVerdictCache] = None,
+) -> int:
+    """
+    Resolve the reviews of several validators (e.g. both hubs) concurrently.
+
+    Rules reviews are fetched first, then every SelfSubjectAccessReview still
+    needed is submitted to the same bounded pool. Each request takes a token
+    from its context's shared rate limiter. Verdicts are cached on the
+    validators, so the validate_* methods and generate_permission_report that
+    follow produce their usual output without further API calls.
+
+    Args:
+        checks: (validator, include_decommission, skip_observability) per cluster
+        managed_cluster: Prefetch managed cluster checks instead of hub checks
+        max_workers: Maximum reviews in flight across all validators
+        cache: Cross-run verdict cache to seed the validators from and update afterwards
+
+    Returns:
+        Number of SelfSubjectAccessReviews issued
+    """
+    if cache:
+        for validator, _, _ in checks:
+            cache.load(validator)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="rbac") as executor:
+        rules_reviews = [
+            (validator, namespace)
+            for validator, _, skip_observability in checks
+            if validator.use_rules_review
+            for namespace in validator._namespaces_needing_rules(skip_observability, managed_cluster)
+        ]
+        list(executor.map(lambda item: item[0].get_namespace_rules(item[1]), rules_reviews))
+
+        access_reviews = [
+            (validator, key)
+            for validator, include_decommission, skip_observability in checks
+            for key in validator.pending_access_reviews(include_decommission, skip_observability, managed_cluster)
+        ]
+        list(executor.map(lambda item: item[0].check_permission(*item[1]), access_reviews))
+
+    logger.info(
+        "Evaluated %d rules review(s) and %d access review(s) across %d cluster(s) in %.1fs",
+        len(rules_reviews),
+        len(access_reviews),
+        len(checks),
+        time.monotonic() - start,
+    )
+
+    if cache:
+        for validator, _, _ in checks:
+            cache.store(validator)
+    return len(access_reviews)
+
+
+def validate_managed_cluster_fleet(
+    contexts: Sequence[str],
+    role: str = "operator",
+    concurrency: int = RBAC_FLEET_CONCURRENCY,
+    timeout: Optional[float] = RBAC_FLEET_CHECK_TIMEOUT,
+    cache: Optional[RBACVerdictCache] = None,
+) -> Dict[str, Any]:
+    """
+    Validate managed cluster permissions on many spoke contexts concurrently.
+
+    Each context gets its own KubeClient and rules-review validator and runs
+    validate_managed_cluster_permissions. A context that raises is reported as
+    "error" and one that does not finish within ``timeout`` as "timeout"; neither
+    stops the other contexts.
+
+    Args:
+        contexts: Kubeconfig contexts of the managed clusters
+        role: Role to validate permissions for
+        concurrency: Maximum contexts validated in flight
+        timeout: Seconds allowed per context (None waits indefinitely)
+        cache: Cross-run verdict cache to seed each validator from and update afterwards
+
+    Returns:
+        JSON-serializable summary: the role, a count per status in
+        FLEET_STATUSES, total seconds, and one entry per context (in input
+        order) with its status, errors and seconds
+
+    Raises:
+        ValueError: If the role is invalid
+    """
+    if role not in VALID_ROLES:
+        raise ValueError(f"Invalid role '{role}'. Must be one of: {VALID_ROLES}")
+
+    def result(context: str, status: str, errors: List[str], seconds: float) -> Dict[str, Any]:
+        return {"context": context, "status": status, "errors": errors, "seconds": round(seconds, 3)}
+
+    def check_context(context: str) -> Dict[str, Any]:
+        start = time.monotonic()
+        try:
+            validator = RBACValidator(KubeClient(context=context), role=role, use_rules_review=True)
+            if cache:
+                cache.load(validator)
+            all_valid, errors = validator.validate_managed_cluster_permissions()
+            if cache:
+                cache.store(validator)
+        except Exception as e:  # One unreachable spoke must not abort the fleet run
+            logger.error("RBAC validation on context %s failed: %s", context, e)
+            return result(context, "error", [str(e)], time.monotonic() - start)
+        return result(context, "passed" if all_valid else "failed", errors, time.monotonic() - start)
+
+    def context_timed_out(context: str) -> Dict[str, Any]:
+        logger.error("RBAC validation on context %s timed out after %ss", context, timeout)
+        return result(context, "timeout", [f"Timed out after {timeout}s"], timeout or 0.0)
+
+    logger.info(
+        "Validating managed cluster RBAC on %d context(s) for role %s (up to %d in flight, %ss timeout each)...",
+        len(contexts),
+        role,
+        concurrency,
+        timeout,
+    )
+    start = time.monotonic()
+    results = run_bounded(
+        check_context,
+        [(context,) for context in contexts],
+        concurrency=concurrency,
+        timeout=timeout,
+        on_timeout=context_timed_out,
+        label="Managed cluster RBAC checks",
+    )
+    elapsed = time.monotonic() - start
+
+    summary: Dict[str, Any] = {"role": role, "contexts": len(results)}
+    for status in FLEET_STATUSES:
+        summary[status] = sum(1 for entry in results if entry["status"] == status)
+    summary["seconds"] = round(elapsed, 3)
+    summary["clusters"] = results
+
+    logger.info(
+        "Managed cluster RBAC: %d/%d context(s) passed (%d failed, %d error, %d timed out) in %.1fs",
+        summary["passed"],
+        len(results),
+        summary["failed"],
+        summary["error"],
+        summary["timeout"],
+        elapsed,
+    )
+    return summary
+
+
 def validate_rbac_permissions(
     primary_client: KubeClient,
     secondary_client: Optional[KubeClient] = None,
     include_decommission: bool = False,
     skip_observability: bool = False,
+    cache_dir: Optional[str] = None,
 ) -> None:
     """
     Validate RBAC permissions on primary and optionally secondary hub.
@@ -491,15 +899,23 @@ def validate_rbac_permissions(
         secondary_client: Optional KubeClient for secondary hub
         include_decommission: Whether to check decommission permissions
         skip_observability: Whether to skip observability checks
+        cache_dir: Directory of the cross-run RBAC verdict cache (None disables it)
 
     Raises:
         ValidationError: If RBAC validation fails
     """
     logger.info("Starting RBAC permission validation...")
 
+    primary_validator = RBACValidator(primary_client, use_rules_review=True)
+    checks = [(primary_validator, include_decommission, skip_observability)]
+    secondary_validator = None
+    if secondary_client:
+        secondary_validator = RBACValidator(secondary_client, use_rules_review=True)
+        checks.append((secondary_validator, False, skip_observability))  # Decommission only on primary
+    prefetch_permissions(checks, cache=RBACVerdictCache(cache_dir) if cache_dir else None)
+
     # Validate primary hub
     logger.info("Validating RBAC permissions on primary hub...")
-    primary_validator = RBACValidator(primary_client)
     primary_valid, primary_errors = primary_validator.validate_all_permissions(
         include_decommission=include_decommission, skip_observability=skip_observability
     )
@@ -510,9 +926,8 @@ def validate_rbac_permissions(
         raise ValidationError("RBAC permission validation failed on primary hub. " "See report above for details.")
 
     # Validate secondary hub if provided
-    if secondary_client:
+    if secondary_validator:
         logger.info("Validating RBAC permissions on secondary hub...")
-        secondary_validator = RBACValidator(secondary_client)
         secondary_valid, secondary_errors = secondary_validator.validate_all_permissions(
             include_decommission=False,  # Decommission only on primary
             skip_observability=skip_observability,
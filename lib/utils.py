@@ -3,15 +3,25 @@
 """
 
 import atexit
+import copy
 import functools
 import json
 import logging
 import os
 import signal
 import stat
+import threading
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, Literal, Optional, Set, Tuple, TypeVar
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Set, Tuple, TypeVar
+
+from lib.constants import (
+    STATE_FLUSH_INTERVAL,
+    STATE_JOURNAL_COMPACT_RECORDS,
+    STATE_JOURNAL_SUFFIX,
+    STATE_WRITER_STOP_TIMEOUT,
+    STEP_PROGRESS_FLUSH_ITEMS,
+)
 
 # File locking is best-effort; fcntl isn't available on Windows.
 try:
@@ -97,14 +107,110 @@ def _utc_timestamp() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _apply_journal_record(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Apply one state journal record to a state dict."""
+    op = record.get("op")
+    timestamp = record.get("ts") or _utc_timestamp()
+    if op == "step":
+        steps = state.setdefault("completed_steps", [])
+        if not any(s["name"] == record["name"] for s in steps):
+            steps.append({"name": record["name"], "timestamp": timestamp})
+        (state.get("step_progress") or {}).pop(record["name"], None)
+    elif op == "progress":
+        _merge_step_progress(state, record["step"], record.get("items") or [])
+    elif op == "config":
+        state.setdefault("config", {})[record["key"]] = record.get("value")
+    elif op == "phase":
+        state["current_phase"] = record["value"]
+    elif op == "error":
+        state.setdefault("errors", []).append(
+            {"error": record["error"], "phase": record.get("phase"), "timestamp": timestamp}
+        )
+    else:
+        logging.warning("Ignoring unknown state journal record: %s", op)
+        return
+    state["last_updated"] = timestamp
+
+
+def _merge_step_progress(state: Dict[str, Any], step_name: str, items: Iterable[str]) -> None:
+    """Add processed items to a step's progress, stored as a sorted name list."""
+    progress = state.setdefault("step_progress", {})
+    progress[step_name] = sorted(set(progress.get(step_name, [])).union(items))
+
+
+def apply_state_journal(state: Dict[str, Any], journal_file: str) -> int:
+    """Replay journal records newer than the snapshot into a state dict.
+
+    Records with a sequence number at or below the snapshot's ``journal_seq``
+    were already folded into it and are skipped. Replay stops at the first
+    unreadable line, which can only be a record torn by a crash mid-append.
+
+    Returns:
+        Number of records applied
+    """
+    try:
+        f = open(journal_file, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return 0
+
+    applied = 0
+    last_seq = state.get("journal_seq", 0)
+    with f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                seq = int(record["seq"])
+            except (ValueError, KeyError, TypeError) as e:
+                logging.warning("Ignoring truncated state journal record at %s:%d (%s)", journal_file, line_number, e)
+                break
+            if seq <= last_seq:
+                continue
+            _apply_journal_record(state, record)
+            last_seq = seq
+            applied += 1
+    state["journal_seq"] = last_seq
+    return applied
+
+
 class StateManager:
-    """Manages switchover state for idempotent operations."""
+    """Manages switchover state for idempotent operations.
+
+    By default every change rewrites the whole state file. In journal mode,
+    step completions, config values, phase changes and errors are instead
+    appended as JSON lines to ``<state_file>.journal`` (fsync'd only for phase
+    changes and errors), and the journal is folded into the state file every
+    STATE_JOURNAL_COMPACT_RECORDS records, on flush_state(), and on load.
+
+    With a positive ``flush_interval``, save_state() only marks the state dirty
+    and a background writer thread persists it at most once per interval,
+    coalescing the updates made in between. flush_state() and the critical
+    checkpoints (set_phase, add_error, reset) still write synchronously, and
+    pending updates are flushed on close(), at exit and on SIGTERM/SIGINT.
+    """
 
-    def __init__(self, state_file: str = ".state/switchover-state.json"):
+    def __init__(
+        self,
+        state_file: str = ".state/switchover-state.json",
+        journal: bool = False,
+        flush_interval: float = STATE_FLUSH_INTERVAL,
+    ):
         self.state_file = state_file
+        self.journal = journal
+        self.flush_interval = max(0.0, flush_interval)
+        self.journal_file = state_file + STATE_JOURNAL_SUFFIX
+        self._journal_handle: Optional[Any] = None
+        self._journal_records = 0  # Records appended since the last snapshot
         self._dirty = False  # Track if state has pending writes
         self._active_temp_files: Set[str] = set()  # Track active temp files for cleanup
-        self._flushing = False  # Track if we're currently flushing to avoid double-write
+        self._lock = threading.RLock()  # Guards in-memory state against the background writer
+        self._write_lock = threading.RLock()  # Serializes writes to the state file
+        self._journal_lock = threading.RLock()  # Serializes journal appends against discarding it
+        self._flush_owner: Optional[int] = None  # Thread currently flushing (re-entrancy guard)
+        self._writer: Optional[threading.Thread] = None
+        self._flush_requested = threading.Event()
+        self._writer_stop = threading.Event()
         self._previous_signal_handlers: Dict[int, Any] = {}
         # Register atexit handlers to flush pending state and clean up temp files on program exit
         atexit.register(self._flush_on_exit)
@@ -124,14 +230,35 @@ def signal_handler(signum: int, frame: Any) -> None:
                 # signal.signal() raises ValueError when called from non-main thread
                 # This is expected in test environments or when StateManager is used in workers
                 logging.debug("Cannot register signal handler for %s (not in main thread)", sig)
+        self._step_index: Dict[str, Dict[str, Any]] = {}
         self.state = self._load_state()
 
+    @property
+    def state(self) -> Dict[str, Any]:
+        return self._state
+
+    @state.setter
+    def state(self, value: Dict[str, Any]) -> None:
+        self._state = value
+        self._rebuild_step_index()
+
+    def _rebuild_step_index(self) -> None:
+        """Index completed steps by name (first entry wins, as with a linear scan)."""
+        self._step_index = {}
+        for entry in self._state.get("completed_steps") or []:
+            self._step_index.setdefault(entry["name"], entry)
+
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file or create new state."""
         if os.path.exists(self.state_file):
             try:
                 with open(self.state_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                    state = json.load(f)
+                # Fold records left by a journal-mode run into a fresh snapshot
+                if apply_state_journal(state, self.journal_file):
+                    self._write_state(state)
+                    self._discard_journal()
+                return state
             except json.JSONDecodeError as e:
                 logging.warning("Corrupted state file %s: %s, starting fresh", self.state_file, e)
             except OSError as e:
@@ -140,6 +267,7 @@ def _load_state(self) -> Dict[str, Any]:
         # If state file is missing or unreadable, create a new state file.
         state = self._new_state()
         self._write_state(state)
+        self._discard_journal()  # Records cannot apply to a fresh state
         return state
 
     def _new_state(self) -> Dict[str, Any]:
@@ -232,29 +360,118 @@ def _do_flush(self, force: bool = False, suppress_errors: bool = False) -> bool:
         Returns:
             True if flush was performed, False if skipped (not dirty or already flushing).
         """
-        if self._flushing:
-            return False
-        if not force and not self._dirty:
-            return False
+        if self._flush_owner == threading.get_ident():
+            return False  # Signal handler interrupted this thread's own flush
+
+        with self._write_lock:
+            with self._lock:
+                if not force and not self._dirty:
+                    return False
+                self.state["last_updated"] = _utc_timestamp()
+                # Write a copy so updates made meanwhile are neither torn nor lost
+                snapshot = copy.deepcopy(self.state)
+                self._dirty = False
 
-        try:
-            self._flushing = True
-            self.state["last_updated"] = _utc_timestamp()
-            self._write_state(self.state)
-            self._dirty = False
-            return True
-        except Exception as e:
-            if suppress_errors:
-                import sys
+            try:
+                self._flush_owner = threading.get_ident()
+                self._write_state(snapshot)
+                with self._journal_lock, self._lock:
+                    # The snapshot includes every journal record appended before it was taken
+                    if self.state.get("journal_seq") == snapshot.get("journal_seq"):
+                        self._discard_journal()
+                return True
+            except Exception as e:
+                with self._lock:
+                    self._dirty = True  # Keep the updates for the next flush
+                if suppress_errors:
+                    import sys
+
+                    print(f"Error flushing state: {e}", file=sys.stderr)
+                    return False
+                raise
+            finally:
+                self._flush_owner = None
 
-                print(f"Error flushing state: {e}", file=sys.stderr)
-                return False
-            raise
-        finally:
-            self._flushing = False
+    def _append_journal(self, record: Dict[str, Any], durable: bool = False) -> None:
+        """Apply a record to the in-memory state and append it to the journal.
+
+        Args:
+            record: Journal record (``op`` plus its fields)
+            durable: fsync the journal (for critical checkpoints); otherwise the
+                     record survives a process crash but not a host crash
+        """
+        # Held until the record is on disk so a concurrent flush cannot discard
+        # the journal (closing the handle) between numbering and writing it
+        with self._journal_lock:
+            with self._lock:
+                record = {"seq": self.state.get("journal_seq", 0) + 1, "ts": _utc_timestamp(), **record}
+                _apply_journal_record(self.state, record)
+                self.state["journal_seq"] = record["seq"]
+
+            self._ensure_state_dir()
+            if self._journal_handle is None:
+                fd = os.open(self.journal_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, stat.S_IRUSR | stat.S_IWUSR)
+                self._journal_handle = os.fdopen(fd, "a", encoding="utf-8")
+            self._journal_handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._journal_handle.flush()
+            if durable:
+                os.fsync(self._journal_handle.fileno())
+
+            self._journal_records += 1
+            compact = self._journal_records >= STATE_JOURNAL_COMPACT_RECORDS
+        if compact:
+            self.flush_state()
+
+    def _discard_journal(self) -> None:
+        """Remove the journal once a snapshot includes its records."""
+        with self._journal_lock:
+            if self._journal_handle is not None:
+                self._journal_handle.close()
+                self._journal_handle = None
+            self._journal_records = 0
+            try:
+                os.remove(self.journal_file)
+            except FileNotFoundError:
+                pass
 
     def save_state(self) -> None:
-        """Persist current state to disk if dirty."""
+        """Persist current state to disk if dirty.
+
+        With a background writer (``flush_interval`` > 0) the write is deferred
+        and coalesced with other updates made within the interval.
+        """
+        if self.flush_interval > 0:
+            self._schedule_flush()
+            return
+        self._do_flush(force=False)
+
+    def _schedule_flush(self) -> None:
+        """Wake the background writer, starting it on first use."""
+        with self._lock:
+            if self._writer is None and not self._writer_stop.is_set():
+                self._writer = threading.Thread(target=self._writer_loop, name="state-writer", daemon=True)
+                self._writer.start()
+        self._flush_requested.set()
+
+    def _writer_loop(self) -> None:
+        """Background writer: flush dirty state at most once per flush_interval."""
+        while not self._writer_stop.is_set():
+            self._flush_requested.wait()
+            # Coalescing window; returns early when the writer is stopped
+            self._writer_stop.wait(self.flush_interval)
+            self._flush_requested.clear()
+            try:
+                self._do_flush(force=False)
+            except Exception as e:  # Keep writing later updates; close() retries this one
+                logging.warning("Background flush of state file %s failed: %s", self.state_file, e)
+
+    def close(self) -> None:
+        """Stop the background writer and flush pending updates synchronously."""
+        self._writer_stop.set()
+        self._flush_requested.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(STATE_WRITER_STOP_TIMEOUT)
         self._do_flush(force=False)
 
     def flush_state(self) -> None:
@@ -263,19 +480,67 @@ def flush_state(self) -> None:
 
     def set_phase(self, phase: Phase) -> None:
         """Update current phase."""
-        self.state["current_phase"] = phase.value
+        if self.journal:
+            self._append_journal({"op": "phase", "value": phase.value}, durable=True)
+            return
+        with self._lock:
+            self.state["current_phase"] = phase.value
         self.flush_state()  # Phase transitions are critical checkpoints
 
     def mark_step_completed(self, step_name: str) -> None:
         """Mark a step as completed."""
-        if not self.is_step_completed(step_name):
-            self.state["completed_steps"].append({"name": step_name, "timestamp": _utc_timestamp()})
-            self._dirty = True
+        if self.is_step_completed(step_name):
+            return
+        if self.journal:
+            self._append_journal({"op": "step", "name": step_name})
+            self._step_index[step_name] = self.state["completed_steps"][-1]
+        else:
+            entry = {"name": step_name, "timestamp": _utc_timestamp()}
+            with self._lock:
+                self.state["completed_steps"].append(entry)
+                self._step_index[step_name] = entry
+                # Per-item progress is only needed while the step is unfinished
+                (self.state.get("step_progress") or {}).pop(step_name, None)
+                self._dirty = True
             self.save_state()
 
     def is_step_completed(self, step_name: str) -> bool:
         """Check if a step was already completed."""
-        return any(s["name"] == step_name for s in self.state["completed_steps"])
+        return step_name in self._step_index
+
+    def get_completed_step(self, step_name: str) -> Optional[Dict[str, Any]]:
+        """Return the completed-step entry (name and timestamp), or None if not completed."""
+        return self._step_index.get(step_name)
+
+    def are_steps_completed(self, step_names: Iterable[str]) -> Dict[str, bool]:
+        """Return the completion status of many steps at once."""
+        return {name: name in self._step_index for name in step_names}
+
+    def pending_steps(self, step_names: Iterable[str]) -> List[str]:
+        """Return the steps not yet completed, in the given order."""
+        return [name for name in step_names if name not in self._step_index]
+
+    def step_progress(self, step_name: str) -> "StepProgress":
+        """Return the per-item progress tracker of a bulk step.
+
+        Bulk steps (one API call per ManagedCluster) record each processed item
+        so that a resumed run skips them. Progress is dropped when the step is
+        marked completed.
+        """
+        return StepProgress(self, step_name, (self.state.get("step_progress") or {}).get(step_name, []))
+
+    def record_step_progress(self, step_name: str, items: Iterable[str]) -> None:
+        """Persist items processed by a bulk step."""
+        items = sorted(set(items))
+        if not items:
+            return
+        if self.journal:
+            self._append_journal({"op": "progress", "step": step_name, "items": items})
+            return
+        with self._lock:
+            _merge_step_progress(self.state, step_name, items)
+            self._dirty = True
+        self.save_state()
 
     def step(self, step_name: str, logger: Optional[logging.Logger] = None) -> "StepContext":
         """Context manager for idempotent step execution.
@@ -307,8 +572,12 @@ def set_config(self, key: str, value: Any) -> None:
         """Store configuration value."""
         if self.state["config"].get(key) == value:
             return
-        self.state["config"][key] = value
-        self._dirty = True
+        if self.journal:
+            self._append_journal({"op": "config", "key": key, "value": value})
+            return
+        with self._lock:
+            self.state["config"][key] = value
+            self._dirty = True
         self.save_state()
 
     def get_config(self, key: str, default: Any = None) -> Any:
@@ -317,13 +586,18 @@ def get_config(self, key: str, default: Any = None) -> Any:
 
     def add_error(self, error: str, phase: Optional[str] = None) -> None:
         """Record an error."""
-        self.state["errors"].append(
-            {
-                "error": error,
-                "phase": phase or self.state["current_phase"],
-                "timestamp": _utc_timestamp(),
-            }
-        )
+        if self.journal:
+            record = {"op": "error", "error": error, "phase": phase or self.state["current_phase"]}
+            self._append_journal(record, durable=True)  # Errors are critical checkpoints
+            return
+        with self._lock:
+            self.state["errors"].append(
+                {
+                    "error": error,
+                    "phase": phase or self.state["current_phase"],
+                    "timestamp": _utc_timestamp(),
+                }
+            )
         self.flush_state()  # Errors are critical checkpoints
 
     def get_errors(self) -> list:
@@ -351,7 +625,8 @@ def get_last_error_phase(self) -> Optional[Phase]:
 
     def reset(self) -> None:
         """Reset state to initial."""
-        self.state = self._new_state()
+        with self._lock:
+            self.state = self._new_state()
         self.flush_state()  # Reset is a critical checkpoint
 
     def get_current_phase(self) -> Phase:
@@ -425,7 +700,8 @@ def ensure_contexts(self, primary_context: str, secondary_context: Optional[str]
             state_changed = True
 
         if self.state.get("contexts") != desired:
-            self.state["contexts"] = desired
+            with self._lock:
+                self.state["contexts"] = desired
             state_changed = True
 
         if state_changed:
@@ -442,9 +718,43 @@ def _flush_on_signal(self, signum: int, frame: Any) -> None:
             signum: Signal number (SIGTERM or SIGINT)
             frame: Current stack frame (unused)
         """
-        self._do_flush(force=False, suppress_errors=True)
+        self._flush_without_blocking()
         self._forward_signal(signum, frame)
 
+    def _flush_without_blocking(self) -> None:
+        """Flush pending state from a signal handler without waiting on any lock.
+
+        The interrupted thread may hold _journal_lock or _lock while the
+        background writer holds _write_lock and waits for them, so blocking
+        here would hang the process. When a lock is busy, a copy of the state
+        is written without discarding the journal; records the copy already
+        includes are skipped when the journal is replayed on load.
+        """
+        if self._flush_owner == threading.get_ident():
+            return  # Signal handler interrupted this thread's own flush
+
+        held = []
+        try:
+            for lock in (self._write_lock, self._journal_lock, self._lock):
+                if not lock.acquire(blocking=False):
+                    break
+                held.append(lock)
+            else:
+                self._do_flush(force=False, suppress_errors=True)
+                return
+
+            if not self._dirty:
+                return
+            try:
+                self._write_state(copy.deepcopy(self.state))
+            except Exception as e:  # Includes another thread resizing the state mid-copy
+                import sys
+
+                print(f"Error flushing state: {e}", file=sys.stderr)
+        finally:
+            for lock in reversed(held):
+                lock.release()
+
     def _forward_signal(self, signum: int, frame: Any) -> None:
         """Invoke the previous signal handler or restore default behavior."""
         previous = self._previous_signal_handlers.get(signum, signal.SIG_DFL)
@@ -458,6 +768,8 @@ def _forward_signal(self, signum: int, frame: Any) -> None:
 
     def _flush_on_exit(self) -> None:
         """Flush pending state changes on program exit (atexit handler)."""
+        self._writer_stop.set()
+        self._flush_requested.set()
         self._do_flush(force=False, suppress_errors=True)
 
     def _cleanup_temp_files(self) -> None:
@@ -512,6 +824,65 @@ def __exit__(self, exc_type, exc_val, exc_tb) -> Literal[False]:
         return False
 
 
+class StepProgress:
+    """Items already processed by a bulk step, persisted in batches.
+
+    ``add`` is thread-safe, so it can be passed as a per-item success callback
+    to concurrent workers. Items are written every STEP_PROGRESS_FLUSH_ITEMS
+    additions and on ``flush()`` (or leaving the ``with`` block), so a crash
+    loses at most one batch, which the resumed run simply processes again.
+    A tracker without a state manager only keeps progress in memory.
+    """
+
+    def __init__(
+        self,
+        state_manager: Optional["StateManager"],
+        step_name: str,
+        done: Iterable[str] = (),
+        flush_every: int = STEP_PROGRESS_FLUSH_ITEMS,
+    ):
+        self._state = state_manager
+        self.step_name = step_name
+        self.done: Set[str] = set(done)
+        self._pending: List[str] = []
+        self._flush_every = max(1, flush_every)
+        self._lock = threading.Lock()
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.done
+
+    def __len__(self) -> int:
+        return len(self.done)
+
+    def add(self, item: str) -> None:
+        """Record one processed item."""
+        with self._lock:
+            if item in self.done:
+                return
+            self.done.add(item)
+            self._pending.append(item)
+            if len(self._pending) >= self._flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Persist items recorded since the last flush."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        pending, self._pending = self._pending, []
+        if pending and self._state is not None:
+            self._state.record_step_progress(self.step_name, pending)
+
+    def __enter__(self) -> "StepProgress":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> Literal[False]:
+        # Keep what was done even if the step failed part-way
+        self.flush()
+        return False
+
+
 class JSONFormatter(logging.Formatter):
     """Format logs as JSON for structured logging."""
 
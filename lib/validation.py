@@ -17,6 +17,7 @@
 """
 
 import logging
+import math
 import os
 import re
 from typing import Pattern
@@ -386,6 +387,16 @@ def validate_all_cli_args(args: object) -> None:
             if not is_decommission:
                 raise ValidationError("--non-interactive can only be used with --decommission")
 
+        # Validate klusterlet verification concurrency
+        if hasattr(args, "klusterlet_concurrency") and args.klusterlet_concurrency is not None:
+            if args.klusterlet_concurrency < 1:
+                raise ValidationError("--klusterlet-concurrency must be a positive integer")
+
+        # Validate background state flush window
+        if hasattr(args, "state_flush_interval") and args.state_flush_interval is not None:
+            if not math.isfinite(args.state_flush_interval) or args.state_flush_interval < 0:
+                raise ValidationError("--state-flush-interval must be a non-negative number of seconds")
+
         # Validate disable-observability-on-secondary flag
         if hasattr(args, "disable_observability_on_secondary") and args.disable_observability_on_secondary:
             if is_decommission:
@@ -4,9 +4,14 @@
 
 import logging
 import time
-from typing import Callable, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
 
 ConditionFn = Callable[[], Tuple[bool, str]]
+# Opens a watch stream whose server-side timeout is the given number of seconds
+WatchFn = Callable[[int], Iterable[Any]]
+
+# Consecutive watch failures before abandoning the watch for plain polling
+WATCH_MAX_FAILURES = 3
 
 
 def _sanitize_detail(detail: str, max_length: int = 256) -> str:
@@ -26,6 +31,49 @@ def _sanitize_detail(detail: str, max_length: int = 256) -> str:
     return safe
 
 
+def _close_events(events: Optional[Iterator[Any]]) -> None:
+    """Close a watch generator so its HTTP connection is released."""
+    close = getattr(events, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+
+def _next_watch_event(
+    description: str,
+    watch_fn: WatchFn,
+    events: Optional[Iterator[Any]],
+    watch_timeout: int,
+    logger: logging.Logger,
+) -> Tuple[Optional[Iterator[Any]], bool]:
+    """Block until the next watch event arrives or the watch times out.
+
+    Returns:
+        Tuple of (stream to reuse or None to reopen it, whether the watch failed)
+    """
+    opened_at: Optional[float] = None
+    try:
+        if events is None:
+            opened_at = time.monotonic()
+            events = iter(watch_fn(max(1, int(watch_timeout))))
+        next(events)
+        return events, False
+    except StopIteration:
+        if opened_at is not None and time.monotonic() - opened_at < 1:
+            # A fresh watch that closes instantly would spin; treat as a failure
+            logger.debug("%s watch closed immediately; falling back to polling", description)
+            return None, True
+        # Server-side watch timeout: re-evaluate the condition and reopen
+        return None, False
+    except Exception as exc:  # pylint: disable=broad-except
+        # Includes 410 Gone (expired resourceVersion) and connection errors
+        logger.debug("%s watch failed (%s); falling back to polling", description, exc)
+        _close_events(events)
+        return None, True
+
+
 def wait_for_condition(
     description: str,
     condition_fn: ConditionFn,
@@ -35,37 +83,63 @@ def wait_for_condition(
     fast_interval: Optional[int] = None,
     fast_timeout: int = 0,
     allow_success_after_timeout: bool = False,
+    watch_fn: Optional[WatchFn] = None,
     logger: logging.Logger,
 ) -> bool:
-    """Poll until a condition succeeds or timeout expires."""
+    """Poll until a condition succeeds or timeout expires.
+
+    When ``watch_fn`` is provided the wait is event-driven: rather than sleeping
+    a full interval, the condition is re-evaluated as soon as the watch stream
+    delivers an event. Watches are opened with a server-side timeout of at most
+    ``interval`` seconds, so the condition is still resynced once per interval.
+    Watch errors (including 410 Gone) fall back to a regular poll sleep, and
+    after WATCH_MAX_FAILURES consecutive failures the wait degrades to polling.
+    """
 
     start_time = time.time()
     logger.info("Waiting for %s (timeout: %ss)...", description, timeout)
 
-    while time.time() - start_time < timeout:
-        done, detail = condition_fn()
-        safe_detail = _sanitize_detail(detail)
+    events: Optional[Iterator[Any]] = None
+    watch_failures = 0
 
-        if done:
+    try:
+        while time.time() - start_time < timeout:
+            done, detail = condition_fn()
+            safe_detail = _sanitize_detail(detail)
+
+            if done:
+                if safe_detail:
+                    logger.info("%s complete: %s", description, safe_detail)
+                else:
+                    logger.info("%s complete", description)
+                return True
+
+            elapsed = int(time.time() - start_time)
             if safe_detail:
-                logger.info("%s complete: %s", description, safe_detail)
+                logger.debug(
+                    "%s in progress: %s (elapsed: %ss)", description, safe_detail, elapsed
+                )
             else:
-                logger.info("%s complete", description)
-            return True
-
-        elapsed = int(time.time() - start_time)
-        if safe_detail:
-            logger.debug(
-                "%s in progress: %s (elapsed: %ss)", description, safe_detail, elapsed
-            )
-        else:
-            logger.debug("%s in progress (elapsed: %ss)", description, elapsed)
-
-        sleep_interval = interval
-        if fast_interval:
-            if fast_timeout <= 0 or elapsed < fast_timeout:
-                sleep_interval = fast_interval
-        time.sleep(sleep_interval)
+                logger.debug("%s in progress (elapsed: %ss)", description, elapsed)
+
+            sleep_interval = interval
+            if fast_interval:
+                if fast_timeout <= 0 or elapsed < fast_timeout:
+                    sleep_interval = fast_interval
+
+            if watch_fn is not None and watch_failures < WATCH_MAX_FAILURES:
+                events, failed = _next_watch_event(
+                    description, watch_fn, events, min(interval, timeout - elapsed), logger
+                )
+                if not failed:
+                    watch_failures = 0
+                    continue
+                watch_failures += 1
+                if watch_failures >= WATCH_MAX_FAILURES:
+                    logger.debug("%s watch unavailable; polling every %ss", description, sleep_interval)
+            time.sleep(sleep_interval)
+    finally:
+        _close_events(events)
 
     if allow_success_after_timeout:
         done, detail = condition_fn()
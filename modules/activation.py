@@ -6,7 +6,7 @@
 
 import logging
 import time
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
 from kubernetes.client.rest import ApiException
 
@@ -360,12 +360,28 @@ def _poll_restore_deletion():
             interval=RESTORE_POLL_INTERVAL,
             fast_interval=RESTORE_FAST_POLL_INTERVAL,
             fast_timeout=RESTORE_FAST_POLL_TIMEOUT,
+            watch_fn=self._restore_watch(restore_name),
             logger=logger,
         )
 
         if not completed:
             raise FatalError(f"Timeout waiting for restore {restore_name} to be deleted after {timeout}s")
 
+    def _restore_watch(self, restore_name: str) -> Callable[[int], Iterator[Dict]]:
+        """Build a watch_fn that streams events for a single ACM restore."""
+
+        def _watch(watch_timeout: int) -> Iterator[Dict]:
+            return self.secondary.watch_custom_resources(
+                group="cluster.open-cluster-management.io",
+                version="v1beta1",
+                plural="restores",
+                namespace=BACKUP_NAMESPACE,
+                name=restore_name,
+                timeout_seconds=watch_timeout,
+            )
+
+        return _watch
+
     def _get_restore_or_raise(self, restore_name: str) -> Dict:
         """Fetch restore resource or raise a fatal error if missing."""
         restore = self.secondary.get_custom_resource(
@@ -615,65 +631,57 @@ def _apply_immediate_import_annotations(self) -> None:
             logger.info("No non-local ManagedClusters found; skipping immediate-import annotations")
             return
 
-        updated = 0
-        failures = []
+        # Clusters annotated by an interrupted earlier run are skipped on resume
+        progress = self.state.step_progress("apply_immediate_import_annotations")
+        patches = {}
         for mc in non_local_clusters:
             name = mc.get("metadata", {}).get("name")
-            if not name:
+            if not name or name in progress:
                 continue
             annotations = mc.get("metadata", {}).get("annotations", {}) or {}
             annotation_value = annotations.get(IMMEDIATE_IMPORT_ANNOTATION)
             if annotation_value == "":
                 continue
-            if self._reset_immediate_import_annotation(name, annotation_value):
-                updated += 1
-            else:
-                failures.append(name)
+            patches[name] = self._immediate_import_patches(name, annotation_value)
 
-        if updated:
-            logger.info("Applied immediate-import annotations to %s ManagedCluster(s)", updated)
-        elif not failures:
+        if not patches:
             logger.info("All ManagedClusters already had immediate-import annotations")
+            return
+
+        # Patch concurrently (bounded pool + client-side rate limit)
+        with progress:
+            result = self.secondary.bulk_patch_managed_clusters(
+                patches, on_success=None if self.secondary.dry_run else progress.add
+            )
+
+        for name, error in sorted(result.failed.items()):
+            logger.warning("Failed to annotate %s with immediate-import: %s", name, error)
+
+        if result.succeeded:
+            logger.info("Applied immediate-import annotations to %s ManagedCluster(s)", len(result.succeeded))
 
-        if failures:
+        if result.failed:
             message = (
                 "Failed to update immediate-import annotation on "
-                f"{len(failures)} ManagedCluster(s): {', '.join(sorted(failures))}"
+                f"{len(result.failed)} ManagedCluster(s): {', '.join(sorted(result.failed))}"
             )
             logger.warning(message)
             raise FatalError(message)
 
-    def _reset_immediate_import_annotation(self, cluster_name: str, current_value: Optional[str]) -> bool:
-        """Ensure the immediate-import annotation is set to empty string for the given cluster."""
-        try:
-            if current_value not in (None, ""):
-                logger.debug(
-                    "Clearing existing immediate-import annotation value '%s' on %s",
-                    current_value,
-                    cluster_name,
-                )
-                # Remove the annotation first so the controller can re-process it
-                self.secondary.patch_managed_cluster(
-                    name=cluster_name,
-                    patch={"metadata": {"annotations": {IMMEDIATE_IMPORT_ANNOTATION: None}}},
-                )
-
-            self.secondary.patch_managed_cluster(
-                name=cluster_name,
-                patch={"metadata": {"annotations": {IMMEDIATE_IMPORT_ANNOTATION: ""}}},
-            )
-            return True
-        except ApiException as exc:
-            logger.warning(
-                "Failed to annotate %s with immediate-import (status=%s): %s",
+    @staticmethod
+    def _immediate_import_patches(cluster_name: str, current_value: Optional[str]) -> List[Dict]:
+        """Build the patches that set the immediate-import annotation to empty string."""
+        patches: List[Dict] = []
+        if current_value not in (None, ""):
+            logger.debug(
+                "Clearing existing immediate-import annotation value '%s' on %s",
+                current_value,
                 cluster_name,
-                getattr(exc, "status", "unknown"),
-                exc,
             )
-            return False
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.warning("Failed to annotate %s with immediate-import: %s", cluster_name, exc)
-            return False
+            # Remove the annotation first so the controller can re-process it
+            patches.append({"metadata": {"annotations": {IMMEDIATE_IMPORT_ANNOTATION: None}}})
+        patches.append({"metadata": {"annotations": {IMMEDIATE_IMPORT_ANNOTATION: ""}}})
+        return patches
 
     def _create_full_restore(self):
         """Create full restore resource (Method 2)."""
@@ -772,6 +780,7 @@ def _poll_restore():
             interval=RESTORE_POLL_INTERVAL,
             fast_interval=RESTORE_FAST_POLL_INTERVAL,
             fast_timeout=RESTORE_FAST_POLL_TIMEOUT,
+            watch_fn=self._restore_watch(restore_name),
             logger=logger,
         )
 
@@ -853,6 +862,13 @@ def _poll_velero_restore():
             interval=RESTORE_POLL_INTERVAL,
             fast_interval=RESTORE_FAST_POLL_INTERVAL,
             fast_timeout=RESTORE_FAST_POLL_TIMEOUT,
+            watch_fn=lambda watch_timeout: self.secondary.watch_custom_resources(
+                group="velero.io",
+                version="v1",
+                plural="restores",
+                namespace=BACKUP_NAMESPACE,
+                timeout_seconds=watch_timeout,
+            ),
             logger=logger,
         )
 
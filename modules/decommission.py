@@ -5,6 +5,12 @@
 # Runbook: Step 14 (decommission) and Rollback references where applicable
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Set
+
+from kubernetes.client.rest import ApiException
 
 from lib.constants import (
     ACM_NAMESPACE,
@@ -13,20 +19,74 @@
     DECOMMISSION_POD_TIMEOUT,
     DELETE_REQUEST_TIMEOUT,
     LOCAL_CLUSTER_NAME,
+    MANAGED_CLUSTER_DELETE_BURST,
     MANAGED_CLUSTER_DELETE_INTERVAL,
+    MANAGED_CLUSTER_DELETE_MAX_WORKERS,
+    MANAGED_CLUSTER_DELETE_QPS,
     MANAGED_CLUSTER_DELETE_TIMEOUT,
     OBSERVABILITY_NAMESPACE,
     OBSERVABILITY_TERMINATE_INTERVAL,
     OBSERVABILITY_TERMINATE_TIMEOUT,
 )
 from lib.exceptions import SwitchoverError
+from lib.informer import HTTP_FATAL_STATUSES
 from lib.kube_client import KubeClient
-from lib.utils import confirm_action
-from lib.waiter import wait_for_condition
+from lib.rate_limiter import TokenBucket
+from lib.utils import confirm_action, format_duration
+from lib.waiter import WATCH_MAX_FAILURES, wait_for_condition
 
 logger = logging.getLogger("acm_switchover")
 
 
+class _RemovalProgress:
+    """Remaining ManagedClusters of a bulk deletion, with rate and ETA reporting."""
+
+    def __init__(self, names: Iterable[str], interval: float = MANAGED_CLUSTER_DELETE_INTERVAL) -> None:
+        self.remaining: Set[str] = set(names)
+        self.removed_count = 0
+        self.interval = interval
+        self._start = time.monotonic()
+        self._last_log = self._start
+
+    def removed(self, name: str) -> None:
+        if name in self.remaining:
+            self.remaining.discard(name)
+            self.removed_count += 1
+            self.report()
+
+    def added(self, name: str) -> None:
+        self.remaining.add(name)
+
+    def resync(self, names: Iterable[str]) -> None:
+        """Replace the remaining set with a fresh list (names missing from it were removed)."""
+        current = set(names)
+        self.removed_count += len(self.remaining - current)
+        self.remaining = current
+
+    def report(self, force: bool = False) -> None:
+        """Log the remaining count, removal rate and ETA at most once per interval."""
+        now = time.monotonic()
+        if not force and now - self._last_log < self.interval:
+            return
+        self._last_log = now
+        elapsed = now - self._start
+        rate = self.removed_count / elapsed if elapsed > 0 else 0.0
+        if not self.remaining:
+            eta = "done"
+        elif rate > 0:
+            eta = format_duration(len(self.remaining) / rate)
+        else:
+            eta = "unknown"
+        logger.info(
+            "ManagedCluster removal: %d remaining, %d removed in %s (%.1f/s, ETA %s)",
+            len(self.remaining),
+            self.removed_count,
+            format_duration(elapsed),
+            rate,
+            eta,
+        )
+
+
 class Decommission:
     """Handles decommissioning of old primary hub."""
 
@@ -143,6 +203,9 @@ def _observability_terminated():
             _observability_terminated,
             timeout=OBSERVABILITY_TERMINATE_TIMEOUT,
             interval=OBSERVABILITY_TERMINATE_INTERVAL,
+            watch_fn=lambda watch_timeout: self.primary.watch_pods(
+                OBSERVABILITY_NAMESPACE, timeout_seconds=watch_timeout
+            ),
             logger=logger,
         )
 
@@ -153,16 +216,27 @@ def _observability_terminated():
             )
 
     def _delete_managed_clusters(self):
-        """Delete ManagedCluster resources (excluding local-cluster)."""
+        """Delete ManagedCluster resources (excluding local-cluster).
+
+        Clusters are deleted concurrently with client-side rate limiting. The
+        list taken before deleting provides the resourceVersion of a watch whose
+        DELETED events shrink the set of clusters still waiting on finalizers.
+        """
         logger.info("Deleting ManagedCluster resources...")
 
-        managed_clusters = self.primary.list_managed_clusters()
+        managed_clusters, resource_version = self.primary.list_custom_resources_with_version(
+            group="cluster.open-cluster-management.io",
+            version="v1",
+            plural="managedclusters",
+            metadata_only=True,
+        )
 
         if not managed_clusters:
             logger.info("No ManagedClusters found")
             return
 
-        deleted_count = 0
+        to_delete = []
+        terminating = []
         for mc in managed_clusters:
             mc_name = mc.get("metadata", {}).get("name")
 
@@ -171,52 +245,38 @@ def _delete_managed_clusters(self):
                 logger.info("Skipping local-cluster")
                 continue
 
-            if self.dry_run:
-                logger.info("[DRY-RUN] Would delete ManagedCluster: %s", mc_name)
-                deleted_count += 1
+            # Deleted by an interrupted earlier run; only the finalizers are left
+            if mc.get("metadata", {}).get("deletionTimestamp"):
+                logger.debug("ManagedCluster %s is already being deleted", mc_name)
+                terminating.append(mc_name)
                 continue
 
-            logger.info("Deleting ManagedCluster: %s", mc_name)
-
-            self.primary.delete_custom_resource(
-                group="cluster.open-cluster-management.io",
-                version="v1",
-                plural="managedclusters",
-                name=mc_name,
-                timeout_seconds=DELETE_REQUEST_TIMEOUT,
-            )
-
-            deleted_count += 1
+            to_delete.append(mc_name)
 
         if self.dry_run:
-            logger.info("[DRY-RUN] Would delete %s ManagedCluster(s)", deleted_count)
+            for mc_name in to_delete:
+                logger.info("[DRY-RUN] Would delete ManagedCluster: %s", mc_name)
+            logger.info("[DRY-RUN] Would delete %s ManagedCluster(s)", len(to_delete))
+        elif to_delete:
+            failed = self._delete_managed_cluster_batch(to_delete)
+            if failed:
+                names = sorted(failed)
+                raise SwitchoverError(
+                    f"Failed to delete {len(failed)} ManagedCluster(s) "
+                    f"(e.g. {names[0]}: {failed[names[0]]}). Cannot proceed with MultiClusterHub deletion."
+                )
         else:
-            logger.info("Deleted %s ManagedCluster(s)", deleted_count)
+            logger.info("Deleted 0 ManagedCluster(s)")
+        if terminating:
+            logger.info("%s ManagedCluster(s) were already being deleted", len(terminating))
 
         # Wait for ManagedClusters to be fully removed (finalizers to complete)
         # This is required before MCH deletion because the MCH admission webhook
         # rejects deletion when ManagedCluster resources still exist
-        if deleted_count > 0 and not self.dry_run:
+        if (to_delete or terminating) and not self.dry_run:
             logger.info("Waiting for ManagedCluster finalizers to complete...")
 
-            def _managed_clusters_removed():
-                remaining = self.primary.list_managed_clusters()
-                # Filter out local-cluster
-                non_local = [mc for mc in remaining if mc.get("metadata", {}).get("name") != LOCAL_CLUSTER_NAME]
-                if not non_local:
-                    return True, "all ManagedClusters removed (except local-cluster)"
-                names = [mc.get("metadata", {}).get("name") for mc in non_local]
-                return False, f"{len(non_local)} ManagedCluster(s) remaining: {', '.join(names)}"
-
-            success = wait_for_condition(
-                "ManagedCluster removal",
-                _managed_clusters_removed,
-                timeout=MANAGED_CLUSTER_DELETE_TIMEOUT,
-                interval=MANAGED_CLUSTER_DELETE_INTERVAL,
-                logger=logger,
-            )
-
-            if not success:
+            if not self._wait_for_managed_clusters_removed(to_delete + terminating, resource_version):
                 raise SwitchoverError(
                     f"ManagedClusters not fully removed after {MANAGED_CLUSTER_DELETE_TIMEOUT}s. "
                     "Cannot proceed with MultiClusterHub deletion."
@@ -229,6 +289,152 @@ def _managed_clusters_removed():
             "so underlying cluster infrastructure will not be affected."
         )
 
+    def _delete_managed_cluster_batch(self, names: List[str]) -> Dict[str, str]:
+        """Delete ManagedClusters over a bounded worker pool with a shared token bucket.
+
+        A failure on one cluster does not stop the others.
+
+        Returns:
+            Error message per ManagedCluster that could not be deleted
+        """
+        limiter = TokenBucket(MANAGED_CLUSTER_DELETE_QPS, MANAGED_CLUSTER_DELETE_BURST)
+        failed: Dict[str, str] = {}
+        lock = threading.Lock()
+
+        def _delete_one(mc_name: str) -> None:
+            limiter.acquire()
+            logger.debug("Deleting ManagedCluster: %s", mc_name)
+            try:
+                self.primary.delete_custom_resource(
+                    group="cluster.open-cluster-management.io",
+                    version="v1",
+                    plural="managedclusters",
+                    name=mc_name,
+                    timeout_seconds=DELETE_REQUEST_TIMEOUT,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug("Deleting ManagedCluster %s failed: %s", mc_name, e)
+                with lock:
+                    failed[mc_name] = str(e)
+
+        start = time.monotonic()
+        workers = max(1, min(MANAGED_CLUSTER_DELETE_MAX_WORKERS, len(names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in as_completed([executor.submit(_delete_one, mc_name) for mc_name in names]):
+                future.result()
+        elapsed = time.monotonic() - start
+
+        logger.info(
+            "Deleted %d/%d ManagedCluster(s) in %.1fs (%.1f requests/s, %d worker(s))",
+            len(names) - len(failed),
+            len(names),
+            elapsed,
+            len(names) / elapsed if elapsed > 0 else float(len(names)),
+            workers,
+        )
+        return failed
+
+    def _wait_for_managed_clusters_removed(
+        self, names: List[str], resource_version: str, timeout: int = MANAGED_CLUSTER_DELETE_TIMEOUT
+    ) -> bool:
+        """Wait until no ManagedCluster other than local-cluster remains.
+
+        Watches from resource_version, re-opening the watch every
+        MANAGED_CLUSTER_DELETE_INTERVAL seconds from the last resourceVersion
+        seen so progress is reported even when no cluster is removed. A failed
+        watch (including 410 Gone) is resynced with a metadata-only list; after
+        WATCH_MAX_FAILURES consecutive failures, or at once when the watch is
+        rejected with 401/403, this polls the list instead.
+
+        Returns:
+            True if every ManagedCluster was removed within the timeout
+        """
+        progress = _RemovalProgress(names)
+        deadline = time.monotonic() + timeout
+        watch_failures = 0
+
+        while progress.remaining and time.monotonic() < deadline:
+            if resource_version and watch_failures < WATCH_MAX_FAILURES:
+                opened_at = time.monotonic()
+                try:
+                    resource_version = self._watch_managed_cluster_removals(progress, resource_version, deadline)
+                except Exception as exc:  # pylint: disable=broad-except
+                    if isinstance(exc, ApiException) and exc.status in HTTP_FATAL_STATUSES:
+                        # Retrying cannot fix missing credentials or watch permission
+                        logger.warning(
+                            "ManagedCluster watch denied (HTTP %s); polling every %ss instead",
+                            exc.status,
+                            MANAGED_CLUSTER_DELETE_INTERVAL,
+                        )
+                        watch_failures = WATCH_MAX_FAILURES
+                        continue  # Nothing changed since the last list; poll after the interval
+                    # Includes 410 Gone (expired resourceVersion); re-list below to resync
+                    logger.debug("ManagedCluster watch failed (%s); re-listing ManagedClusters", exc)
+                    watch_failures += 1
+                else:
+                    if not progress.remaining:
+                        break
+                    if time.monotonic() - opened_at >= 1:
+                        # Server-side watch timeout: resume from the last resourceVersion seen
+                        watch_failures = 0
+                        progress.report()
+                        continue
+                    # A watch that closes immediately would spin
+                    watch_failures += 1
+            else:
+                time.sleep(max(0.0, min(MANAGED_CLUSTER_DELETE_INTERVAL, deadline - time.monotonic())))
+
+            managed_clusters, resource_version = self.primary.list_custom_resources_with_version(
+                group="cluster.open-cluster-management.io",
+                version="v1",
+                plural="managedclusters",
+                metadata_only=True,
+            )
+            progress.resync(
+                mc.get("metadata", {}).get("name")
+                for mc in managed_clusters
+                if mc.get("metadata", {}).get("name") != LOCAL_CLUSTER_NAME
+            )
+            progress.report()
+
+        progress.report(force=True)
+        return not progress.remaining
+
+    def _watch_managed_cluster_removals(
+        self, progress: "_RemovalProgress", resource_version: str, deadline: float
+    ) -> str:
+        """Apply ManagedCluster watch events after resource_version to the remaining set.
+
+        Returns:
+            resourceVersion to resume from
+        """
+        timeout = max(1, min(MANAGED_CLUSTER_DELETE_INTERVAL, int(deadline - time.monotonic())))
+        events = self.primary.watch_custom_resources(
+            group="cluster.open-cluster-management.io",
+            version="v1",
+            plural="managedclusters",
+            resource_version=resource_version,
+            timeout_seconds=timeout,
+        )
+        try:
+            for event in events:
+                metadata = (event.get("object") or {}).get("metadata", {})
+                resource_version = metadata.get("resourceVersion") or resource_version
+                mc_name = metadata.get("name")
+                if mc_name and mc_name != LOCAL_CLUSTER_NAME:
+                    if event.get("type") == "DELETED":
+                        progress.removed(mc_name)
+                    elif event.get("type") == "ADDED":
+                        # Recreated (e.g. re-imported); MCH deletion is rejected while it exists
+                        progress.added(mc_name)
+                if not progress.remaining or time.monotonic() >= deadline:
+                    break
+        finally:
+            close = getattr(events, "close", None)
+            if callable(close):
+                close()
+        return resource_version
+
     def _delete_multiclusterhub(self):
         """Delete MultiClusterHub resource."""
         logger.info("Deleting MultiClusterHub resource...")
@@ -292,6 +498,7 @@ def _acm_pods_removed():
             _acm_pods_removed,
             timeout=DECOMMISSION_POD_TIMEOUT,
             interval=DECOMMISSION_POD_INTERVAL,
+            watch_fn=lambda watch_timeout: self.primary.watch_pods(ACM_NAMESPACE, timeout_seconds=watch_timeout),
             logger=logger,
         )
 
@@ -5,9 +5,11 @@
 # Runbook: Steps 11-12 (finalization) and Step 14 (old hub handling)
 
 import logging
+import math
+import re
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from kubernetes.client.rest import ApiException
 
@@ -22,6 +24,7 @@
     BACKUP_SCHEDULE_DEFAULT_NAME,
     BACKUP_SCHEDULE_DELETE_WAIT,
     BACKUP_VERIFY_TIMEOUT,
+    BACKUP_WATCH_TIMEOUT,
     DELETE_REQUEST_TIMEOUT,
     IMPORT_CONTROLLER_CONFIG_CM,
     LOCAL_CLUSTER_NAME,
@@ -38,17 +41,22 @@
     THANOS_COMPACTOR_STATEFULSET,
     VELERO_BACKUP_LATEST,
     VELERO_BACKUP_SKIP,
+    VELERO_LOG_LOOKBACK_MARGIN,
+    VELERO_LOG_TAIL_LINES,
 )
 from lib.exceptions import SwitchoverError
 from lib.kube_client import KubeClient
 from lib.utils import StateManager, dry_run_skip, is_acm_version_ge
-from lib.waiter import wait_for_condition
+from lib.waiter import WATCH_MAX_FAILURES, wait_for_condition
 
 from .backup_schedule import BackupScheduleManager
 from .decommission import Decommission
 
 logger = logging.getLogger("acm_switchover")
 
+# Velero log lines that report a problem (matched case-insensitively)
+_VELERO_LOG_ERROR_PATTERN = re.compile(r"error|failed", re.IGNORECASE)
+
 
 class Finalization:
     """Handles finalization steps on secondary hub."""
@@ -273,67 +281,149 @@ def _verify_new_backups(self, timeout: int = BACKUP_VERIFY_TIMEOUT):
         """
         Verify new backups are being created.
 
+        Backups are listed once, then watched from that list's resourceVersion so
+        the first new backup in an accepted phase is detected as soon as it is
+        created or updated. When the watch fails (including 410 Gone), backups are
+        re-listed to resync; after repeated failures this falls back to polling
+        every BACKUP_POLL_INTERVAL.
+
         Args:
             timeout: Maximum wait time in seconds
         """
 
         logger.info("Verifying new backups are being created...")
 
-        # Get current backup list (Velero Backups use velero.io/v1)
-        initial_backups = self.secondary.list_custom_resources(
+        # List the current backups (Velero Backups use velero.io/v1); only names are
+        # retained, so request metadata only and skip the (large) Backup statuses
+        backups, resource_version = self.secondary.list_custom_resources_with_version(
             group="velero.io",
             version="v1",
             plural="backups",
             namespace=BACKUP_NAMESPACE,
+            metadata_only=True,
         )
+        initial_backup_names = {b.get("metadata", {}).get("name") for b in backups}
 
-        initial_backup_names = {b.get("metadata", {}).get("name") for b in initial_backups}
-
-        logger.info("Found %s existing backup(s)", len(initial_backups))
+        logger.info("Found %s existing backup(s)", len(initial_backup_names))
         logger.info("Waiting for new backup to appear (timeout: %ss)...", timeout)
 
         start_time = time.time()
+        deadline = start_time + timeout
+        watch_failures = 0
+
+        while time.time() < deadline:
+            if resource_version and watch_failures < WATCH_MAX_FAILURES:
+                opened_at = time.time()
+                try:
+                    detected, resource_version = self._watch_for_new_backup(
+                        initial_backup_names, resource_version, deadline
+                    )
+                except Exception as exc:  # pylint: disable=broad-except
+                    # Includes 410 Gone (expired resourceVersion); re-list below to resync
+                    logger.debug("Backup watch failed (%s); re-listing backups", exc)
+                    watch_failures += 1
+                else:
+                    if detected:
+                        return
+                    if time.time() - opened_at >= 1:
+                        # Server-side watch timeout: resume from the last resourceVersion seen
+                        watch_failures = 0
+                        continue
+                    # A watch that closes immediately would spin
+                    watch_failures += 1
+            else:
+                elapsed = int(time.time() - start_time)
+                logger.debug("Waiting for new backup... (elapsed: %ss)", elapsed)
+                time.sleep(BACKUP_POLL_INTERVAL)
 
-        while time.time() - start_time < timeout:
-            current_backups = self.secondary.list_custom_resources(
-                group="velero.io",
-                version="v1",
-                plural="backups",
-                namespace=BACKUP_NAMESPACE,
-            )
+            detected, resource_version = self._poll_for_new_backup(initial_backup_names)
+            if detected:
+                return
 
-            current_backup_names = {b.get("metadata", {}).get("name") for b in current_backups}
+        logger.warning(
+            f"No new backups detected after {timeout}s. " "BackupSchedule may take time to create first backup."
+        )
 
-            # Check for new backups
-            new_backups = current_backup_names - initial_backup_names
+    def _watch_for_new_backup(
+        self, initial_backup_names: Set[str], resource_version: str, deadline: float
+    ) -> Tuple[bool, str]:
+        """Watch backups after resource_version until a new one reaches an accepted phase.
 
-            if new_backups:
-                logger.info("New backup(s) detected: %s", ", ".join(new_backups))
+        Returns:
+            Tuple of (whether a new backup was detected, resourceVersion to resume from)
+        """
+        events = self.secondary.watch_custom_resources(
+            group="velero.io",
+            version="v1",
+            plural="backups",
+            namespace=BACKUP_NAMESPACE,
+            resource_version=resource_version,
+            timeout_seconds=max(1, min(BACKUP_WATCH_TIMEOUT, int(deadline - time.time()))),
+        )
+        try:
+            for event in events:
+                backup = event.get("object") or {}
+                metadata = backup.get("metadata", {})
+                resource_version = metadata.get("resourceVersion") or resource_version
+                backup_name = metadata.get("name")
+                # New backups usually appear without a status; their phase arrives in later MODIFIED events
+                if event.get("type") == "DELETED" or backup_name in initial_backup_names:
+                    continue
+                if self._is_new_backup_accepted(backup_name, backup.get("status", {}).get("phase", "unknown")):
+                    return True, resource_version
+                if time.time() >= deadline:
+                    break
+        finally:
+            close = getattr(events, "close", None)
+            if callable(close):
+                close()
+        return False, resource_version
 
-                # Verify at least one is in progress or completed
-                for backup_name in new_backups:
-                    backup = next(
-                        (b for b in current_backups if b.get("metadata", {}).get("name") == backup_name),
-                        None,
-                    )
+    def _poll_for_new_backup(self, initial_backup_names: Set[str]) -> Tuple[bool, str]:
+        """List backups once and check any new ones (resync after a failed watch).
 
-                    if backup:
-                        phase = backup.get("status", {}).get("phase", "unknown")
-                        logger.info("Backup %s phase: %s", backup_name, phase)
+        Returns:
+            Tuple of (whether a new backup was detected, resourceVersion of the list)
+        """
+        backups, resource_version = self.secondary.list_custom_resources_with_version(
+            group="velero.io",
+            version="v1",
+            plural="backups",
+            namespace=BACKUP_NAMESPACE,
+            metadata_only=True,
+        )
+        new_backups = []
+        for backup in backups:
+            backup_name = backup.get("metadata", {}).get("name")
+            if backup_name in initial_backup_names:
+                continue
+            # Only new backups need a full read to inspect their phase
+            full_backup = self.secondary.get_custom_resource(
+                group="velero.io",
+                version="v1",
+                plural="backups",
+                name=backup_name,
+                namespace=BACKUP_NAMESPACE,
+            )
+            if full_backup is None:
+                continue
+            new_backups.append((backup_name, full_backup.get("status", {}).get("phase", "unknown")))
 
-                        # Velero uses "InProgress" and "Completed" phases
-                        if phase in ("InProgress", "Completed", "New"):
-                            self.state.set_config("new_backup_detected", True)
-                            logger.info("New backup is being created successfully!")
-                            return
+        if new_backups:
+            logger.info("New backup(s) detected: %s", ", ".join(name for name, _ in new_backups))
+        detected = any(self._is_new_backup_accepted(name, phase) for name, phase in new_backups)
+        return detected, resource_version
 
-            elapsed = int(time.time() - start_time)
-            logger.debug("Waiting for new backup... (elapsed: %ss)", elapsed)
-            time.sleep(BACKUP_POLL_INTERVAL)
+    def _is_new_backup_accepted(self, backup_name: str, phase: str) -> bool:
+        """Record and report a new backup that is in progress or completed."""
+        logger.info("Backup %s phase: %s", backup_name, phase)
 
-        logger.warning(
-            f"No new backups detected after {timeout}s. " "BackupSchedule may take time to create first backup."
-        )
+        # Velero uses "InProgress" and "Completed" phases
+        if phase not in ("InProgress", "Completed", "New"):
+            return False
+        self.state.set_config("new_backup_detected", True)
+        logger.info("New backup is being created successfully!")
+        return True
 
     def _get_backup_verify_timeout(self) -> int:
         """Derive backup verification timeout from BackupSchedule cadence."""
@@ -461,8 +551,20 @@ def _is_number(field: str) -> bool:
 
         return None
 
-    def _check_velero_logs_for_backup(self, backup_name: str, tail_lines: int = 2000) -> None:
-        """Scan recent Velero logs for errors related to a backup."""
+    def _check_velero_logs_for_backup(
+        self,
+        backup_name: str,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        tail_lines: int = VELERO_LOG_TAIL_LINES,
+    ) -> None:
+        """Scan Velero logs for errors related to a backup.
+
+        When the backup start time is known, only logs written since then
+        (less VELERO_LOG_LOOKBACK_MARGIN) are requested, and reading stops at
+        the first line timestamped after completion plus the same margin.
+        Otherwise the last tail_lines lines are scanned.
+        """
         try:
             velero_pods = self.secondary.get_pods(
                 namespace=BACKUP_NAMESPACE,
@@ -476,33 +578,44 @@ def _check_velero_logs_for_backup(self, backup_name: str, tail_lines: int = 2000
             logger.warning("No Velero pods found for log inspection")
             return
 
+        log_window: Dict[str, Any] = {"tail_lines": tail_lines}
+        if started_at:
+            elapsed = (datetime.now(timezone.utc) - started_at).total_seconds()
+            log_window = {"since_seconds": max(1, math.ceil(elapsed)) + VELERO_LOG_LOOKBACK_MARGIN}
+        # Kubelet timestamps are UTC RFC3339(Nano); their seconds prefix orders as a string
+        stop_after = None
+        if started_at and completed_at:
+            cutoff = completed_at + timedelta(seconds=VELERO_LOG_LOOKBACK_MARGIN)
+            stop_after = cutoff.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            log_window["timestamps"] = True
+
+        backup_pattern = re.compile(re.escape(backup_name))
         error_hits = 0
         for pod in velero_pods:
             pod_name = pod.get("metadata", {}).get("name")
             if not pod_name:
                 continue
+            error_lines = 0
             try:
-                logs = self.secondary.get_pod_logs(
+                for line in self.secondary.iter_pod_log_lines(
                     name=pod_name,
                     namespace=BACKUP_NAMESPACE,
                     container="velero",
-                    tail_lines=tail_lines,
-                )
+                    **log_window,
+                ):
+                    if stop_after and line[:19] > stop_after:
+                        break
+                    if backup_pattern.search(line) and _VELERO_LOG_ERROR_PATTERN.search(line):
+                        error_lines += 1
             except Exception as e:
                 logger.warning("Unable to read Velero logs from %s: %s", pod_name, e)
-                continue
-
-            if not logs:
-                continue
 
-            lines = [line for line in logs.splitlines() if backup_name in line]
-            error_lines = [line for line in lines if "error" in line.lower() or "failed" in line.lower()]
             if error_lines:
-                error_hits += len(error_lines)
+                error_hits += error_lines
                 logger.warning(
                     "Velero logs from %s show %s error line(s) for backup %s",
                     pod_name,
-                    len(error_lines),
+                    error_lines,
                     backup_name,
                 )
 
@@ -518,20 +631,13 @@ def _verify_backup_integrity(self, max_age_seconds: int = BACKUP_INTEGRITY_MAX_A
         logger.info("Verifying backup integrity...")
         effective_max_age_seconds = self._get_backup_max_age_seconds(max_age_seconds)
 
-        backups = self.secondary.list_custom_resources(
-            group="velero.io",
-            version="v1",
-            plural="backups",
-            namespace=BACKUP_NAMESPACE,
-        )
+        # Only the newest Backup is fetched in full, not the whole retained history
+        backups = self.secondary.get_latest_velero_backups(namespace=BACKUP_NAMESPACE)
 
         if not backups:
             raise SwitchoverError("No Velero backups found for integrity verification")
 
-        def _backup_sort_key(backup: Dict) -> str:
-            return backup.get("metadata", {}).get("creationTimestamp", "") or ""
-
-        latest_backup = max(backups, key=_backup_sort_key)
+        latest_backup = backups[0]
         backup_name = latest_backup.get("metadata", {}).get("name", "unknown")
         status = latest_backup.get("status", {}) or {}
 
@@ -632,7 +738,12 @@ def _poll_backup_completion() -> Tuple[bool, str]:
                     )
                 logger.info("Latest backup %s completed %ss ago", backup_name, age_seconds)
 
-        self._check_velero_logs_for_backup(backup_name)
+        started_at = self._parse_timestamp(status.get("startTimestamp")) or self._parse_timestamp(creation_ts)
+        self._check_velero_logs_for_backup(
+            backup_name,
+            started_at=started_at,
+            completed_at=self._parse_timestamp(status.get("completionTimestamp")),
+        )
 
     def _get_backup_schedules(self, force_refresh: bool = False) -> List[Dict]:
         """Get backup schedules with caching.
@@ -829,6 +940,9 @@ def _observability_terminated():
             _observability_terminated,
             timeout=OBSERVABILITY_TERMINATE_TIMEOUT,
             interval=OBSERVABILITY_TERMINATE_INTERVAL,
+            watch_fn=lambda watch_timeout: self.primary.watch_pods(
+                OBSERVABILITY_NAMESPACE, timeout_seconds=watch_timeout
+            ),
             logger=logger,
         )
 
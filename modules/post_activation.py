@@ -6,25 +6,26 @@
 
 import base64
 import logging
-import os
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
+from lib.api_client_pool import ApiClientPool
+from lib.async_runner import run_bounded
 from lib.constants import (
     CLUSTER_VERIFY_INTERVAL,
     CLUSTER_VERIFY_MAX_WORKERS,
     CLUSTER_VERIFY_TIMEOUT,
-    DEFAULT_KUBECONFIG_SIZE,
     DISABLE_AUTO_IMPORT_ANNOTATION,
     INITIAL_CLUSTER_WAIT_TIMEOUT,
+    KLUSTERLET_CHECK_TIMEOUT,
+    KLUSTERLET_VERIFY_CONCURRENCY,
     LOCAL_CLUSTER_NAME,
     MANAGED_CLUSTER_AGENT_NAMESPACE,
-    MAX_KUBECONFIG_SIZE,
     OBSERVABILITY_NAMESPACE,
     OBSERVABILITY_POD_TIMEOUT,
     OBSERVATORIUM_API_DEPLOYMENT,
@@ -36,7 +37,8 @@
 )
 from lib.exceptions import SwitchoverError
 from lib.kube_client import KubeClient
-from lib.utils import StateManager, dry_run_skip
+from lib.kubeconfig_store import KubeconfigIndex, get_kubeconfig_store
+from lib.utils import StateManager, StepProgress, dry_run_skip
 from lib.waiter import wait_for_condition
 
 logger = logging.getLogger("acm_switchover")
@@ -51,16 +53,21 @@ def __init__(
         state_manager: StateManager,
         has_observability: bool,
         dry_run: bool = False,
+        klusterlet_concurrency: int = KLUSTERLET_VERIFY_CONCURRENCY,
     ):
         self.secondary = secondary_client
         self.state = state_manager
         self.has_observability = has_observability
         self.dry_run = dry_run
+        # Maximum spoke klusterlet checks in flight at once
+        self.klusterlet_concurrency = max(1, klusterlet_concurrency)
         self._cached_managed_clusters: Optional[List[Dict]] = None  # Cache for managed clusters
-        # Kubeconfig caching to reduce repeated file I/O (findings #10)
-        self._kubeconfig_cache: Optional[Dict] = None
-        self._kubeconfig_paths: List[str] = []
-        self._kubeconfig_mtime: Dict[str, float] = {}
+        # Last kubeconfig index seen; a new one means the files changed (findings #10)
+        self._kubeconfig_index: Optional[KubeconfigIndex] = None
+        # Per-context ApiClients for managed clusters, shared by klusterlet worker threads
+        self._api_client_pool = ApiClientPool()
+        # Kubeconfig data loaded once per klusterlet fan-out; worker threads only read it
+        self._spoke_kubeconfig_data: Optional[dict] = None
 
     def _get_managed_clusters(self, force_refresh: bool = False) -> List[Dict]:
         """Get managed clusters with caching.
@@ -112,6 +119,9 @@ def verify(self) -> bool:
             logger.error("Unexpected error during post-activation verification: %s", e)
             self.state.add_error(f"Unexpected: {str(e)}", "post_activation_verification")
             return False
+        finally:
+            # Release managed-cluster connections opened for klusterlet checks
+            self._api_client_pool.clear()
 
     def _verify_cluster_connections(self) -> None:
         """
@@ -601,35 +611,56 @@ def _verify_klusterlet_connections(self):
             logger.warning("Could not determine new hub API server URL, skipping klusterlet verification")
             return
 
-        # Load kubeconfig data for context lookup
+        # Resolve contexts from the on-disk kubeconfig index; YAML is parsed only for
+        # contexts that are actually connected to, or when the files changed
         # Use max_size=0 to bypass size check for critical klusterlet verification
-        kubeconfig_data = self._load_kubeconfig_data(max_size=0)
-        if not kubeconfig_data:
+        kubeconfig = self._get_kubeconfig_lookup(max_size=0)
+        if not kubeconfig.contexts:
             logger.warning("Could not load kubeconfig, skipping klusterlet verification")
             return
 
         # Get list of managed clusters with their API server URLs
         managed_clusters = self._get_managed_clusters()
 
+        # Clusters verified or fixed by an interrupted earlier run are skipped on resume
+        progress = self.state.step_progress("verify_klusterlet_connections")
+
         # Build list of (cluster_name, api_url) tuples, excluding local-cluster
         cluster_info = []
         for mc in managed_clusters:
             name = mc.get("metadata", {}).get("name")
-            if name and name != LOCAL_CLUSTER_NAME:
+            if name and name != LOCAL_CLUSTER_NAME and name not in progress:
                 # Get API server URL from ManagedCluster spec
                 client_configs = mc.get("spec", {}).get("managedClusterClientConfigs", [])
                 api_url = client_configs[0].get("url", "") if client_configs else ""
                 cluster_info.append((name, api_url))
 
+        if len(progress):
+            logger.info("Resuming: klusterlet already verified for %d cluster(s)", len(progress))
         if not cluster_info:
             logger.info("No managed clusters to verify klusterlet connections")
             return
 
+        # Load credentials once on this thread so workers neither stat the kubeconfig
+        # files per spoke nor reset the client pool while other workers use it
+        self._spoke_kubeconfig_data = self._load_kubeconfig_data(max_size=0)
+        with progress:
+            self._check_and_fix_klusterlets(cluster_info, new_hub_server, kubeconfig, progress)
+
+    def _check_and_fix_klusterlets(
+        self,
+        cluster_info: List[Tuple[str, str]],
+        new_hub_server: str,
+        kubeconfig: KubeconfigIndex,
+        progress: StepProgress,
+    ) -> None:
+        """Check each cluster's klusterlet and fix those connected to the old hub."""
+
         # Try to verify each cluster's klusterlet connection in parallel
         def check_cluster(cluster_name: str, cluster_api_url: str) -> tuple:
             """Check a single cluster's klusterlet connection. Returns (cluster_name, result, context_name)."""
             try:
-                context_name = self._find_context_by_api_url(kubeconfig_data, cluster_api_url, cluster_name)
+                context_name = self._find_context_by_api_url(kubeconfig, cluster_api_url, cluster_name)
                 if not context_name:
                     return (cluster_name, "no_context", None)
 
@@ -639,23 +670,37 @@ def check_cluster(cluster_name: str, cluster_api_url: str) -> tuple:
                 logger.debug("Error checking klusterlet for %s: %s", cluster_name, e)
                 return (cluster_name, "unreachable", None)
 
-        logger.info("Checking klusterlet connections for %d cluster(s) in parallel...", len(cluster_info))
+        logger.info(
+            "Checking klusterlet connections for %d cluster(s) (up to %d in flight, %ds timeout each)...",
+            len(cluster_info),
+            self.klusterlet_concurrency,
+            KLUSTERLET_CHECK_TIMEOUT,
+        )
+
+        def check_timed_out(cluster_name: str, cluster_api_url: str) -> tuple:
+            logger.debug("Klusterlet check for %s timed out after %ds", cluster_name, KLUSTERLET_CHECK_TIMEOUT)
+            return (cluster_name, "unreachable", None)
+
+        results = run_bounded(
+            check_cluster,
+            cluster_info,
+            concurrency=self.klusterlet_concurrency,
+            timeout=KLUSTERLET_CHECK_TIMEOUT,
+            on_timeout=check_timed_out,
+            label="Klusterlet checks",
+        )
 
-        # Collect results from futures to avoid shared mutable state
         verified = []
         wrong_hub = []
         unreachable = []
-
-        with ThreadPoolExecutor(max_workers=CLUSTER_VERIFY_MAX_WORKERS) as executor:
-            futures = [executor.submit(check_cluster, name, api_url) for name, api_url in cluster_info]
-            for future in as_completed(futures):
-                cluster_name, result, context_name = future.result()
-                if result == "verified":
-                    verified.append(cluster_name)
-                elif result == "wrong_hub":
-                    wrong_hub.append((cluster_name, context_name))
-                else:  # unreachable, no_context, or error
-                    unreachable.append(cluster_name)
+        for cluster_name, result, context_name in results:
+            if result == "verified":
+                verified.append(cluster_name)
+                progress.add(cluster_name)
+            elif result == "wrong_hub":
+                wrong_hub.append((cluster_name, context_name))
+            else:  # unreachable, no_context, timeout, or error
+                unreachable.append(cluster_name)
 
         # Log initial results
         if verified:
@@ -688,6 +733,7 @@ def fix_cluster(cluster_name: str, context_name: str) -> tuple:
                     cluster_name, success = future.result()
                     if success:
                         fixed.append(cluster_name)
+                        progress.add(cluster_name)
                     else:
                         fix_failed.append(cluster_name)
 
@@ -706,7 +752,7 @@ def fix_cluster(cluster_name: str, context_name: str) -> tuple:
 
         if unreachable:
             logger.info(
-                "Klusterlet verification skipped for %d cluster(s) (no context available): %s",
+                "Klusterlet verification skipped for %d cluster(s) (no context or unreachable): %s",
                 len(unreachable),
                 ", ".join(unreachable),
             )
@@ -790,13 +836,12 @@ def _delete_bootstrap_secret(self, context_name: str, cluster_name: str) -> None
             context_name: Kubeconfig context to use for connecting to the cluster
             cluster_name: Name of the ManagedCluster
         """
-        # Load the correct context before creating API client
-        config.load_kube_config(context=context_name)
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(self._managed_cluster_api_client(context_name))
         try:
             v1.delete_namespaced_secret(
                 name="bootstrap-hub-kubeconfig",
                 namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                _request_timeout=KLUSTERLET_CHECK_TIMEOUT,
             )
             logger.debug("Deleted bootstrap-hub-kubeconfig secret on %s", cluster_name)
         except ApiException as e:
@@ -811,9 +856,7 @@ def _apply_import_manifest(self, context_name: str, import_yaml: str, cluster_na
             import_yaml: Decoded import YAML string
             cluster_name: Name of the ManagedCluster
         """
-        # Load the correct context before creating API clients
-        config.load_kube_config(context=context_name)
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(self._managed_cluster_api_client(context_name))
 
         # Parse the import YAML and apply each resource
         import_docs = list(yaml.safe_load_all(import_yaml))
@@ -831,6 +874,7 @@ def _apply_import_manifest(self, context_name: str, import_yaml: str, cluster_na
                     v1.create_namespaced_secret(
                         namespace=namespace,
                         body=doc,
+                        _request_timeout=KLUSTERLET_CHECK_TIMEOUT,
                     )
                     logger.debug(
                         "Created bootstrap-hub-kubeconfig secret on %s",
@@ -856,9 +900,7 @@ def _wait_for_secret_visibility(self, context_name: str, cluster_name: str) -> N
             context_name: Kubeconfig context to use for connecting to the cluster
             cluster_name: Name of the ManagedCluster
         """
-        # Load the correct context before creating API client
-        config.load_kube_config(context=context_name)
-        v1 = client.CoreV1Api()
+        v1 = client.CoreV1Api(self._managed_cluster_api_client(context_name))
 
         def secret_exists() -> tuple:
             """Check if bootstrap-hub-kubeconfig secret exists."""
@@ -866,6 +908,7 @@ def secret_exists() -> tuple:
                 v1.read_namespaced_secret(
                     name="bootstrap-hub-kubeconfig",
                     namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                    _request_timeout=KLUSTERLET_CHECK_TIMEOUT,
                 )
                 return (True, "secret exists")
             except ApiException as e:
@@ -893,9 +936,7 @@ def _restart_klusterlet(self, context_name: str, cluster_name: str) -> None:
         """
         import time as time_module
 
-        # Load the correct context before creating API client
-        config.load_kube_config(context=context_name)
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = client.AppsV1Api(self._managed_cluster_api_client(context_name))
         try:
             # Trigger a rollout restart by patching the deployment
             patch = {
@@ -907,11 +948,25 @@ def _restart_klusterlet(self, context_name: str, cluster_name: str) -> None:
                 name="klusterlet",
                 namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
                 body=patch,
+                _request_timeout=KLUSTERLET_CHECK_TIMEOUT,
             )
             logger.debug("Triggered klusterlet restart on %s", cluster_name)
         except ApiException as e:
             logger.warning("Failed to restart klusterlet on %s: %s", cluster_name, e)
 
+    def _managed_cluster_api_client(self, context_name: str) -> client.ApiClient:
+        """Return the pooled ApiClient for a managed cluster context.
+
+        Clients are built once per context from the kubeconfig data loaded before
+        the klusterlet fan-out, so parallel klusterlet checks neither re-parse the
+        kubeconfig nor mutate the global default configuration.
+        """
+        kubeconfig_data = self._spoke_kubeconfig_data
+        if kubeconfig_data is None:
+            # Called outside a fan-out; bypass size check (max_size=0), as for context lookup
+            kubeconfig_data = self._load_kubeconfig_data(max_size=0)
+        return self._api_client_pool.get(context_name, kubeconfig_data)
+
     def _get_hub_api_server(self) -> str:
         """Get the API server URL for the new hub.
 
@@ -921,143 +976,65 @@ def _get_hub_api_server(self) -> str:
         """
         try:
             # Bypass size check (max_size=0) for critical hub lookup
-            kubeconfig_data = self._load_kubeconfig_data(max_size=0)
-            if not kubeconfig_data:
-                return ""
-
-            # Find the context matching secondary
-            for ctx in kubeconfig_data.get("contexts", []):
-                if ctx.get("name") == self.secondary.context:
-                    cluster_name = ctx.get("context", {}).get("cluster")
-                    # Find the cluster with matching name
-                    for cluster in kubeconfig_data.get("clusters", []):
-                        if cluster.get("name") == cluster_name:
-                            return cluster.get("cluster", {}).get("server", "")
+            return self._get_kubeconfig_lookup(max_size=0).server_for_context(self.secondary.context)
         except (ApiException, Exception) as e:
             logger.debug("Error getting hub API server: %s", e)
 
         return ""
 
-    def _load_kubeconfig_data(self, max_size: Optional[int] = None, force_reload: bool = False) -> dict:
-        """Load and merge kubeconfig data from all KUBECONFIG paths.
+    def _get_kubeconfig_index(self, max_size: Optional[int] = None, force_reload: bool = False) -> KubeconfigIndex:
+        """Return the process-wide indexed kubeconfig (see lib/kubeconfig_store.py).
 
         Handles the KUBECONFIG environment variable which can contain multiple
-        colon-separated paths (e.g., '/path/one:/path/two:~/.kube/config').
-        Contexts, clusters, and users are merged from all files.
-
-        Uses caching to avoid repeated file I/O when called multiple times.
-        Cache is invalidated if any kubeconfig file has been modified.
+        colon-separated paths. Files are parsed once and re-parsed only when one
+        of them changes; pooled managed-cluster clients are dropped (not closed,
+        as timed-out checks may still be using them) when that happens since they
+        may carry stale credentials.
 
         Args:
             max_size: Maximum file size in bytes. If None, uses MAX_KUBECONFIG_SIZE.
                      If 0 or negative, bypasses size check entirely (for critical operations).
             force_reload: If True, bypass cache and reload from files.
-
-        Returns:
-            Merged kubeconfig data dict with contexts, clusters, and users.
         """
         try:
-            # Check if we can use cached data
-            if not force_reload and self._kubeconfig_cache is not None:
-                # Verify no files have been modified since caching
-                cache_valid = True
-                for path in self._kubeconfig_paths:
-                    if os.path.exists(path):
-                        current_mtime = os.path.getmtime(path)
-                        if self._kubeconfig_mtime.get(path, 0) != current_mtime:
-                            cache_valid = False
-                            break
-                    else:
-                        # File was deleted
-                        cache_valid = False
-                        break
-
-                if cache_valid:
-                    return self._kubeconfig_cache
-            kubeconfig_env = os.environ.get("KUBECONFIG", "")
-            if kubeconfig_env:
-                # Split on colon (Unix path separator for KUBECONFIG)
-                paths = [p.strip() for p in kubeconfig_env.split(":") if p.strip()]
-            else:
-                paths = [os.path.expanduser("~/.kube/config")]
-
-            # Determine size limit: use provided max_size, or default to MAX_KUBECONFIG_SIZE
-            if max_size is None:
-                # Check if MAX_KUBECONFIG_SIZE is set to 0 or negative to disable checking
-                if MAX_KUBECONFIG_SIZE <= 0:
-                    # Size checking disabled via environment variable
-                    size_limit = None
-                    check_size = False
-                else:
-                    size_limit = MAX_KUBECONFIG_SIZE
-                    check_size = True
-            elif max_size <= 0:
-                # Bypass size check for critical operations
-                size_limit = None
-                check_size = False
-            else:
-                size_limit = max_size
-                check_size = True
+            index = get_kubeconfig_store().load(max_size=max_size, force_reload=force_reload)
+        except Exception as e:
+            logger.debug("Error loading kubeconfig: %s", e)
+            return KubeconfigIndex({})
 
-            # Merge kubeconfig data from all paths
-            merged: dict = {"contexts": [], "clusters": [], "users": []}
+        if self._kubeconfig_index is not None and index is not self._kubeconfig_index:
+            self._api_client_pool.reset()
+        self._kubeconfig_index = index
+        return index
 
-            for path in paths:
-                expanded_path = os.path.expanduser(path)
-                if not os.path.exists(expanded_path):
-                    logger.debug("Kubeconfig path does not exist: %s", os.path.basename(expanded_path))
-                    continue
+    def _get_kubeconfig_lookup(self, max_size: Optional[int] = None) -> KubeconfigIndex:
+        """Return a kubeconfig index for resolving contexts (no credentials needed).
 
-                try:
-                    # Check file size before loading to prevent memory exhaustion
-                    if check_size:
-                        kubeconfig_size = os.path.getsize(expanded_path)
-                        if kubeconfig_size > size_limit:
-                            logger.warning(
-                                "Kubeconfig file too large: %s (%d bytes, max %d bytes). Skipping.",
-                                os.path.basename(expanded_path),
-                                kubeconfig_size,
-                                size_limit,
-                            )
-                            continue
-                    else:
-                        # Size check bypassed - log warning but continue loading
-                        # Only warn if size checking is meaningful (MAX_KUBECONFIG_SIZE > 0)
-                        # and file exceeds the default limit (not the overridden value)
-                        if MAX_KUBECONFIG_SIZE > 0:
-                            kubeconfig_size = os.path.getsize(expanded_path)
-                            if kubeconfig_size > DEFAULT_KUBECONFIG_SIZE:
-                                logger.warning(
-                                    "Kubeconfig file large: %s (%d bytes, exceeds default limit %d bytes). "
-                                    "Loading anyway for critical operation.",
-                                    os.path.basename(expanded_path),
-                                    kubeconfig_size,
-                                    DEFAULT_KUBECONFIG_SIZE,
-                                )
-
-                    with open(expanded_path) as f:
-                        data = yaml.safe_load(f) or {}
-                        merged["contexts"].extend(data.get("contexts", []))
-                        merged["clusters"].extend(data.get("clusters", []))
-                        merged["users"].extend(data.get("users", []))
-                except (OSError, yaml.YAMLError) as e:
-                    logger.debug("Error loading kubeconfig %s: %s", os.path.basename(expanded_path), e)
-                    continue
+        Served from the on-disk index on warm runs, so no YAML is parsed.
 
-            # Update cache with loaded data and file modification times
-            self._kubeconfig_cache = merged
-            self._kubeconfig_paths = [os.path.expanduser(p) for p in paths]
-            self._kubeconfig_mtime = {
-                path: os.path.getmtime(path) for path in self._kubeconfig_paths if os.path.exists(path)
-            }
+        Args:
+            max_size: As for _get_kubeconfig_index
+        """
+        try:
+            return get_kubeconfig_store().lookup(max_size=max_size)
+        except Exception as e:
+            logger.debug("Error loading kubeconfig index: %s", e)
+            return KubeconfigIndex({}, credentials=False)
 
-            return merged
+    def _load_kubeconfig_data(self, max_size: Optional[int] = None, force_reload: bool = False) -> dict:
+        """Load and merge kubeconfig data from all KUBECONFIG paths.
 
-        except Exception as e:
-            logger.debug("Error loading kubeconfig: %s", e)
-            return {}
+        Args:
+            max_size: Maximum file size in bytes. If None, uses MAX_KUBECONFIG_SIZE.
+                     If 0 or negative, bypasses size check entirely (for critical operations).
+            force_reload: If True, bypass cache and reload from files.
 
-    def _find_context_by_api_url(self, kubeconfig_data: dict, api_url: str, cluster_name: str) -> str:
+        Returns:
+            Merged kubeconfig data dict with contexts, clusters, and users.
+        """
+        return self._get_kubeconfig_index(max_size=max_size, force_reload=force_reload).data
+
+    def _find_context_by_api_url(self, kubeconfig: KubeconfigIndex, api_url: str, cluster_name: str) -> str:
         """
         Find a kubeconfig context that matches the given API server URL.
 
@@ -1065,7 +1042,7 @@ def _find_context_by_api_url(self, kubeconfig_data: dict, api_url: str, cluster_
         differ from ManagedCluster names (e.g., "admin@prod1" vs "prod1").
 
         Args:
-            kubeconfig_data: Parsed kubeconfig as dict
+            kubeconfig: Indexed kubeconfig
             api_url: The API server URL from ManagedCluster spec
             cluster_name: The ManagedCluster name (for fallback and logging)
 
@@ -1075,46 +1052,21 @@ def _find_context_by_api_url(self, kubeconfig_data: dict, api_url: str, cluster_
         if not api_url:
             # Fallback to name-based matching if no API URL
             logger.debug("No API URL for %s, trying name-based matching", cluster_name)
-            try:
-                contexts, _ = config.list_kube_config_contexts()
-                for ctx in contexts:
-                    if ctx.get("name") == cluster_name:
-                        return cluster_name
-            except (config.ConfigException, Exception) as e:
-                # Failed to match context by name; returning empty string as fallback
-                logger.debug("Exception during name-based context matching for %s: %s", cluster_name, e)
-            return ""
+            return cluster_name if cluster_name in kubeconfig.contexts else ""
 
-        # Normalize the API URL for comparison (extract host)
-        api_host = re.sub(r"https://([^:/]+).*", r"\1", api_url)
-
-        # Build a map of cluster server URL -> cluster name
-        cluster_servers = {}
-        for cluster in kubeconfig_data.get("clusters", []):
-            server = cluster.get("cluster", {}).get("server", "")
-            if server:
-                server_host = re.sub(r"https://([^:/]+).*", r"\1", server)
-                cluster_servers[server_host] = cluster.get("name")
-
-        # Find which kubeconfig cluster matches this API URL
-        matching_cluster = cluster_servers.get(api_host)
-        if not matching_cluster:
+        # Match on the API server host via the index (O(1) per cluster)
+        context_name = kubeconfig.find_context_by_server(api_url)
+        if not context_name:
             logger.debug("No kubeconfig cluster matches API URL %s", api_url)
             return ""
 
-        # Find the context that uses this cluster
-        for ctx in kubeconfig_data.get("contexts", []):
-            if ctx.get("context", {}).get("cluster") == matching_cluster:
-                context_name = ctx.get("name", "")
-                logger.debug(
-                    "Matched cluster %s to context %s via API URL %s",
-                    cluster_name,
-                    context_name,
-                    api_url,
-                )
-                return context_name
-
-        return ""
+        logger.debug(
+            "Matched cluster %s to context %s via API URL %s",
+            cluster_name,
+            context_name,
+            api_url,
+        )
+        return context_name
 
     def _check_klusterlet_connection(self, context_name: str, cluster_name: str, expected_hub: str) -> str:
         """
@@ -1135,15 +1087,15 @@ def _check_klusterlet_connection(self, context_name: str, cluster_name: str, exp
             "unreachable" if can't connect to cluster
         """
         try:
-            # Try to load kubeconfig using the discovered context name
-            config.load_kube_config(context=context_name)
-            v1 = client.CoreV1Api()
+            # Reuse the pooled client for the discovered context name
+            v1 = client.CoreV1Api(self._managed_cluster_api_client(context_name))
 
             # Get the hub-kubeconfig-secret
             try:
                 secret = v1.read_namespaced_secret(
                     name="hub-kubeconfig-secret",
                     namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                    _request_timeout=KLUSTERLET_CHECK_TIMEOUT,
                 )
             except ApiException as e:
                 if e.status == 404:
@@ -1151,6 +1103,7 @@ def _check_klusterlet_connection(self, context_name: str, cluster_name: str, exp
                     secret = v1.read_namespaced_secret(
                         name="bootstrap-hub-kubeconfig",
                         namespace=MANAGED_CLUSTER_AGENT_NAMESPACE,
+                        _request_timeout=KLUSTERLET_CHECK_TIMEOUT,
                     )
                 else:
                     raise
@@ -16,6 +16,7 @@
     ToolingValidator,
 )
 from .reporter import ValidationReporter
+from .scheduler import ValidationScheduler, ValidationTask
 from .version_validators import (
     AutoImportStrategyValidator,
     HubComponentValidator,
@@ -26,6 +27,8 @@
 __all__ = [
     "BaseValidator",
     "ValidationReporter",
+    "ValidationScheduler",
+    "ValidationTask",
     "BackupValidator",
     "BackupStorageLocationValidator",
     "BackupScheduleValidator",
@@ -4,12 +4,13 @@
 import re
 import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from lib.constants import (
     BACKUP_NAMESPACE,
     BACKUP_POLL_INTERVAL,
     BACKUP_SCHEDULE_DEFAULT_NAME,
+    BACKUP_SCHEDULE_TYPE_MANAGED_CLUSTERS,
     BACKUP_VERIFY_TIMEOUT,
     LOCAL_CLUSTER_NAME,
     RESTORE_PASSIVE_SYNC_NAME,
@@ -77,9 +78,72 @@ def _collect_bsl_unavailable_details(kube_client: KubeClient) -> str:
     return "; ".join(unavailable)
 
 
+def _creation_timestamp(resource: dict) -> str:
+    return resource.get("metadata", {}).get("creationTimestamp", "")
+
+
+# Kubernetes serializes metadata timestamps as second-precision UTC RFC 3339
+_K8S_TIMESTAMP_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+
+
+def _names_created_after(created: List[Tuple[str, str]], cutoff: datetime) -> List[str]:
+    """Return the names whose creationTimestamp is later than cutoff.
+
+    Canonical Kubernetes timestamps sort lexicographically, so they are compared
+    as strings against the cutoff rendered in the same form; only other formats
+    are parsed into datetimes.
+
+    Args:
+        created: (name, creationTimestamp) pairs; empty timestamps are ignored
+        cutoff: Timezone-aware cutoff time
+    """
+    # Truncating the cutoff to seconds is exact: a whole-second timestamp is
+    # later than the cutoff only if it is later than the truncated cutoff too
+    cutoff_key = cutoff.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    after = []
+    for name, timestamp in created:
+        if not timestamp:
+            continue
+        if _K8S_TIMESTAMP_PATTERN.match(timestamp):
+            if timestamp > cutoff_key:
+                after.append(name)
+            continue
+        try:
+            if datetime.fromisoformat(timestamp.replace("Z", "+00:00")) > cutoff:
+                after.append(name)
+        except (ValueError, TypeError) as e:
+            logger.warning("Could not compare creation timestamp of %s: %s", name, e)
+    return after
+
+
 class BackupValidator(BaseValidator):
     """Ensures backups exist and no job is stuck."""
 
+    def _scan_backups(self, primary: KubeClient) -> Tuple[Optional[dict], List[str]]:
+        """Stream backups once, keeping only the latest backup and in-progress names.
+
+        Args:
+            primary: Primary hub KubeClient instance
+
+        Returns:
+            Tuple of (latest backup by creationTimestamp or None, in-progress backup names)
+        """
+        latest_backup: Optional[dict] = None
+        in_progress: List[str] = []
+
+        for backup in primary.iter_custom_resources(
+            group="velero.io",
+            version="v1",
+            plural="backups",
+            namespace=BACKUP_NAMESPACE,
+        ):
+            if backup.get("status", {}).get("phase") == "InProgress":
+                in_progress.append(backup.get("metadata", {}).get("name"))
+            if latest_backup is None or _creation_timestamp(backup) > _creation_timestamp(latest_backup):
+                latest_backup = backup
+
+        return latest_backup, in_progress
+
     def _wait_for_backups_complete(self, primary: KubeClient, in_progress: List[str]) -> List[str]:
         """Wait for in-progress backups to complete within a timeout.
 
@@ -105,20 +169,11 @@ def _wait_for_backups_complete(self, primary: KubeClient, in_progress: List[str]
         while remaining and (time.time() - start_time) < BACKUP_VERIFY_TIMEOUT:
             time.sleep(BACKUP_POLL_INTERVAL)
             try:
-                backups = primary.list_custom_resources(
-                    group="velero.io",
-                    version="v1",
-                    plural="backups",
-                    namespace=BACKUP_NAMESPACE,
-                )
+                _, remaining = self._scan_backups(primary)
             except Exception as exc:
                 logger.debug("Failed to list backups while waiting: %s", exc)
                 return remaining
 
-            remaining = [
-                b.get("metadata", {}).get("name") for b in backups if b.get("status", {}).get("phase") == "InProgress"
-            ]
-
         return remaining
 
     def _get_backup_age_info(self, completion_timestamp: Optional[str]) -> str:
@@ -177,14 +232,9 @@ def run(self, primary: KubeClient) -> None:
             primary: Primary hub KubeClient instance
         """
         try:
-            backups = primary.list_custom_resources(
-                group="velero.io",
-                version="v1",
-                plural="backups",
-                namespace=BACKUP_NAMESPACE,
-            )
+            latest_backup, in_progress = self._scan_backups(primary)
 
-            if not backups:
+            if latest_backup is None:
                 self.add_result(
                     "Backup status",
                     False,
@@ -193,19 +243,9 @@ def run(self, primary: KubeClient) -> None:
                 )
                 return
 
-            backups.sort(
-                key=lambda b: b.get("metadata", {}).get("creationTimestamp", ""),
-                reverse=True,
-            )
-
-            latest_backup = backups[0]
             backup_name = latest_backup.get("metadata", {}).get("name", "unknown")
             phase = latest_backup.get("status", {}).get("phase", "unknown")
 
-            in_progress = [
-                b.get("metadata", {}).get("name") for b in backups if b.get("status", {}).get("phase") == "InProgress"
-            ]
-
             if in_progress:
                 remaining = self._wait_for_backups_complete(primary, in_progress)
                 if remaining:
@@ -217,15 +257,10 @@ def run(self, primary: KubeClient) -> None:
                     )
                     return
 
-                # Refresh backup list after waiting to ensure we inspect the latest completion state
-                backups = primary.list_custom_resources(
-                    group="velero.io",
-                    version="v1",
-                    plural="backups",
-                    namespace=BACKUP_NAMESPACE,
-                )
+                # Refresh backups after waiting to ensure we inspect the latest completion state
+                latest_backup, _ = self._scan_backups(primary)
 
-                if not backups:
+                if latest_backup is None:
                     self.add_result(
                         "Backup status",
                         False,
@@ -234,12 +269,6 @@ def run(self, primary: KubeClient) -> None:
                     )
                     return
 
-                backups.sort(
-                    key=lambda b: b.get("metadata", {}).get("creationTimestamp", ""),
-                    reverse=True,
-                )
-
-                latest_backup = backups[0]
                 backup_name = latest_backup.get("metadata", {}).get("name", "unknown")
                 phase = latest_backup.get("status", {}).get("phase", "unknown")
 
@@ -548,15 +577,14 @@ class ManagedClusterBackupValidator(BaseValidator):
     def run(self, primary: KubeClient) -> None:
         """Check that all joined ManagedClusters are in the latest managed-clusters backup."""
         try:
-            # Get all joined ManagedClusters (excluding local-cluster)
-            managed_clusters = primary.list_custom_resources(
+            # Get all joined ManagedClusters (excluding local-cluster) with their
+            # creation times, so no per-cluster GET is needed later
+            joined_clusters: List[Tuple[str, str]] = []
+            for mc in primary.iter_custom_resources(
                 group="cluster.open-cluster-management.io",
                 version="v1",
                 plural="managedclusters",
-            )
-
-            joined_clusters = []
-            for mc in managed_clusters:
+            ):
                 mc_name = mc.get("metadata", {}).get("name", "unknown")
                 if mc_name == LOCAL_CLUSTER_NAME:
                     continue
@@ -567,7 +595,7 @@ def run(self, primary: KubeClient) -> None:
                     c.get("type") == "ManagedClusterJoined" and c.get("status") == "True" for c in conditions
                 )
                 if is_joined:
-                    joined_clusters.append(mc_name)
+                    joined_clusters.append((mc_name, _creation_timestamp(mc)))
 
             if not joined_clusters:
                 self.add_result(
@@ -591,24 +619,14 @@ def run(self, primary: KubeClient) -> None:
                 )
                 return
 
-            backups = primary.list_custom_resources(
-                group="velero.io",
-                version="v1",
-                plural="backups",
+            # Latest managed-clusters backup (selected server-side by the ACM backup schedule type label)
+            latest_backups = primary.get_latest_velero_backups(
                 namespace=BACKUP_NAMESPACE,
+                schedule_type=BACKUP_SCHEDULE_TYPE_MANAGED_CLUSTERS,
             )
+            latest_backup = latest_backups[0] if latest_backups else None
 
-            # Filter for managed-clusters backups using ACM backup schedule type label
-            mc_backups = [
-                b
-                for b in backups
-                if b.get("metadata", {})
-                .get("labels", {})
-                .get("cluster.open-cluster-management.io/backup-schedule-type")
-                == "managedClusters"
-            ]
-
-            if not mc_backups:
+            if latest_backup is None:
                 self.add_result(
                     "ManagedClusters in backup",
                     False,
@@ -617,13 +635,6 @@ def run(self, primary: KubeClient) -> None:
                 )
                 return
 
-            # Sort by creation timestamp and get the latest
-            mc_backups.sort(
-                key=lambda b: b.get("metadata", {}).get("creationTimestamp", ""),
-                reverse=True,
-            )
-            latest_backup = mc_backups[0]
-
             # Check backup status
             phase = latest_backup.get("status", {}).get("phase", "unknown")
             if phase != "Completed":
@@ -645,20 +656,8 @@ def run(self, primary: KubeClient) -> None:
                     # Parse backup completion time (ISO 8601 format)
                     backup_time = datetime.fromisoformat(backup_completion_time.replace("Z", "+00:00"))
 
-                    # Check each joined cluster's creation time against backup time
-                    for cluster_name in joined_clusters:
-                        cluster_info = primary.get_custom_resource(
-                            group="cluster.open-cluster-management.io",
-                            version="v1",
-                            plural="managedclusters",
-                            name=cluster_name,
-                        )
-                        if cluster_info:
-                            cluster_creation = cluster_info.get("metadata", {}).get("creationTimestamp", "")
-                            if cluster_creation:
-                                cluster_time = datetime.fromisoformat(cluster_creation.replace("Z", "+00:00"))
-                                if cluster_time > backup_time:
-                                    clusters_after_backup.append(cluster_name)
+                    # Compare each joined cluster's creation time (from the list above) against backup time
+                    clusters_after_backup = _names_created_after(joined_clusters, backup_time)
                 except (ValueError, TypeError) as e:
                     # If timestamp parsing fails, log warning but continue
                     logger.warning("Could not compare cluster timestamps: %s", e)
@@ -1,16 +1,26 @@
 """Validation result reporting for pre-flight checks."""
 
 import logging
-from typing import Any, Dict, List
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
 
 logger = logging.getLogger("acm_switchover")
 
 
 class ValidationReporter:
-    """Collects validation results and handles summary logging."""
+    """Collects validation results and handles summary logging.
+
+    Safe to share between threads. Inside ``deferred(order)`` a thread's
+    results are held back until ``release(order)``, which lets concurrent
+    validators report in a fixed order.
+    """
 
     def __init__(self) -> None:
         self.results: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._deferred: Dict[int, List[Dict[str, Any]]] = {}
 
     def add_result(
         self,
@@ -27,25 +37,49 @@ def add_result(
             message: Descriptive message about the result
             critical: Whether failure is critical (default: True)
         """
-        self.results.append(
-            {
-                "check": check,
-                "passed": passed,
-                "message": message,
-                "critical": critical,
-            }
-        )
-
-        if passed:
+        result = {
+            "check": check,
+            "passed": passed,
+            "message": message,
+            "critical": critical,
+        }
+        order = getattr(self._local, "order", None)
+        with self._lock:
+            if order is not None:
+                self._deferred.setdefault(order, []).append(result)
+                return
+            self._record(result)
+
+    def _record(self, result: Dict[str, Any]) -> None:
+        """Append and log a result (caller holds the lock)."""
+        self.results.append(result)
+        check, message = result["check"], result["message"]
+        if result["passed"]:
             logger.info(f"✓ {check}: {message}")
-        elif critical:
+        elif result["critical"]:
             logger.error(f"✗ {check}: {message}")
         else:
             logger.warning(f"⚠ {check}: {message}")
 
+    @contextmanager
+    def deferred(self, order: int) -> Iterator[None]:
+        """Hold back results added by the current thread until ``release(order)``."""
+        self._local.order = order
+        try:
+            yield
+        finally:
+            self._local.order = None
+
+    def release(self, order: int) -> None:
+        """Record and log results held back under ``order``."""
+        with self._lock:
+            for result in self._deferred.pop(order, []):
+                self._record(result)
+
     def critical_failures(self) -> List[Dict[str, Any]]:
         """Get list of critical validation failures."""
-        return [r for r in self.results if not r["passed"] and r["critical"]]
+        with self._lock:
+            return [r for r in self.results if not r["passed"] and r["critical"]]
 
     def print_summary(self) -> None:
         """Print validation summary to the log."""
@@ -0,0 +1,108 @@
+"""Dependency-aware concurrent execution of pre-flight validators."""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .reporter import ValidationReporter
+
+logger = logging.getLogger("acm_switchover")
+
+
+class ValidationTask:
+    """A unit of pre-flight work and the task outputs it consumes.
+
+    The task's return value is its output, stored under ``name``. ``func`` is
+    called with one keyword argument per entry in ``requires``, carrying that
+    task's output.
+    """
+
+    def __init__(self, name: str, func: Callable[..., Any], requires: Sequence[str] = ()) -> None:
+        self.name = name
+        self.func = func
+        self.requires: Tuple[str, ...] = tuple(requires)
+
+    def __repr__(self) -> str:
+        return f"ValidationTask({self.name!r}, requires={self.requires!r})"
+
+
+class ValidationScheduler:
+    """Runs ValidationTasks concurrently once their inputs are available.
+
+    Results each task adds to the reporter are buffered and released in task
+    declaration order, so the log and ``reporter.results`` read the same as a
+    sequential run regardless of which task finishes first.
+    """
+
+    def __init__(self, reporter: ValidationReporter, max_workers: int) -> None:
+        self.reporter = reporter
+        self.max_workers = max(1, max_workers)
+
+    @staticmethod
+    def _check_graph(tasks: Sequence[ValidationTask]) -> None:
+        seen: Dict[str, int] = {}
+        for index, task in enumerate(tasks):
+            if task.name in seen:
+                raise ValueError(f"Duplicate validation task: {task.name}")
+            for dep in task.requires:
+                # Declaration order doubles as a topological order, which rules out cycles
+                if dep not in seen:
+                    raise ValueError(f"Validation task {task.name} requires {dep}, which must be declared earlier")
+            seen[task.name] = index
+
+    def run(self, tasks: Sequence[ValidationTask]) -> Dict[str, Any]:
+        """Execute tasks and return their outputs by name.
+
+        Raises:
+            ValueError: If a task requires an unknown or later-declared task
+            Exception: The first exception raised by a task, after all running
+                       tasks have finished and earlier results were released
+        """
+        self._check_graph(tasks)
+        outputs: Dict[str, Any] = {}
+        done: Dict[int, bool] = {}
+        next_release = 0
+        error: Optional[BaseException] = None
+        pending = list(range(len(tasks)))
+        running: Dict[Future, int] = {}
+
+        def release_completed() -> None:
+            nonlocal next_release
+            while next_release in done:
+                self.reporter.release(next_release)
+                next_release += 1
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="preflight") as executor:
+            while pending or running:
+                if error is None:
+                    for index in list(pending):
+                        task = tasks[index]
+                        if all(dep in outputs for dep in task.requires):
+                            pending.remove(index)
+                            kwargs = {dep: outputs[dep] for dep in task.requires}
+                            running[executor.submit(self._run_task, index, task, kwargs)] = index
+                elif not running:
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = running.pop(future)
+                    done[index] = True
+                    try:
+                        outputs[tasks[index].name] = future.result()
+                    except Exception as e:  # pylint: disable=broad-except
+                        logger.debug("Validation task %s failed: %s", tasks[index].name, e)
+                        if error is None:
+                            error = e
+                release_completed()
+
+        if error is not None:
+            # Tasks that never ran leave a gap; release whatever was recorded after it
+            for index in range(next_release, len(tasks)):
+                self.reporter.release(index)
+            raise error
+        return outputs
+
+    def _run_task(self, index: int, task: ValidationTask, kwargs: Dict[str, Any]) -> Any:
+        with self.reporter.deferred(index):
+            return task.func(**kwargs)
@@ -24,6 +24,7 @@
     MCE_NAMESPACE,
 )
 from lib.kube_client import KubeClient
+from lib.kubeconfig_store import get_kubeconfig_store
 from lib.utils import is_acm_version_ge
 from lib.validation import InputValidator, ValidationError
 
@@ -89,18 +90,15 @@ def _check_duplicate_users(self, primary: KubeClient, secondary: KubeClient) ->
         credentials can collide and cause authentication failures.
         """
         try:
-            from kubernetes import config as k8s_config
-
-            # Load the current kubeconfig to check for duplicates
-            contexts, active_context = k8s_config.list_kube_config_contexts()
+            # Use the shared parsed kubeconfig to check for duplicates
+            contexts = get_kubeconfig_store().load(max_size=0).contexts
             if not contexts:
                 return
 
             # Extract user names and check for potential collisions
             user_to_contexts: Dict[str, List[str]] = {}
-            for ctx in contexts:
-                ctx_name = ctx.get("name", "unknown")
-                user_name = ctx.get("context", {}).get("user", "unknown")
+            for ctx_name, ctx in contexts.items():
+                user_name = ctx.get("user", "unknown")
                 if user_name not in user_to_contexts:
                     user_to_contexts[user_name] = []
                 user_to_contexts[user_name].append(ctx_name)
@@ -150,27 +148,14 @@ def _check_duplicate_users(self, primary: KubeClient, secondary: KubeClient) ->
     def _check_token_expiration(self, client: KubeClient, hub_label: str) -> None:
         """Check service account token expiration."""
         try:
-            # Get current configuration to extract token
-            from kubernetes import client as k8s_client
-            from kubernetes import config as k8s_config
-
-            # Load the current kubeconfig
-            k8s_config.load_kube_config(context=client.context)
-
-            # Get the current configuration
-            try:
-                current_config = k8s_client.Configuration.get_default_copy()
-            except Exception:
-                # Fallback for older kubernetes client versions
-                current_config = k8s_client.Configuration()
-                k8s_config.load_kube_config(
-                    context=client.context,
-                    client_configuration=current_config,
-                )
-
-            # Extract token from Bearer auth
-            auth_header = current_config.api_key.get("authorization", "")
-            if not auth_header.startswith("Bearer "):
+            # Static token from the shared parsed kubeconfig; otherwise the token the
+            # client authenticated with (e.g., one returned by an exec plugin)
+            token = get_kubeconfig_store().load(max_size=0).user_for_context(client.context).get("token", "")
+            if not token:
+                api_key = client.custom_api.api_client.configuration.api_key or {}
+                auth_header = next((v for v in api_key.values() if str(v).startswith("Bearer ")), "")
+                token = auth_header[7:]  # Remove "Bearer " prefix
+            if not token:
                 self.add_result(
                     f"Token Expiration ({hub_label})",
                     True,
@@ -179,8 +164,6 @@ def _check_token_expiration(self, client: KubeClient, hub_label: str) -> None:
                 )
                 return
 
-            token = auth_header[7:]  # Remove "Bearer " prefix
-
             # Try to decode JWT token
             try:
                 # Split token and decode payload
@@ -12,10 +12,11 @@
 # Runbook: Step 0 (pre-flight validation)
 
 import logging
-from typing import Tuple, TypedDict
+from typing import List, Optional, Tuple, TypedDict
 
-from lib.constants import OBSERVABILITY_NAMESPACE
+from lib.constants import OBSERVABILITY_NAMESPACE, PREFLIGHT_MAX_WORKERS
 from lib.kube_client import KubeClient
+from lib.list_cache import ListCache
 from lib.rbac_validator import validate_rbac_permissions
 
 from .preflight import (
@@ -33,6 +34,8 @@
     PassiveSyncValidator,
     ToolingValidator,
     ValidationReporter,
+    ValidationScheduler,
+    ValidationTask,
     VersionValidator,
 )
 
@@ -56,11 +59,17 @@ def __init__(
         secondary_client: KubeClient,
         method: str = "passive",
         skip_rbac_validation: bool = False,
+        cache_dir: Optional[str] = None,
+        rbac_cache_dir: Optional[str] = None,
     ) -> None:
         self.primary = primary_client
         self.secondary = secondary_client
         self.method = method
         self.skip_rbac_validation = skip_rbac_validation
+        # On-disk list cache shared across runs (None disables it)
+        self.cache_dir = cache_dir
+        # On-disk RBAC verdict cache shared with check_rbac.py (None disables it)
+        self.rbac_cache_dir = rbac_cache_dir
 
         self.reporter = ValidationReporter()
         self.kubeconfig_validator = KubeconfigValidator(self.reporter)
@@ -82,7 +91,102 @@ def validate_all(self) -> Tuple[bool, PreflightConfig]:
 
         logger.info("Starting pre-flight validation...")
 
-        # RBAC validation (unless explicitly skipped)
+        caches = self._enable_list_cache()
+        try:
+            return self._run_checks()
+        finally:
+            self._disable_list_cache(caches)
+
+    def _enable_list_cache(self) -> List[ListCache]:
+        """Serve validator list calls through the on-disk cache, if configured."""
+        if not self.cache_dir:
+            return []
+        return [c.enable_list_cache(self.cache_dir) for c in (self.primary, self.secondary) if c is not None]
+
+    def _disable_list_cache(self, caches: List[ListCache]) -> None:
+        for kube_client in (self.primary, self.secondary):
+            if caches and kube_client is not None:
+                kube_client.disable_list_cache()
+        hits = sum(cache.hits for cache in caches)
+        misses = sum(cache.misses for cache in caches)
+        if hits or misses:
+            logger.info("Pre-flight list cache: %d list(s) served from cache, %d fetched", hits, misses)
+
+    def _run_checks(self) -> Tuple[bool, PreflightConfig]:
+        """Run the validators, concurrently where their inputs allow."""
+        outputs = ValidationScheduler(self.reporter, max_workers=PREFLIGHT_MAX_WORKERS).run(self._build_tasks())
+
+        primary_version, secondary_version = outputs["versions"]
+        primary_observability, secondary_observability = outputs["observability"]
+
+        self.reporter.print_summary()
+
+        config: PreflightConfig = {
+            "primary_version": primary_version,
+            "secondary_version": secondary_version,
+            "primary_observability_detected": primary_observability,
+            "secondary_observability_detected": secondary_observability,
+            "has_observability": primary_observability or secondary_observability,
+        }
+
+        critical_failures = self.reporter.critical_failures()
+        return len(critical_failures) == 0, config
+
+    def _build_tasks(self) -> List[ValidationTask]:
+        """Declare the validators, their inputs, and their reporting order.
+
+        Declaration order is the order results are reported in; ``requires``
+        names the earlier tasks whose outputs a validator consumes.
+        """
+
+        def auto_import_strategy(versions: Tuple[str, str]) -> None:
+            # Auto-import strategy (detect-only, ACM 2.14+)
+            AutoImportStrategyValidator(self.reporter).run(self.primary, self.secondary, *versions)
+
+        def observability_prereqs(observability: Tuple[bool, bool]) -> None:
+            if observability[1]:
+                self.observability_prereq_validator.run(self.secondary)
+
+        tasks = [
+            ValidationTask("rbac", self._validate_rbac),
+            # Kubeconfig structure and token validation
+            ValidationTask(
+                "kubeconfig", lambda: self.kubeconfig_validator.run(self.primary, self.secondary, method=self.method)
+            ),
+            ValidationTask("tooling", self.tooling_validator.run),
+            ValidationTask("namespaces", lambda: self.namespace_validator.run(self.primary, self.secondary)),
+            ValidationTask("versions", lambda: self.version_validator.run(self.primary, self.secondary)),
+            ValidationTask("auto_import_strategy", auto_import_strategy, requires=("versions",)),
+            ValidationTask("hub_components_primary", lambda: self.hub_component_validator.run(self.primary, "primary")),
+            ValidationTask(
+                "hub_components_secondary", lambda: self.hub_component_validator.run(self.secondary, "secondary")
+            ),
+            ValidationTask("backups", lambda: self.backup_validator.run(self.primary)),
+            ValidationTask("backup_schedule", lambda: self.backup_schedule_validator.run(self.primary)),
+            ValidationTask(
+                "backup_storage_primary", lambda: self.backup_storage_location_validator.run(self.primary, "primary")
+            ),
+            ValidationTask(
+                "backup_storage_secondary",
+                lambda: self.backup_storage_location_validator.run(self.secondary, "secondary"),
+            ),
+            ValidationTask("cluster_deployments", lambda: self.cluster_deployment_validator.run(self.primary)),
+            ValidationTask("managed_cluster_backups", lambda: self.managed_cluster_backup_validator.run(self.primary)),
+        ]
+        if self.method == "passive":
+            tasks.append(ValidationTask("passive_sync", lambda: self.passive_sync_validator.run(self.secondary)))
+        tasks.extend(
+            [
+                ValidationTask(
+                    "observability", lambda: self.observability_detector.detect(self.primary, self.secondary)
+                ),
+                ValidationTask("observability_prereqs", observability_prereqs, requires=("observability",)),
+            ]
+        )
+        return tasks
+
+    def _validate_rbac(self) -> None:
+        """Validate RBAC permissions on both hubs (unless explicitly skipped)."""
         if not self.skip_rbac_validation:
             try:
                 logger.info("Validating RBAC permissions...")
@@ -103,6 +207,7 @@ def validate_all(self) -> Tuple[bool, PreflightConfig]:
                     secondary_client=self.secondary,
                     include_decommission=False,  # Checked separately if needed
                     skip_observability=skip_obs,
+                    cache_dir=self.rbac_cache_dir,
                 )
                 self.reporter.add_result(
                     "RBAC Permissions",
@@ -123,55 +228,3 @@ def validate_all(self) -> Tuple[bool, PreflightConfig]:
                 )
         else:
             logger.info("RBAC validation skipped (--skip-rbac-validation specified)")
-
-        # Kubeconfig structure and token validation
-        self.kubeconfig_validator.run(self.primary, self.secondary, method=self.method)
-
-        self.tooling_validator.run()
-        self.namespace_validator.run(self.primary, self.secondary)
-        primary_version, secondary_version = self.version_validator.run(
-            self.primary,
-            self.secondary,
-        )
-
-        # Auto-import strategy (detect-only, ACM 2.14+)
-        AutoImportStrategyValidator(self.reporter).run(
-            self.primary,
-            self.secondary,
-            primary_version,
-            secondary_version,
-        )
-
-        for label, client in (("primary", self.primary), ("secondary", self.secondary)):
-            self.hub_component_validator.run(client, label)
-
-        self.backup_validator.run(self.primary)
-        self.backup_schedule_validator.run(self.primary)
-        self.backup_storage_location_validator.run(self.primary, "primary")
-        self.backup_storage_location_validator.run(self.secondary, "secondary")
-        self.cluster_deployment_validator.run(self.primary)
-        self.managed_cluster_backup_validator.run(self.primary)
-
-        if self.method == "passive":
-            self.passive_sync_validator.run(self.secondary)
-
-        primary_observability, secondary_observability = self.observability_detector.detect(
-            self.primary,
-            self.secondary,
-        )
-
-        if secondary_observability:
-            self.observability_prereq_validator.run(self.secondary)
-
-        self.reporter.print_summary()
-
-        config: PreflightConfig = {
-            "primary_version": primary_version,
-            "secondary_version": secondary_version,
-            "primary_observability_detected": primary_observability,
-            "secondary_observability_detected": secondary_observability,
-            "has_observability": primary_observability or secondary_observability,
-        }
-
-        critical_failures = self.reporter.critical_failures()
-        return len(critical_failures) == 0, config
@@ -155,13 +155,16 @@ def _disable_auto_import(self):
         """Add disable-auto-import annotation to all ManagedClusters."""
         logger.info("Disabling auto-import on ManagedClusters...")
 
-        managed_clusters = self.primary.list_managed_clusters()
+        managed_clusters = self.primary.list_managed_clusters(metadata_only=True)
 
         if not managed_clusters:
             logger.warning("No ManagedClusters found")
             return
 
-        count = 0
+        # Clusters patched by an interrupted earlier run are skipped on resume
+        progress = self.state.step_progress("disable_auto_import")
+        patch = {"metadata": {"annotations": {DISABLE_AUTO_IMPORT_ANNOTATION: ""}}}
+        patches = {}
         for mc in managed_clusters:
             mc_name = mc.get("metadata", {}).get("name")
 
@@ -170,8 +173,11 @@ def _disable_auto_import(self):
                 logger.debug("Skipping local-cluster")
                 continue
 
+            if mc_name in progress:
+                continue
+
             # Check if annotation already exists
-            annotations = mc.get("metadata", {}).get("annotations", {})
+            annotations = mc.get("metadata", {}).get("annotations") or {}
             if DISABLE_AUTO_IMPORT_ANNOTATION in annotations:
                 logger.debug(
                     "ManagedCluster %s already has disable-auto-import annotation",
@@ -179,15 +185,22 @@ def _disable_auto_import(self):
                 )
                 continue
 
-            # Add annotation
-            patch = {"metadata": {"annotations": {DISABLE_AUTO_IMPORT_ANNOTATION: ""}}}
+            patches[mc_name] = [patch]
 
-            self.primary.patch_managed_cluster(name=mc_name, patch=patch)
+        if len(progress):
+            logger.info("Resuming: %d ManagedCluster(s) already processed", len(progress))
+
+        # Patch concurrently (bounded pool + client-side rate limit)
+        with progress:
+            result = self.primary.bulk_patch_managed_clusters(
+                patches, on_success=None if self.dry_run else progress.add
+            )
 
-            count += 1
-            logger.debug("Added disable-auto-import annotation to %s", mc_name)
+        if result.failed:
+            details = ", ".join(f"{name} ({error})" for name, error in sorted(result.failed.items()))
+            raise SwitchoverError(f"Failed to disable auto-import on {len(result.failed)} ManagedCluster(s): {details}")
 
-        logger.info("Disabled auto-import on %s ManagedCluster(s)", count)
+        logger.info("Disabled auto-import on %s ManagedCluster(s)", len(result.succeeded))
 
     def _scale_down_thanos_compactor(self):
         """Scale down Thanos compactor StatefulSet."""
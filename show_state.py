@@ -20,6 +20,8 @@
 from typing import Any, Dict, List, Optional
 
 from lib import __version__, __version_date__
+from lib.constants import STATE_JOURNAL_SUFFIX
+from lib.utils import apply_state_journal
 from lib.validation import InputValidator, ValidationError
 
 STATE_DIR_ENV_VAR = "ACM_SWITCHOVER_STATE_DIR"
@@ -131,7 +133,10 @@ def load_state(state_file: str) -> Optional[Dict[str, Any]]:
     """Load state from file."""
     try:
         with open(state_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            state = json.load(f)
+        # Include changes a --state-journal run has not folded into the file yet
+        apply_state_journal(state, state_file + STATE_JOURNAL_SUFFIX)
+        return state
     except FileNotFoundError:
         print(f"Error: State file not found: {state_file}")
         return None
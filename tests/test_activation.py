@@ -5,6 +5,7 @@
 
 import sys
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -30,6 +31,8 @@
     VELERO_BACKUP_SKIP,
 )
 from lib.exceptions import FatalError
+from lib.kube_client import KubeClient
+from lib.utils import StepProgress
 
 SecondaryActivation = activation_module.SecondaryActivation
 
@@ -55,6 +58,8 @@ def mock_secondary_client():
     """Create a mock KubeClient for secondary hub."""
     mock = Mock()
     mock.dry_run = False  # Ensure dry_run is False for tests
+    # Run the real bulk patch engine so per-cluster patch calls stay observable
+    mock.bulk_patch_managed_clusters.side_effect = partial(KubeClient.bulk_patch_managed_clusters, mock)
     return mock
 
 
@@ -68,6 +73,8 @@ def mock_state_manager():
         mock.is_step_completed,
         mock.mark_step_completed,
     )
+    # In-memory per-item progress (nothing recorded by earlier runs)
+    mock.step_progress.side_effect = lambda step_name: StepProgress(None, step_name)
     return mock
 
 
@@ -490,24 +497,39 @@ def test_apply_immediate_import_annotations_raises_on_failures(
             {"metadata": {"name": "local-cluster", "annotations": {}}},
         ]
 
-        with patch.object(activation, "_reset_immediate_import_annotation", return_value=False):
-            with pytest.raises(FatalError, match="cluster-a"):
-                activation._apply_immediate_import_annotations()
+        mock_secondary_client.patch_managed_cluster.side_effect = ApiException(status=409)
+
+        with pytest.raises(FatalError, match="cluster-a"):
+            activation._apply_immediate_import_annotations()
 
-    def test_reset_immediate_import_annotation_handles_api_exception(self, mock_secondary_client, mock_state_manager):
-        """Verify ApiException returns False and logs warning."""
+    def test_apply_immediate_import_annotations_patches_all_clusters_despite_failures(
+        self, mock_secondary_client, mock_state_manager
+    ):
+        """A failing cluster does not stop the others; failures are aggregated."""
+        mock_state_manager.get_config.return_value = "2.14.0"
         activation = SecondaryActivation(
             secondary_client=mock_secondary_client,
             state_manager=mock_state_manager,
             method="passive",
         )
 
-        mock_secondary_client.patch_managed_cluster.side_effect = ApiException(status=409)
+        mock_secondary_client.get_configmap.return_value = None
+        mock_secondary_client.list_custom_resources.return_value = [
+            {"metadata": {"name": f"cluster-{i}", "annotations": {}}} for i in range(5)
+        ]
 
-        result = activation._reset_immediate_import_annotation("cluster-a", "Completed")
+        def patch_side_effect(name, patch):
+            if name == "cluster-2":
+                raise ApiException(status=409)
+            return {"metadata": {"name": name}}
 
-        assert result is False
-        mock_secondary_client.patch_managed_cluster.assert_called_once()
+        mock_secondary_client.patch_managed_cluster.side_effect = patch_side_effect
+
+        with pytest.raises(FatalError) as exc_info:
+            activation._apply_immediate_import_annotations()
+
+        assert "1 ManagedCluster(s): cluster-2" in str(exc_info.value)
+        assert mock_secondary_client.patch_managed_cluster.call_count == 5
 
 
 @pytest.mark.unit
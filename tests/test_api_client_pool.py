@@ -0,0 +1,99 @@
+"""Unit tests for lib/api_client_pool.py.
+
+Tests cover building per-context ApiClients from parsed kubeconfig data,
+reuse across threads, the file-based fallback, and clearing or resetting the pool.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes import client
+
+from lib.api_client_pool import ApiClientPool
+
+
+def _kubeconfig(*names):
+    """Build a parsed kubeconfig with one token-authenticated context per name."""
+    return {
+        "contexts": [{"name": n, "context": {"cluster": f"{n}-cluster", "user": f"{n}-user"}} for n in names],
+        "clusters": [
+            {"name": f"{n}-cluster", "cluster": {"server": f"https://api.{n}.example.com:6443"}} for n in names
+        ],
+        "users": [{"name": f"{n}-user", "user": {"token": f"{n}-token"}} for n in names],
+    }
+
+
+@pytest.mark.unit
+class TestApiClientPool:
+    """Tests for ApiClientPool."""
+
+    def test_builds_client_from_parsed_kubeconfig(self):
+        pool = ApiClientPool()
+        default_host = client.Configuration.get_default_copy().host
+
+        api_client = pool.get("spoke1", _kubeconfig("spoke1", "spoke2"))
+
+        assert api_client.configuration.host == "https://api.spoke1.example.com:6443"
+        assert "Bearer spoke1-token" in api_client.configuration.api_key.values()
+        # The process-wide default configuration is left untouched
+        assert client.Configuration.get_default_copy().host == default_host
+
+    def test_reuses_client_per_context(self):
+        pool = ApiClientPool()
+        data = _kubeconfig("spoke1", "spoke2")
+
+        first = pool.get("spoke1", data)
+
+        assert pool.get("spoke1", data) is first
+        assert pool.get("spoke2", data) is not first
+        assert len(pool) == 2
+
+    def test_concurrent_callers_share_one_client(self):
+        pool = ApiClientPool()
+        data = _kubeconfig("spoke1")
+        results = []
+
+        def worker():
+            results.append(pool.get("spoke1", data))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(r) for r in results}) == 1
+        assert len(pool) == 1
+
+    def test_falls_back_to_kubeconfig_files_when_context_missing(self):
+        pool = ApiClientPool()
+        file_client = MagicMock()
+
+        with patch("lib.api_client_pool.config.new_client_from_config", return_value=file_client) as mock_new:
+            api_client = pool.get("unknown", _kubeconfig("spoke1"))
+
+        assert api_client is file_client
+        mock_new.assert_called_once_with(context="unknown", persist_config=False)
+
+    def test_clear_closes_clients(self):
+        pool = ApiClientPool()
+        api_client = pool.get("spoke1", _kubeconfig("spoke1"))
+
+        with patch.object(api_client, "close") as mock_close:
+            pool.clear()
+
+        mock_close.assert_called_once()
+        assert len(pool) == 0
+        assert pool.get("spoke1", _kubeconfig("spoke1")) is not api_client
+
+    def test_reset_drops_clients_without_closing(self):
+        pool = ApiClientPool()
+        api_client = pool.get("spoke1", _kubeconfig("spoke1"))
+
+        with patch.object(api_client, "close") as mock_close:
+            pool.reset()
+
+        mock_close.assert_not_called()  # A worker may still be mid-request on it
+        assert len(pool) == 0
+        assert pool.get("spoke1", _kubeconfig("spoke1")) is not api_client
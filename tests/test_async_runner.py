@@ -0,0 +1,100 @@
+"""Unit tests for lib/async_runner.py.
+
+Tests cover result ordering, the concurrency bound, per-item timeouts and
+progress logging of the bounded asyncio fan-out.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from lib.async_runner import run_bounded
+
+
+@pytest.mark.unit
+class TestRunBounded:
+    """Tests for run_bounded."""
+
+    def test_results_follow_input_order(self):
+        def work(n, delay):
+            time.sleep(delay)
+            return n * 2
+
+        items = [(1, 0.03), (2, 0.0), (3, 0.01)]
+
+        assert run_bounded(work, items, concurrency=3) == [2, 4, 6]
+
+    def test_empty_input(self):
+        assert run_bounded(lambda: None, [], concurrency=5) == []
+
+    def test_in_flight_never_exceeds_concurrency(self):
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def work(_n):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.01)
+            with lock:
+                state["current"] -= 1
+
+        run_bounded(work, [(i,) for i in range(40)], concurrency=4)
+
+        assert 1 < state["peak"] <= 4
+
+    def test_many_items_run_concurrently(self):
+        barrier = threading.Barrier(50, timeout=5)
+
+        # Deadlocks (BrokenBarrierError) unless all 50 calls are in flight together
+        results = run_bounded(lambda n: barrier.wait() is not None, [(i,) for i in range(50)], concurrency=50)
+
+        assert all(results)
+
+    def test_timeout_uses_fallback_result(self):
+        release = threading.Event()
+
+        def work(name):
+            if name == "hung":
+                release.wait(5)
+            return (name, "ok")
+
+        try:
+            results = run_bounded(
+                work,
+                [("a",), ("hung",), ("b",)],
+                concurrency=3,
+                timeout=0.05,
+                on_timeout=lambda name: (name, "timeout"),
+            )
+        finally:
+            release.set()
+
+        assert results == [("a", "ok"), ("hung", "timeout"), ("b", "ok")]
+
+    def test_timeout_without_fallback_raises(self):
+        release = threading.Event()
+        try:
+            with pytest.raises(Exception) as exc_info:
+                run_bounded(lambda: release.wait(5), [()], concurrency=1, timeout=0.01)
+        finally:
+            release.set()
+
+        assert "Timeout" in type(exc_info.value).__name__
+
+    def test_exceptions_propagate(self):
+        def work(n):
+            if n == 2:
+                raise ValueError("boom")
+            return n
+
+        with pytest.raises(ValueError, match="boom"):
+            run_bounded(work, [(1,), (2,), (3,)], concurrency=2)
+
+    def test_logs_final_progress(self, caplog):
+        with caplog.at_level(logging.INFO, logger="acm_switchover"):
+            run_bounded(lambda n: n, [(i,) for i in range(5)], concurrency=2, label="Spoke checks")
+
+        assert "Spoke checks: 5/5 complete" in caplog.text
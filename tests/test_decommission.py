@@ -3,17 +3,21 @@
 Tests cover Decommission class for removing ACM from old primary hub.
 """
 
+import logging
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from kubernetes.client.rest import ApiException
 
 # Add parent to path to import modules directly
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import modules.decommission as decommission_module
-from lib.constants import ACM_NAMESPACE, OBSERVABILITY_NAMESPACE
+from lib.constants import ACM_NAMESPACE, MANAGED_CLUSTER_DELETE_MAX_WORKERS, OBSERVABILITY_NAMESPACE
 from lib.exceptions import SwitchoverError
 
 Decommission = decommission_module.Decommission
@@ -23,10 +27,16 @@
 def mock_primary_client():
     """Create a mock KubeClient for primary hub."""
     client = Mock()
-    client.list_managed_clusters = Mock(return_value=[])
+    client.list_custom_resources_with_version = Mock(return_value=([], ""))
     return client
 
 
+def _managed_clusters(client, items):
+    """List ManagedClusters at resourceVersion 100; the watch then reports each one DELETED."""
+    client.list_custom_resources_with_version.return_value = (items, "100")
+    client.watch_custom_resources.return_value = iter([{"type": "DELETED", "object": item} for item in items])
+
+
 @pytest.fixture
 def decommission_with_obs(mock_primary_client):
     """Create Decommission instance with observability."""
@@ -59,7 +69,7 @@ def test_decommission_non_interactive_with_observability(
 
         # Mock resources
         mock_primary_client.list_custom_resources.return_value = [{"metadata": {"name": "observability"}}]
-        mock_primary_client.list_managed_clusters.return_value = [{"metadata": {"name": "cluster1"}}]
+        _managed_clusters(mock_primary_client, [{"metadata": {"name": "cluster1"}}])
         mock_primary_client.delete_custom_resource.return_value = True
 
         result = decommission_with_obs.decommission(interactive=False)
@@ -80,10 +90,7 @@ def test_decommission_non_interactive_without_observability(
             {"metadata": {"name": "cluster1"}},
             {"metadata": {"name": "cluster2"}},
         ]
-        mock_primary_client.list_managed_clusters.return_value = [
-            {"metadata": {"name": "cluster1"}},
-            {"metadata": {"name": "cluster2"}},
-        ]
+        _managed_clusters(mock_primary_client, [{"metadata": {"name": "cluster1"}}, {"metadata": {"name": "cluster2"}}])
         mock_primary_client.delete_custom_resource.return_value = True
 
         result = decommission_no_obs.decommission(interactive=False)
@@ -110,7 +117,7 @@ def test_decommission_interactive_user_confirms(
         mock_wait.return_value = True
 
         mock_primary_client.list_custom_resources.return_value = []
-        mock_primary_client.list_managed_clusters.return_value = []
+        _managed_clusters(mock_primary_client, [])
         mock_primary_client.delete_custom_resource.return_value = True
 
         result = decommission_with_obs.decommission(interactive=True)
@@ -145,52 +152,166 @@ def test_delete_observability_not_found(self, mock_wait, decommission_with_obs,
 
         mock_primary_client.delete_custom_resource.assert_not_called()
 
-    @patch("modules.decommission.wait_for_condition")
-    def test_delete_managed_clusters_excludes_local(self, mock_wait, decommission_with_obs, mock_primary_client):
+    def test_delete_managed_clusters_excludes_local(self, decommission_with_obs, mock_primary_client):
         """Test that local-cluster is excluded from deletion."""
-        mock_wait.return_value = True  # Simulate successful wait for deletion
-
-        mock_primary_client.list_custom_resources.return_value = [
-            {"metadata": {"name": "cluster1"}},
-            {"metadata": {"name": "local-cluster"}},
-            {"metadata": {"name": "cluster2"}},
-        ]
-        mock_primary_client.list_managed_clusters.return_value = [
-            {"metadata": {"name": "cluster1"}},
-            {"metadata": {"name": "local-cluster"}},
-            {"metadata": {"name": "cluster2"}},
-        ]
+        _managed_clusters(
+            mock_primary_client,
+            [
+                {"metadata": {"name": "cluster1"}},
+                {"metadata": {"name": "local-cluster"}},
+                {"metadata": {"name": "cluster2"}},
+            ],
+        )
 
         decommission_with_obs._delete_managed_clusters()
 
         # Should delete cluster1 and cluster2, but not local-cluster
-        assert mock_primary_client.delete_custom_resource.call_count == 2
-        # Should have waited for ManagedCluster removal
-        mock_wait.assert_called_once()
-
-    @patch("modules.decommission.wait_for_condition")
-    def test_delete_managed_clusters_timeout(self, mock_wait, decommission_with_obs, mock_primary_client):
+        deleted = {c.kwargs["name"] for c in mock_primary_client.delete_custom_resource.call_args_list}
+        assert deleted == {"cluster1", "cluster2"}
+        # Removal is tracked from the list's resourceVersion without re-listing
+        mock_primary_client.watch_custom_resources.assert_called_once()
+        assert mock_primary_client.watch_custom_resources.call_args.kwargs["resource_version"] == "100"
+        mock_primary_client.list_custom_resources_with_version.assert_called_once()
+
+    def test_delete_managed_clusters_timeout(self, decommission_with_obs, mock_primary_client):
         """Test that deletion fails when ManagedClusters are not removed in time."""
-        mock_wait.return_value = False  # Simulate timeout
+        _managed_clusters(
+            mock_primary_client, [{"metadata": {"name": "cluster1"}}, {"metadata": {"name": "local-cluster"}}]
+        )
 
-        mock_primary_client.list_managed_clusters.return_value = [
-            {"metadata": {"name": "cluster1"}},
-            {"metadata": {"name": "local-cluster"}},
-        ]
+        with patch.object(decommission_with_obs, "_wait_for_managed_clusters_removed", return_value=False):
+            with pytest.raises(SwitchoverError) as exc_info:
+                decommission_with_obs._delete_managed_clusters()
+
+        assert "ManagedClusters not fully removed" in str(exc_info.value)
+
+    def test_delete_managed_clusters_skips_terminating(self, decommission_with_obs, mock_primary_client):
+        """Clusters deleted by an interrupted earlier run are not deleted again, but still awaited."""
+        _managed_clusters(
+            mock_primary_client, [{"metadata": {"name": "cluster1", "deletionTimestamp": "2026-01-01T00:00:00Z"}}]
+        )
 
-        with pytest.raises(SwitchoverError) as exc_info:
+        with patch.object(
+            decommission_with_obs, "_wait_for_managed_clusters_removed", return_value=True
+        ) as mock_wait_removed:
             decommission_with_obs._delete_managed_clusters()
 
-        assert "ManagedClusters not fully removed" in str(exc_info.value)
+        mock_primary_client.delete_custom_resource.assert_not_called()
+        mock_wait_removed.assert_called_once_with(["cluster1"], "100")
 
     def test_delete_managed_clusters_none_found(self, decommission_with_obs, mock_primary_client):
         """Test when no managed clusters exist."""
-        mock_primary_client.list_custom_resources.return_value = []
-        mock_primary_client.list_managed_clusters.return_value = []
+        _managed_clusters(mock_primary_client, [])
 
         decommission_with_obs._delete_managed_clusters()
 
         mock_primary_client.delete_custom_resource.assert_not_called()
+        mock_primary_client.watch_custom_resources.assert_not_called()
+
+    def test_delete_managed_clusters_dry_run(self, mock_primary_client):
+        """Dry-run lists ManagedClusters but neither deletes nor waits."""
+        decomm = Decommission(primary_client=mock_primary_client, has_observability=False, dry_run=True)
+        _managed_clusters(mock_primary_client, [{"metadata": {"name": "cluster1"}}])
+
+        decomm._delete_managed_clusters()
+
+        mock_primary_client.delete_custom_resource.assert_not_called()
+        mock_primary_client.watch_custom_resources.assert_not_called()
+
+    def test_delete_managed_clusters_concurrently(self, decommission_with_obs, mock_primary_client):
+        """Deletes run on a bounded worker pool."""
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+
+        def _delete(**kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return True
+
+        mock_primary_client.delete_custom_resource.side_effect = _delete
+        _managed_clusters(mock_primary_client, [{"metadata": {"name": f"cluster{i}"}} for i in range(30)])
+
+        decommission_with_obs._delete_managed_clusters()
+
+        assert mock_primary_client.delete_custom_resource.call_count == 30
+        assert 1 < in_flight[1] <= MANAGED_CLUSTER_DELETE_MAX_WORKERS
+
+    def test_delete_managed_clusters_failures_aggregated(self, decommission_with_obs, mock_primary_client):
+        """A failed delete doesn't stop the others, but blocks the wait and MCH deletion."""
+
+        def _delete(**kwargs):
+            if kwargs["name"] == "cluster2":
+                raise RuntimeError("admission webhook denied the request")
+            return True
+
+        mock_primary_client.delete_custom_resource.side_effect = _delete
+        _managed_clusters(mock_primary_client, [{"metadata": {"name": f"cluster{i}"}} for i in range(1, 4)])
+
+        with pytest.raises(SwitchoverError, match="Failed to delete 1 ManagedCluster"):
+            decommission_with_obs._delete_managed_clusters()
+
+        assert mock_primary_client.delete_custom_resource.call_count == 3
+        mock_primary_client.watch_custom_resources.assert_not_called()
+
+    def test_wait_resyncs_after_watch_closes(self, decommission_with_obs, mock_primary_client):
+        """A watch that ends early is resynced with a list; the next watch resumes from its resourceVersion."""
+        cluster2 = {"metadata": {"name": "cluster2"}}
+        mock_primary_client.watch_custom_resources.side_effect = [
+            iter([{"type": "DELETED", "object": {"metadata": {"name": "cluster1", "resourceVersion": "101"}}}]),
+            iter([{"type": "MODIFIED", "object": cluster2}, {"type": "DELETED", "object": cluster2}]),
+        ]
+        mock_primary_client.list_custom_resources_with_version.return_value = ([cluster2], "150")
+
+        assert decommission_with_obs._wait_for_managed_clusters_removed(["cluster1", "cluster2"], "100") is True
+
+        versions = [c.kwargs["resource_version"] for c in mock_primary_client.watch_custom_resources.call_args_list]
+        assert versions == ["100", "150"]
+
+    def test_wait_resyncs_after_watch_error(self, decommission_with_obs, mock_primary_client):
+        """410 Gone re-lists ManagedClusters; clusters missing from the list count as removed."""
+        mock_primary_client.watch_custom_resources.side_effect = [ApiException(status=410, reason="Gone")]
+        mock_primary_client.list_custom_resources_with_version.return_value = (
+            [{"metadata": {"name": "local-cluster"}}],
+            "300",
+        )
+
+        assert decommission_with_obs._wait_for_managed_clusters_removed(["cluster1"], "100") is True
+        mock_primary_client.list_custom_resources_with_version.assert_called_once()
+
+    def test_wait_polls_without_rewatching_after_forbidden(self, decommission_with_obs, mock_primary_client):
+        """A 403 on the watch (no watch permission) falls back to one list per MANAGED_CLUSTER_DELETE_INTERVAL."""
+        clock = {"now": 1000.0}
+        list_times = []
+
+        def list_clusters(**kwargs):
+            list_times.append(clock["now"])
+            remaining = [] if len(list_times) >= 4 else [{"metadata": {"name": "cluster1"}}]
+            return remaining, str(len(list_times))
+
+        def sleep(seconds):
+            clock["now"] += seconds
+
+        mock_primary_client.watch_custom_resources.side_effect = ApiException(status=403, reason="Forbidden")
+        mock_primary_client.list_custom_resources_with_version.side_effect = list_clusters
+        with patch("modules.decommission.time") as mock_time:
+            mock_time.monotonic.side_effect = lambda: clock["now"]
+            mock_time.sleep.side_effect = sleep
+            assert decommission_with_obs._wait_for_managed_clusters_removed(["cluster1"], "100") is True
+
+        interval = decommission_module.MANAGED_CLUSTER_DELETE_INTERVAL
+        mock_primary_client.watch_custom_resources.assert_called_once()
+        assert len(list_times) == 4
+        assert list_times[0] - 1000.0 >= interval
+        assert all(later - earlier >= interval for earlier, later in zip(list_times, list_times[1:]))
+
+    def test_wait_times_out(self, decommission_with_obs, mock_primary_client):
+        """Clusters whose finalizers never complete fail the wait."""
+        assert decommission_with_obs._wait_for_managed_clusters_removed(["cluster1"], "100", timeout=0) is False
+        mock_primary_client.watch_custom_resources.assert_not_called()
 
     @patch("modules.decommission.wait_for_condition")
     def test_delete_multiclusterhub(self, mock_wait, decommission_with_obs, mock_primary_client):
@@ -270,7 +391,7 @@ def list_side_effect(*args, **kwargs):
             return []
 
         mock_primary_client.list_custom_resources.side_effect = list_side_effect
-        mock_primary_client.list_managed_clusters.return_value = []
+        _managed_clusters(mock_primary_client, [])
         mock_primary_client.delete_custom_resource.return_value = True
 
         # Only operator pods remain after MCH deletion
@@ -311,7 +432,7 @@ def test_full_decommission_workflow(self, mock_wait, mock_primary_client):
             [{"metadata": {"name": "cluster1"}}],  # ManagedClusters
             [{"metadata": {"name": "multiclusterhub"}}],  # MCH
         ]
-        mock_primary_client.list_managed_clusters.return_value = [{"metadata": {"name": "cluster1"}}]
+        _managed_clusters(mock_primary_client, [{"metadata": {"name": "cluster1"}}])
         mock_primary_client.delete_custom_resource.return_value = True
 
         result = decomm.decommission(interactive=False)
@@ -319,3 +440,45 @@ def test_full_decommission_workflow(self, mock_wait, mock_primary_client):
         assert result is True
         # Verify resources were deleted
         assert mock_primary_client.delete_custom_resource.call_count >= 3
+
+
+@pytest.mark.unit
+class TestRemovalProgress:
+    """Tests for the remaining-set tracker of ManagedCluster removal."""
+
+    def test_tracks_removals_incrementally(self):
+        progress = decommission_module._RemovalProgress(["a", "b", "c"])
+
+        progress.removed("a")
+        progress.removed("a")  # duplicate event
+        progress.removed("other")  # not tracked
+        progress.added("d")
+        progress.resync(["c", "d"])
+
+        assert progress.remaining == {"c", "d"}
+        assert progress.removed_count == 2
+
+    def test_report_shows_count_rate_and_eta(self, caplog):
+        with patch("modules.decommission.time.monotonic", return_value=0.0):
+            progress = decommission_module._RemovalProgress([f"cluster{i}" for i in range(100)])
+        for i in range(40):
+            progress.remaining.discard(f"cluster{i}")
+        progress.removed_count = 40
+
+        with caplog.at_level(logging.INFO, logger="acm_switchover"), patch(
+            "modules.decommission.time.monotonic", return_value=20.0
+        ):
+            progress.report()
+
+        assert "60 remaining, 40 removed in 20.0s (2.0/s, ETA 30.0s)" in caplog.text
+        assert "cluster50" not in caplog.text
+
+    def test_report_is_rate_limited(self, caplog):
+        progress = decommission_module._RemovalProgress(["a"], interval=60)
+
+        with caplog.at_level(logging.INFO, logger="acm_switchover"):
+            progress.report()
+            assert caplog.text == ""
+            progress.report(force=True)
+
+        assert "1 remaining" in caplog.text
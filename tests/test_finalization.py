@@ -3,6 +3,7 @@
 Tests cover Finalization class for completing the switchover.
 """
 
+import itertools
 import sys
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
@@ -10,11 +11,13 @@
 from unittest.mock import Mock, call, patch
 
 import pytest
+from kubernetes.client.rest import ApiException
 
 # Add parent to path to import modules directly
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import modules.finalization as finalization_module
+from lib.constants import VELERO_LOG_LOOKBACK_MARGIN, VELERO_LOG_TAIL_LINES
 from lib.exceptions import SwitchoverError
 
 Finalization = finalization_module.Finalization
@@ -36,6 +39,15 @@ def mock_step(step_name, logger=None):
     return mock_step
 
 
+def _get_resource_by_plural(**resources):
+    """Build a get_custom_resource side effect returning resources keyed by plural."""
+
+    def _get(plural=None, **_kwargs):
+        return resources.get(plural)
+
+    return _get
+
+
 @pytest.fixture
 def mock_secondary_client():
     """Create a mock KubeClient for secondary hub."""
@@ -114,7 +126,7 @@ def test_finalize_success(
     ):
         """Test successful finalization workflow."""
         # Mock time to avoid loops
-        mock_time.time.side_effect = [0, 1, 2, 3]
+        mock_time.time.return_value = 0
         backup_ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
         # Mock list responses: schedule verification, collision check, initial backups, loop 1, loop 2
@@ -127,21 +139,24 @@ def test_finalize_success(
                     "status": {"phase": "Enabled"},
                 }
             ],  # fix_backup_collision
-            [],  # Initial backups
-            [],  # Loop iteration 1
-            [{"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}}],  # Loop iteration 2 - new backup
-            [
-                {
-                    "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
-                    "status": {"phase": "Completed", "completionTimestamp": backup_ts},
-                }
-            ],  # verify_backup_integrity
+            [],  # BackupSchedule refresh
         ]
+        mock_secondary_client.get_latest_velero_backups.return_value = [
+            {
+                "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
+                "status": {"phase": "Completed", "completionTimestamp": backup_ts},
+            }
+        ]  # verify_backup_integrity
+        # verify_new_backups lists backups, then watches from the list resourceVersion
+        mock_secondary_client.list_custom_resources_with_version.return_value = ([], "100")
+        mock_secondary_client.watch_custom_resources.return_value = iter(
+            [{"type": "ADDED", "object": {"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}}}]
+        )
 
-        mock_secondary_client.get_custom_resource.return_value = {
-            "metadata": {"name": "multiclusterhub"},
-            "status": {"phase": "Running"},
-        }
+        mock_secondary_client.get_custom_resource.side_effect = _get_resource_by_plural(
+            backups={"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}},
+            multiclusterhubs={"metadata": {"name": "multiclusterhub"}, "status": {"phase": "Running"}},
+        )
         mock_secondary_client.get_pods.return_value = []
 
         result = finalization.finalize()
@@ -176,44 +191,110 @@ def test_finalize_skips_completed_steps(self, finalization, mock_state_manager,
 
     @patch("modules.finalization.time")
     def test_verify_new_backups_success(self, mock_time, finalization, mock_secondary_client):
-        """Test backup verification logic finding a new backup."""
-        # Mock time.time() to increment, avoiding real sleep calls
-        # Calls: start_time, check 1, check 2, check 3
-        mock_time.time.side_effect = [0, 0, 1, 2]
-
-        # Sequence of API calls:
-        # 1. Initial list (empty)
-        # 2. Loop 1 list (still empty)
-        # 3. Loop 2 list (new backup found)
-        # Velero uses "Completed" phase, not "Finished"
-        mock_secondary_client.list_custom_resources.side_effect = [
-            [],
-            [],
-            [{"metadata": {"name": "new-backup"}, "status": {"phase": "Completed"}}],
+        """A new backup is detected from watch events that follow the initial list."""
+        mock_time.time.return_value = 0
+        mock_secondary_client.list_custom_resources_with_version.return_value = (
+            [{"metadata": {"name": "old-backup"}}],
+            "100",
+        )
+        # New backups appear without a status; Velero sets the phase in a later update
+        mock_secondary_client.watch_custom_resources.return_value = iter(
+            [
+                {"type": "MODIFIED", "object": {"metadata": {"name": "old-backup", "resourceVersion": "101"}}},
+                {"type": "ADDED", "object": {"metadata": {"name": "new-backup", "resourceVersion": "102"}}},
+                {
+                    "type": "MODIFIED",
+                    "object": {
+                        "metadata": {"name": "new-backup", "resourceVersion": "103"},
+                        "status": {"phase": "New"},
+                    },
+                },
+            ]
+        )
+
+        finalization._verify_new_backups(timeout=10)
+
+        # One metadata-only list; no re-listing or per-backup GETs while watching
+        mock_secondary_client.list_custom_resources_with_version.assert_called_once_with(
+            group="velero.io",
+            version="v1",
+            plural="backups",
+            namespace="open-cluster-management-backup",
+            metadata_only=True,
+        )
+        watch_kwargs = mock_secondary_client.watch_custom_resources.call_args.kwargs
+        assert watch_kwargs["resource_version"] == "100"
+        mock_secondary_client.get_custom_resource.assert_not_called()
+        mock_secondary_client.iter_custom_resources.assert_not_called()
+        finalization.state.set_config.assert_called_once_with("new_backup_detected", True)
+
+    @patch("modules.finalization.time")
+    def test_verify_new_backups_relists_when_watch_expires(self, mock_time, finalization, mock_secondary_client):
+        """A failed watch (410 Gone) is resynced by re-listing and resumed from the new resourceVersion."""
+        mock_time.time.return_value = 0
+        mock_secondary_client.list_custom_resources_with_version.side_effect = [
+            ([], "100"),
+            ([], "200"),
+        ]
+        mock_secondary_client.watch_custom_resources.side_effect = [
+            ApiException(status=410),
+            iter([{"type": "ADDED", "object": {"metadata": {"name": "b1"}, "status": {"phase": "Completed"}}}]),
         ]
 
         finalization._verify_new_backups(timeout=10)
 
-        assert mock_secondary_client.list_custom_resources.call_count == 3
+        resumed_from = [
+            c.kwargs["resource_version"] for c in mock_secondary_client.watch_custom_resources.call_args_list
+        ]
+        assert resumed_from == ["100", "200"]
+        finalization.state.set_config.assert_called_once_with("new_backup_detected", True)
+        mock_time.sleep.assert_not_called()
+
+    @patch("modules.finalization.time")
+    def test_verify_new_backups_polls_when_watch_unavailable(self, mock_time, finalization, mock_secondary_client):
+        """Watches that close immediately degrade to polling with metadata-only lists."""
+        mock_time.time.side_effect = itertools.count(0, 0.25)
+        mock_secondary_client.list_custom_resources_with_version.side_effect = [([], "100")] * 4 + [
+            ([{"metadata": {"name": "new-backup"}}], "300")
+        ]
+        mock_secondary_client.watch_custom_resources.side_effect = lambda **kwargs: iter([])
+        mock_secondary_client.get_custom_resource.return_value = {
+            "metadata": {"name": "new-backup"},
+            "status": {"phase": "InProgress"},
+        }
+
+        finalization._verify_new_backups(timeout=60)
+
+        assert mock_secondary_client.watch_custom_resources.call_count == 3
+        mock_time.sleep.assert_called_once_with(30)
+        mock_secondary_client.get_custom_resource.assert_called_once_with(
+            group="velero.io",
+            version="v1",
+            plural="backups",
+            name="new-backup",
+            namespace="open-cluster-management-backup",
+        )
+        finalization.state.set_config.assert_called_once_with("new_backup_detected", True)
 
     @patch("modules.finalization.time")
     def test_verify_new_backups_timeout(self, mock_time, finalization, mock_secondary_client):
         """Test backup verification timeout."""
-        # Mock time to simulate timeout
-        # Calls: start_time, check 1, check 2, final check after loop
-        mock_time.time.side_effect = [0, 10, 45, 51]
-
-        mock_secondary_client.list_custom_resources.return_value = []
+        # Each watch ends at its server-side timeout without a new backup
+        mock_time.time.side_effect = itertools.count(0, 10)
+        mock_secondary_client.list_custom_resources_with_version.return_value = ([], "100")
+        mock_secondary_client.watch_custom_resources.side_effect = lambda **kwargs: iter([])
 
         finalization._verify_new_backups(timeout=50)
 
         # Should log warning but not crash
-        assert mock_secondary_client.list_custom_resources.called
+        assert mock_secondary_client.watch_custom_resources.called
+        finalization.state.set_config.assert_not_called()
 
     def test_verify_backup_integrity_success(self, finalization, mock_secondary_client):
         """Backup integrity should pass for a recent completed backup with no errors."""
         backup_ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # no BackupSchedule
+        mock_secondary_client.get_latest_velero_backups.return_value = [
             {
                 "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
                 "status": {"phase": "Completed", "completionTimestamp": backup_ts, "errors": 0, "warnings": 0},
@@ -259,7 +340,8 @@ def test_parse_cron_interval_seconds(self, finalization, cron_expr, expected_sec
     def test_verify_backup_integrity_skips_age_without_new_backup(self, finalization, mock_secondary_client):
         """Backup age enforcement should be skipped if no new backup was detected."""
         backup_ts = (datetime.now(timezone.utc) - timedelta(seconds=1200)).isoformat().replace("+00:00", "Z")
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # no BackupSchedule
+        mock_secondary_client.get_latest_velero_backups.return_value = [
             {
                 "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
                 "status": {"phase": "Completed", "completionTimestamp": backup_ts, "errors": 0, "warnings": 0},
@@ -273,7 +355,8 @@ def test_verify_backup_integrity_skips_age_without_new_backup(self, finalization
     def test_verify_backup_integrity_enforces_age_with_new_backup(self, finalization, mock_secondary_client):
         """Backup age enforcement should fail when a new backup was detected but is too old."""
         backup_ts = (datetime.now(timezone.utc) - timedelta(seconds=1200)).isoformat().replace("+00:00", "Z")
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # no BackupSchedule
+        mock_secondary_client.get_latest_velero_backups.return_value = [
             {
                 "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
                 "status": {"phase": "Completed", "completionTimestamp": backup_ts, "errors": 0, "warnings": 0},
@@ -291,7 +374,8 @@ def test_verify_backup_integrity_skips_age_if_backup_before_enable(self, finaliz
         """Backup age enforcement should be skipped if backup predates enable timestamp."""
         backup_ts = (datetime.now(timezone.utc) - timedelta(seconds=1200)).isoformat().replace("+00:00", "Z")
         enabled_ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # no BackupSchedule
+        mock_secondary_client.get_latest_velero_backups.return_value = [
             {
                 "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
                 "status": {"phase": "Completed", "completionTimestamp": backup_ts, "errors": 0, "warnings": 0},
@@ -309,7 +393,8 @@ def test_verify_backup_integrity_waits_for_completion(self, mock_wait, finalizat
         """Backup integrity should wait for the latest backup to complete."""
         backup_ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         mock_wait.return_value = True
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # no BackupSchedule
+        mock_secondary_client.get_latest_velero_backups.return_value = [
             {
                 "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
                 "status": {"phase": "InProgress"},
@@ -328,7 +413,8 @@ def test_verify_backup_integrity_waits_for_completion(self, mock_wait, finalizat
     def test_verify_backup_integrity_fails_on_errors(self, finalization, mock_secondary_client):
         """Backup integrity should fail when backup reports errors."""
         backup_ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        mock_secondary_client.list_custom_resources.return_value = [
+        mock_secondary_client.list_custom_resources.return_value = []  # no BackupSchedule
+        mock_secondary_client.get_latest_velero_backups.return_value = [
             {
                 "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
                 "status": {"phase": "Completed", "completionTimestamp": backup_ts, "errors": 2},
@@ -339,6 +425,58 @@ def test_verify_backup_integrity_fails_on_errors(self, finalization, mock_second
         with pytest.raises(SwitchoverError):
             finalization._verify_backup_integrity(max_age_seconds=600)
 
+    def test_velero_log_scan_bounded_to_backup_window(self, finalization, mock_secondary_client):
+        """Velero logs are requested since the backup start and read only until its completion."""
+        now = datetime.now(timezone.utc)
+        started_at = now - timedelta(seconds=120)
+        completed_at = now - timedelta(seconds=100)
+
+        def _stamp(moment):
+            return moment.strftime("%Y-%m-%dT%H:%M:%S.123456789Z")
+
+        consumed = []
+
+        def _lines(**kwargs):
+            for line in (
+                f'{_stamp(started_at)} level=info msg="Starting backup" backup=ns/backup-1',
+                f'{_stamp(started_at)} level=error msg="Error backing up item" backup=ns/backup-1',
+                f'{_stamp(started_at)} level=error msg="Error backing up item" backup=ns/backup-0',
+                f'{_stamp(completed_at)} level=info msg="Backup completed" backup=ns/backup-1',
+                f'{_stamp(now)} level=error msg="failed later" backup=ns/backup-1',
+                "unreachable",
+            ):
+                consumed.append(line)
+                yield line
+
+        mock_secondary_client.get_pods.return_value = [{"metadata": {"name": "velero-1"}}]
+        mock_secondary_client.iter_pod_log_lines.side_effect = _lines
+
+        with patch("modules.finalization.logger") as mock_logger:
+            finalization._check_velero_logs_for_backup("backup-1", started_at=started_at, completed_at=completed_at)
+
+        kwargs = mock_secondary_client.iter_pod_log_lines.call_args.kwargs
+        assert 120 + VELERO_LOG_LOOKBACK_MARGIN <= kwargs["since_seconds"] <= 122 + VELERO_LOG_LOOKBACK_MARGIN
+        assert kwargs["timestamps"] is True
+        assert "tail_lines" not in kwargs
+        assert "unreachable" not in consumed
+        mock_logger.warning.assert_called_once_with(
+            "Velero logs from %s show %s error line(s) for backup %s", "velero-1", 1, "backup-1"
+        )
+
+    def test_velero_log_scan_falls_back_to_tail_without_start_time(self, finalization, mock_secondary_client):
+        """Without a backup start time the last VELERO_LOG_TAIL_LINES lines are scanned."""
+        mock_secondary_client.get_pods.return_value = [{"metadata": {"name": "velero-1"}}]
+        mock_secondary_client.iter_pod_log_lines.return_value = iter(["backup=ns/backup-1 level=info"])
+
+        finalization._check_velero_logs_for_backup("backup-1")
+
+        mock_secondary_client.iter_pod_log_lines.assert_called_once_with(
+            name="velero-1",
+            namespace="open-cluster-management-backup",
+            container="velero",
+            tail_lines=VELERO_LOG_TAIL_LINES,
+        )
+
     @patch("modules.finalization.wait_for_condition")
     def test_disable_observability_on_secondary_deletes_mco(
         self, mock_wait, mock_secondary_client, mock_state_manager, mock_backup_manager
@@ -434,7 +572,7 @@ def test_finalize_skips_verify_old_hub_state_when_action_none(
         leave the old hub unchanged for manual handling.
         """
         # Mock time to avoid loops and sleep delays
-        mock_time.time.side_effect = [0, 1, 2, 3]
+        mock_time.time.return_value = 0
         mock_time.sleep.return_value = None
         backup_ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
@@ -452,20 +590,23 @@ def test_finalize_skips_verify_old_hub_state_when_action_none(
         mock_secondary_client.list_custom_resources.side_effect = [
             [{"metadata": {"name": "schedule"}, "spec": {"paused": False}}],  # verify_backup_schedule_enabled
             [{"metadata": {"name": "schedule"}, "spec": {}, "status": {"phase": "Enabled"}}],  # fix_backup_collision
-            [],  # Initial backups
-            [],  # Loop iteration 1
-            [{"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}}],  # Loop iteration 2 - new backup
-            [
-                {
-                    "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
-                    "status": {"phase": "Completed", "completionTimestamp": backup_ts},
-                }
-            ],  # verify_backup_integrity
+            [],  # BackupSchedule refresh
         ]
-        mock_secondary_client.get_custom_resource.return_value = {
-            "metadata": {"name": "multiclusterhub"},
-            "status": {"phase": "Running"},
-        }
+        mock_secondary_client.get_latest_velero_backups.return_value = [
+            {
+                "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
+                "status": {"phase": "Completed", "completionTimestamp": backup_ts},
+            }
+        ]  # verify_backup_integrity
+        # verify_new_backups lists backups, then watches from the list resourceVersion
+        mock_secondary_client.list_custom_resources_with_version.return_value = ([], "100")
+        mock_secondary_client.watch_custom_resources.return_value = iter(
+            [{"type": "ADDED", "object": {"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}}}]
+        )
+        mock_secondary_client.get_custom_resource.side_effect = _get_resource_by_plural(
+            backups={"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}},
+            multiclusterhubs={"metadata": {"name": "multiclusterhub"}, "status": {"phase": "Running"}},
+        )
         mock_secondary_client.get_pods.return_value = []
 
         # Ensure we track if _verify_old_hub_state was called
@@ -513,19 +654,22 @@ def test_finalize_calls_verify_old_hub_state_when_action_secondary(
             [
                 {"metadata": {"name": "schedule"}, "spec": {"veleroSchedule": "*/15 * * * *"}}
             ],  # _get_backup_verify_timeout
-            [],  # Initial backups
-            [{"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}}],  # New backup detected
-            [
-                {
-                    "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
-                    "status": {"phase": "Completed", "completionTimestamp": backup_ts},
-                }
-            ],  # verify_backup_integrity
         ]
-        mock_secondary_client.get_custom_resource.return_value = {
-            "metadata": {"name": "multiclusterhub"},
-            "status": {"phase": "Running"},
-        }
+        mock_secondary_client.get_latest_velero_backups.return_value = [
+            {
+                "metadata": {"name": "backup-1", "creationTimestamp": backup_ts},
+                "status": {"phase": "Completed", "completionTimestamp": backup_ts},
+            }
+        ]  # verify_backup_integrity
+        # verify_new_backups lists backups, then watches from the list resourceVersion
+        mock_secondary_client.list_custom_resources_with_version.return_value = ([], "100")
+        mock_secondary_client.watch_custom_resources.return_value = iter(
+            [{"type": "ADDED", "object": {"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}}}]
+        )
+        mock_secondary_client.get_custom_resource.side_effect = _get_resource_by_plural(
+            backups={"metadata": {"name": "backup-1"}, "status": {"phase": "InProgress"}},
+            multiclusterhubs={"metadata": {"name": "multiclusterhub"}, "status": {"phase": "Running"}},
+        )
         mock_secondary_client.get_pods.return_value = []
 
         with patch.object(fin, "_verify_old_hub_state") as mock_verify:
@@ -0,0 +1,194 @@
+"""Unit tests for lib/informer.py.
+
+Tests cover the ManagedCluster list+watch cache: initial sync, event handling,
+label indexing, 410 Gone recovery, stale-cache detection, and 401/403 handling.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from lib.informer import ResourceInformer, parse_label_selector
+
+
+def _mc(name, labels=None, rv="1"):
+    return {"metadata": {"name": name, "labels": labels or {}, "resourceVersion": rv}}
+
+
+@pytest.fixture
+def custom_api():
+    api = MagicMock()
+    api.list_cluster_custom_object.return_value = {
+        "metadata": {"resourceVersion": "100"},
+        "items": [
+            _mc("cluster1", {"env": "prod", "vendor": "OpenShift"}),
+            _mc("cluster2", {"env": "dev", "vendor": "OpenShift"}),
+            _mc("local-cluster", {"local-cluster": "true"}),
+        ],
+    }
+    return api
+
+
+@pytest.fixture
+def informer(custom_api):
+    inf = ResourceInformer(custom_api, "cluster.open-cluster-management.io", "v1", "managedclusters")
+    inf.relist()
+    return inf
+
+
+@pytest.mark.unit
+class TestParseLabelSelector:
+    """Tests for parse_label_selector."""
+
+    def test_empty_selector_matches_everything(self):
+        assert parse_label_selector(None) == []
+        assert parse_label_selector("  ") == []
+
+    def test_equality_terms(self):
+        assert parse_label_selector("a=b,c==d,e!=f") == [("a", "=", "b"), ("c", "=", "d"), ("e", "!=", "f")]
+
+    def test_existence_terms(self):
+        assert parse_label_selector("a,!b") == [("a", "exists", None), ("b", "!", None)]
+
+    def test_set_based_selector_unsupported(self):
+        assert parse_label_selector("env in (prod,dev)") is None
+
+
+@pytest.mark.unit
+class TestResourceInformer:
+    """Tests for ResourceInformer store behavior."""
+
+    def test_relist_populates_store(self, informer):
+        assert informer.has_synced()
+        assert informer.resource_version == "100"
+        assert [mc["metadata"]["name"] for mc in informer.list()] == ["cluster1", "cluster2", "local-cluster"]
+
+    def test_relist_follows_continue_token(self, custom_api):
+        custom_api.list_cluster_custom_object.side_effect = [
+            {"metadata": {"continue": "tok", "resourceVersion": "5"}, "items": [_mc("a")]},
+            {"metadata": {"resourceVersion": "6"}, "items": [_mc("b")]},
+        ]
+        inf = ResourceInformer(custom_api, "g", "v1", "managedclusters")
+        inf.relist()
+
+        assert len(inf.list()) == 2
+        assert inf.resource_version == "6"
+
+    def test_list_by_label_uses_index(self, informer):
+        result = informer.list("vendor=OpenShift,env!=dev")
+        assert [mc["metadata"]["name"] for mc in result] == ["cluster1"]
+
+    def test_list_unsupported_selector_returns_none(self, informer):
+        assert informer.list("env in (prod)") is None
+
+    def test_get_returns_copy(self, informer):
+        obj = informer.get("cluster1")
+        obj["metadata"]["labels"]["env"] = "mutated"
+        assert informer.get("cluster1")["metadata"]["labels"]["env"] == "prod"
+        assert informer.get("missing") is None
+
+    def test_modified_event_reindexes_labels(self, informer):
+        informer.handle_event({"type": "MODIFIED", "raw_object": _mc("cluster2", {"env": "prod"}, rv="101")})
+
+        assert [mc["metadata"]["name"] for mc in informer.list("env=prod")] == ["cluster1", "cluster2"]
+        assert informer.list("env=dev") == []
+        assert informer.resource_version == "101"
+
+    def test_deleted_event_removes_item(self, informer):
+        informer.handle_event({"type": "DELETED", "raw_object": _mc("cluster1", {"env": "prod"}, rv="102")})
+
+        assert informer.get("cluster1") is None
+        assert informer.list("env=prod") == []
+
+    def test_bookmark_only_advances_resource_version(self, informer):
+        informer.handle_event({"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "200"}}})
+
+        assert informer.resource_version == "200"
+        assert len(informer.list()) == 3
+
+    def test_watch_resumes_from_list_resource_version(self, informer):
+        with patch("lib.informer.watch.Watch") as mock_watch_cls:
+            mock_watch_cls.return_value.stream.return_value = iter(
+                [{"type": "ADDED", "raw_object": _mc("cluster3", rv="150")}]
+            )
+            informer._watch_once()
+
+        kwargs = mock_watch_cls.return_value.stream.call_args.kwargs
+        assert kwargs["resource_version"] == "100"
+        assert kwargs["allow_watch_bookmarks"] is True
+        assert informer.get("cluster3") is not None
+        assert informer.resource_version == "150"
+
+    def test_gone_triggers_relist(self, custom_api):
+        inf = ResourceInformer(custom_api, "g", "v1", "managedclusters", retry_interval=0)
+        calls = {"count": 0}
+
+        def fake_watch_once():
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise ApiException(status=410)
+            inf._stop_event.set()
+
+        with patch.object(inf, "_watch_once", side_effect=fake_watch_once):
+            inf._run()
+
+        assert custom_api.list_cluster_custom_object.call_count == 2
+
+    def test_repeated_watch_failures_mark_store_stale(self, custom_api):
+        """After max_watch_failures the store stops serving reads until a watch succeeds again."""
+        inf = ResourceInformer(custom_api, "g", "v1", "managedclusters", retry_interval=0, max_watch_failures=2)
+        synced_before_watch = []
+
+        def fake_stream(*args, **kwargs):
+            synced_before_watch.append(inf.has_synced())
+            attempt = len(synced_before_watch)
+            if attempt <= 3:
+                raise ApiException(status=500, reason="Internal Server Error")
+            inf._stop_event.set()
+            return iter([{"type": "ADDED", "raw_object": _mc("cluster3", rv="150")}])
+
+        with patch("lib.informer.watch.Watch") as mock_watch_cls:
+            mock_watch_cls.return_value.stream.side_effect = fake_stream
+            inf._run()
+
+        # Synced after the initial list and the first failure; stale from the second failure on
+        assert synced_before_watch == [True, True, False, False]
+        assert inf.has_synced() is True
+        assert inf.get("cluster3") is not None
+        custom_api.list_cluster_custom_object.assert_called_once()
+
+    def test_relist_while_watch_failing_does_not_resync(self, custom_api):
+        """A 410 relist during an outage doesn't make the store look current."""
+        inf = ResourceInformer(custom_api, "g", "v1", "managedclusters", max_watch_failures=1)
+        inf._watch_failures = 1
+
+        inf.relist()
+
+        assert inf.has_synced() is False
+
+    @pytest.mark.parametrize("status", [401, 403])
+    def test_forbidden_disables_informer(self, custom_api, status):
+        """Missing list/watch permission stops the informer without waiting for the sync timeout."""
+        custom_api.list_cluster_custom_object.side_effect = ApiException(status=status, reason="Forbidden")
+        inf = ResourceInformer(custom_api, "g", "v1", "managedclusters", retry_interval=30)
+
+        start = time.monotonic()
+        assert inf.start(sync_timeout=10) is False
+        assert time.monotonic() - start < 5
+
+        assert inf.disabled is True
+        assert inf.has_synced() is False
+        assert inf.is_running() is False
+        custom_api.list_cluster_custom_object.assert_called_once()
+        assert inf.start(sync_timeout=10) is False
+
+    def test_forbidden_watch_after_sync_disables_cache(self, informer):
+        """A watch denied after a successful list stops serving the (never updated) snapshot."""
+        with patch("lib.informer.watch.Watch") as mock_watch_cls:
+            mock_watch_cls.return_value.stream.side_effect = ApiException(status=403, reason="Forbidden")
+            informer._run()
+
+        assert informer.disabled is True
+        assert informer.has_synced() is False
@@ -5,12 +5,21 @@
 """
 
 import errno
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from kubernetes import client
 from kubernetes.client.rest import ApiException
 
-from lib.kube_client import KubeClient, api_call, is_retryable_error
+from lib.kube_client import (
+    PARTIAL_OBJECT_METADATA_ACCEPT,
+    PARTIAL_OBJECT_METADATA_LIST_ACCEPT,
+    KubeClient,
+    api_call,
+    is_retryable_error,
+)
+from lib.kubeconfig_store import KubeconfigIndex
+from lib.rate_limiter import TokenBucket
 
 
 @pytest.fixture
@@ -210,6 +219,138 @@ def test_list_custom_resources_pagination(self, kube_client, mock_k8s_apis):
         assert [item["metadata"]["name"] for item in results] == ["item1", "item2"]
         assert mock_k8s_apis["custom_api"].list_cluster_custom_object.call_count == 2
 
+    def test_iter_custom_resources_yields_page_by_page(self, kube_client, mock_k8s_apis):
+        """iter_custom_resources streams pages lazily using the configured page size."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = [
+            {"items": [{"metadata": {"name": "b1"}}, {"metadata": {"name": "b2"}}], "metadata": {"continue": "t"}},
+            {"items": [{"metadata": {"name": "b3"}}], "metadata": {}},
+        ]
+
+        stream = kube_client.iter_custom_resources("velero.io", "v1", "backups", namespace="test-ns", page_size=2)
+        first = next(stream)
+
+        assert first["metadata"]["name"] == "b1"
+        assert mock_k8s_apis["custom_api"].list_namespaced_custom_object.call_count == 1
+        assert [item["metadata"]["name"] for item in stream] == ["b2", "b3"]
+        calls = mock_k8s_apis["custom_api"].list_namespaced_custom_object.call_args_list
+        assert [c.kwargs["limit"] for c in calls] == [2, 2]
+        assert calls[1].kwargs["_continue"] == "t"
+
+    def test_iter_custom_resources_not_found_yields_nothing(self, kube_client, mock_k8s_apis):
+        """A 404 (CRD not installed) ends the stream without error."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = ApiException(status=404)
+
+        assert list(kube_client.iter_custom_resources("velero.io", "v1", "backups", namespace="test-ns")) == []
+
+    def test_list_custom_resources_metadata_only_sets_accept_header(self, kube_client, mock_k8s_apis):
+        """metadata_only requests a PartialObjectMetadataList from the API server."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.return_value = {
+            "kind": "PartialObjectMetadataList",
+            "items": [{"kind": "PartialObjectMetadata", "metadata": {"name": "b1"}}],
+        }
+
+        result = kube_client.list_custom_resources(
+            "velero.io", "v1", "backups", namespace="test-ns", metadata_only=True
+        )
+
+        assert [item["metadata"]["name"] for item in result] == ["b1"]
+        kwargs = mock_k8s_apis["custom_api"].list_namespaced_custom_object.call_args.kwargs
+        assert kwargs["_headers"] == {"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT}
+
+    def test_iter_custom_resources_metadata_only_sets_accept_header(self, kube_client, mock_k8s_apis):
+        """Every page of a metadata-only stream carries the PartialObjectMetadataList Accept header."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = [
+            {"items": [{"metadata": {"name": "b1"}}], "metadata": {"continue": "t"}},
+            {"items": [{"metadata": {"name": "b2"}}], "metadata": {}},
+        ]
+
+        stream = kube_client.iter_custom_resources(
+            "velero.io", "v1", "backups", namespace="test-ns", metadata_only=True
+        )
+
+        assert [item["metadata"]["name"] for item in stream] == ["b1", "b2"]
+        for c in mock_k8s_apis["custom_api"].list_namespaced_custom_object.call_args_list:
+            assert c.kwargs["_headers"] == {"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT}
+
+    def test_get_latest_velero_backups_fetches_only_newest(self, kube_client, mock_k8s_apis):
+        """Backups are selected server-side by schedule type, listed metadata-only, and only the newest fetched."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_namespaced_custom_object.return_value = {
+            "items": [
+                {"metadata": {"name": "mc-1", "creationTimestamp": "2025-12-01T10:00:00Z"}},
+                {"metadata": {"name": "mc-3", "creationTimestamp": "2025-12-03T10:00:00Z"}},
+                {"metadata": {"name": "mc-2", "creationTimestamp": "2025-12-02T10:00:00Z"}},
+            ],
+            "metadata": {},
+        }
+        custom_api.get_namespaced_custom_object.side_effect = lambda **kwargs: {
+            "metadata": {"name": kwargs["name"]},
+            "status": {"phase": "Completed"},
+        }
+
+        backups = kube_client.get_latest_velero_backups(namespace="test-ns", schedule_type="managedClusters", count=2)
+
+        assert [b["metadata"]["name"] for b in backups] == ["mc-3", "mc-2"]
+        list_kwargs = custom_api.list_namespaced_custom_object.call_args.kwargs
+        assert (
+            list_kwargs["label_selector"] == "cluster.open-cluster-management.io/backup-schedule-type=managedClusters"
+        )
+        assert list_kwargs["_headers"] == {"Accept": PARTIAL_OBJECT_METADATA_LIST_ACCEPT}
+        assert [c.kwargs["name"] for c in custom_api.get_namespaced_custom_object.call_args_list] == ["mc-3", "mc-2"]
+
+    def test_get_latest_velero_backups_skips_deleted_and_any_type(self, kube_client, mock_k8s_apis):
+        """Without a schedule type no selector is sent; Backups deleted after listing are skipped."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_namespaced_custom_object.return_value = {
+            "items": [{"metadata": {"name": "gone", "creationTimestamp": "2025-12-01T10:00:00Z"}}],
+            "metadata": {},
+        }
+        custom_api.get_namespaced_custom_object.side_effect = ApiException(status=404)
+
+        assert kube_client.get_latest_velero_backups(namespace="test-ns") == []
+        assert custom_api.list_namespaced_custom_object.call_args.kwargs["label_selector"] is None
+
+    def test_get_deployment_not_found_returns_none(self, kube_client, mock_k8s_apis):
+        """A missing Deployment returns None instead of raising."""
+        mock_k8s_apis["apps_api"].read_namespaced_deployment.side_effect = ApiException(status=404)
+
+        assert kube_client.get_deployment("velero", "test-ns") is None
+
+    def test_get_latest_velero_backups_propagates_errors(self, kube_client, mock_k8s_apis):
+        """List errors are not reported as a missing resource."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = ApiException(status=403)
+
+        with pytest.raises(ApiException):
+            kube_client.get_latest_velero_backups(namespace="test-ns")
+
+    def test_get_custom_resource_metadata_only_sets_accept_header(self, kube_client, mock_k8s_apis):
+        """metadata_only GETs request a PartialObjectMetadata response."""
+        mock_k8s_apis["custom_api"].get_cluster_custom_object.return_value = {"metadata": {"name": "cluster1"}}
+
+        result = kube_client.get_custom_resource(
+            "cluster.open-cluster-management.io", "v1", "managedclusters", "cluster1", metadata_only=True
+        )
+
+        assert result == {"metadata": {"name": "cluster1"}}
+        kwargs = mock_k8s_apis["custom_api"].get_cluster_custom_object.call_args.kwargs
+        assert kwargs["_headers"] == {"Accept": PARTIAL_OBJECT_METADATA_ACCEPT}
+
+    def test_metadata_only_falls_back_when_not_acceptable(self, kube_client, mock_k8s_apis):
+        """A 406 from servers without PartialObjectMetadata support retries for full objects."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = [
+            ApiException(status=406),
+            {"items": [{"metadata": {"name": "b1"}, "status": {"phase": "Completed"}}]},
+        ]
+
+        result = kube_client.list_custom_resources(
+            "velero.io", "v1", "backups", namespace="test-ns", metadata_only=True
+        )
+
+        assert [item["metadata"]["name"] for item in result] == ["b1"]
+        calls = mock_k8s_apis["custom_api"].list_namespaced_custom_object.call_args_list
+        assert "_headers" in calls[0].kwargs
+        assert "_headers" not in calls[1].kwargs
+
     def test_scale_statefulset(self, kube_client, mock_k8s_apis):
         """Test scaling statefulset."""
         response = MagicMock()
@@ -347,6 +488,49 @@ def test_get_pods_with_empty_label_selector_raises(self, kube_client, mock_k8s_a
         with pytest.raises(ValidationError):
             kube_client.get_pods("test-ns", label_selector="   ")
 
+    def test_iter_pod_log_lines_splits_streamed_chunks(self, kube_client, mock_k8s_apis):
+        """Lines and multi-byte characters split across chunks are reassembled."""
+        response = MagicMock()
+        response.stream.return_value = iter([b"first li", b"ne\r\nsec", "ond \u00e9".encode()[:-1], b"\xa9\nlast"])
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.return_value = response
+
+        lines = list(kube_client.iter_pod_log_lines("velero-1", "test-ns", container="velero", since_seconds=90))
+
+        assert lines == ["first line", "second \u00e9", "last"]
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.assert_called_once_with(
+            name="velero-1", namespace="test-ns", _preload_content=False, container="velero", since_seconds=90
+        )
+        response.release_conn.assert_called_once()
+
+    def test_iter_pod_log_lines_closes_response_on_early_stop(self, kube_client, mock_k8s_apis):
+        """Stopping iteration closes the stream without reading the remaining chunks."""
+        chunks = iter([b"a\nb\n", b"c\n"])
+        response = MagicMock()
+        response.stream.return_value = chunks
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.return_value = response
+
+        lines = kube_client.iter_pod_log_lines("velero-1", "test-ns", timestamps=True)
+        assert next(lines) == "a"
+        lines.close()
+
+        response.close.assert_called_once()
+        assert next(chunks) == b"c\n"
+        assert mock_k8s_apis["core_api"].read_namespaced_pod_log.call_args.kwargs["timestamps"] is True
+
+    def test_iter_pod_log_lines_pod_not_found(self, kube_client, mock_k8s_apis):
+        """A missing pod yields no lines."""
+        mock_k8s_apis["core_api"].read_namespaced_pod_log.side_effect = ApiException(status=404)
+
+        assert list(kube_client.iter_pod_log_lines("gone", "test-ns")) == []
+
+    @pytest.mark.parametrize("kwargs", [{"since_seconds": 0}, {"tail_lines": -1}, {"since_seconds": "soon"}])
+    def test_iter_pod_log_lines_rejects_invalid_window(self, kube_client, kwargs):
+        """Invalid log window bounds fail fast."""
+        from lib.validation import ValidationError
+
+        with pytest.raises(ValidationError):
+            list(kube_client.iter_pod_log_lines("velero-1", "test-ns", **kwargs))
+
     @patch("lib.kube_client.time.sleep")
     def test_wait_for_pods_ready(self, mock_sleep, kube_client, mock_k8s_apis):
         """Test waiting for pods to become ready."""
@@ -417,21 +601,292 @@ def test_rollout_restart_deployment_normal(self, kube_client, mock_k8s_apis):
         mock_k8s_apis["apps_api"].patch_namespaced_deployment.assert_called_once()
 
 
+@pytest.mark.unit
+class TestManagedClusterCache:
+    """Test cases for the opt-in ManagedCluster informer cache."""
+
+    @pytest.fixture
+    def synced_client(self, kube_client):
+        informer = MagicMock()
+        informer.has_synced.return_value = True
+        informer.list.return_value = [{"metadata": {"name": "cached"}}]
+        informer.get.return_value = {"metadata": {"name": "cached"}}
+        kube_client._managed_cluster_informer = informer
+        return kube_client
+
+    def test_list_managed_clusters_served_from_cache(self, synced_client, mock_k8s_apis):
+        result = synced_client.list_managed_clusters(label_selector="env=prod")
+
+        assert result == [{"metadata": {"name": "cached"}}]
+        synced_client._managed_cluster_informer.list.assert_called_once_with("env=prod")
+        mock_k8s_apis["custom_api"].list_cluster_custom_object.assert_not_called()
+
+    def test_unsupported_selector_falls_back_to_api(self, synced_client, mock_k8s_apis):
+        synced_client._managed_cluster_informer.list.return_value = None
+        mock_k8s_apis["custom_api"].list_cluster_custom_object.return_value = {"items": [{"metadata": {"name": "api"}}]}
+
+        result = synced_client.list_managed_clusters(label_selector="env in (prod)")
+
+        assert result == [{"metadata": {"name": "api"}}]
+
+    def test_max_items_bypasses_cache(self, synced_client, mock_k8s_apis):
+        mock_k8s_apis["custom_api"].list_cluster_custom_object.return_value = {"items": []}
+
+        synced_client.list_custom_resources("cluster.open-cluster-management.io", "v1", "managedclusters", max_items=1)
+
+        synced_client._managed_cluster_informer.list.assert_not_called()
+
+    def test_unsynced_cache_reads_from_api(self, kube_client, mock_k8s_apis):
+        informer = MagicMock()
+        informer.has_synced.return_value = False
+        kube_client._managed_cluster_informer = informer
+        mock_k8s_apis["custom_api"].get_cluster_custom_object.return_value = {"metadata": {"name": "api"}}
+
+        assert kube_client.get_managed_cluster("api") == {"metadata": {"name": "api"}}
+        informer.get.assert_not_called()
+
+    def test_patch_writes_through_to_cache(self, synced_client, mock_k8s_apis):
+        patched = {"metadata": {"name": "cached", "annotations": {"a": "b"}}}
+        mock_k8s_apis["custom_api"].patch_cluster_custom_object.return_value = patched
+
+        synced_client.patch_managed_cluster("cached", {"metadata": {"annotations": {"a": "b"}}})
+
+        synced_client._managed_cluster_informer.upsert.assert_called_once_with(patched)
+
+
+@pytest.mark.unit
+class TestBulkPatchManagedClusters:
+    """Test cases for the concurrent, rate-limited ManagedCluster patcher."""
+
+    def test_applies_patches_in_order_per_cluster(self, kube_client, mock_k8s_apis):
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.patch_cluster_custom_object.return_value = {"metadata": {}}
+        remove = {"metadata": {"annotations": {"a": None}}}
+        add = {"metadata": {"annotations": {"a": ""}}}
+
+        result = kube_client.bulk_patch_managed_clusters({"c1": [remove, add], "c2": [add]})
+
+        assert result.succeeded == ["c1", "c2"]
+        assert result.failed == {}
+        assert result.patch_count == 3
+        c1_bodies = [
+            c.kwargs["body"] for c in custom_api.patch_cluster_custom_object.call_args_list if c.kwargs["name"] == "c1"
+        ]
+        assert c1_bodies == [remove, add]
+
+    def test_aggregates_per_cluster_failures(self, kube_client, mock_k8s_apis):
+        def patch_side_effect(**kwargs):
+            if kwargs["name"] == "bad":
+                raise ApiException(status=403, reason="Forbidden")
+            return {"metadata": {"name": kwargs["name"]}}
+
+        mock_k8s_apis["custom_api"].patch_cluster_custom_object.side_effect = patch_side_effect
+        patches = {name: [{"metadata": {"labels": {"x": "y"}}}] for name in ("a", "bad", "c")}
+
+        result = kube_client.bulk_patch_managed_clusters(patches)
+
+        assert result.succeeded == ["a", "c"]
+        assert list(result.failed) == ["bad"]
+        assert "Forbidden" in result.failed["bad"]
+        assert result.total == 3
+
+    def test_every_patch_takes_a_rate_limit_token(self, kube_client, mock_k8s_apis):
+        mock_k8s_apis["custom_api"].patch_cluster_custom_object.return_value = {"metadata": {}}
+        patches = {f"c{i}": [{}, {}] for i in range(4)}
+
+        with patch.object(TokenBucket, "acquire", autospec=True, return_value=True) as mock_acquire:
+            result = kube_client.bulk_patch_managed_clusters(patches, max_workers=2)
+
+        # One token per PATCH, all from the shared context limiter (no second bulk bucket)
+        assert [c.args[0] for c in mock_acquire.call_args_list] == [kube_client._rate_limiter] * 8
+        assert result.patch_count == 8
+        assert result.throughput > 0
+
+    def test_on_success_called_for_each_patched_cluster(self, kube_client, mock_k8s_apis):
+        def patch_side_effect(**kwargs):
+            if kwargs["name"] == "bad":
+                raise ApiException(status=500)
+            return {"metadata": {}}
+
+        mock_k8s_apis["custom_api"].patch_cluster_custom_object.side_effect = patch_side_effect
+        done = []
+
+        kube_client.bulk_patch_managed_clusters({"a": [{}], "bad": [{}], "c": [{}]}, on_success=done.append)
+
+        assert sorted(done) == ["a", "c"]
+
+    def test_empty_patch_set_is_a_no_op(self, kube_client, mock_k8s_apis):
+        result = kube_client.bulk_patch_managed_clusters({})
+
+        assert result.total == 0
+        mock_k8s_apis["custom_api"].patch_cluster_custom_object.assert_not_called()
+
+
+@pytest.mark.unit
+class TestListCache:
+    """Test cases for lists served through the on-disk list cache."""
+
+    BACKUPS = [
+        {"metadata": {"name": "b1", "uid": "u1", "resourceVersion": "10"}, "status": {"phase": "Completed"}},
+        {"metadata": {"name": "b2", "uid": "u2", "resourceVersion": "11"}, "status": {"phase": "Completed"}},
+    ]
+
+    @pytest.fixture
+    def server(self, mock_k8s_apis):
+        """Fake namespaced list endpoint recording probe/metadata/full requests."""
+        state = {"rv": "100", "items": [dict(b) for b in self.BACKUPS], "calls": []}
+
+        def list_objects(**kwargs):
+            if kwargs.get("limit") == 1:
+                state["calls"].append("probe")
+                return {"metadata": {"resourceVersion": state["rv"]}, "items": state["items"][:1]}
+            kind = "metadata" if "_headers" in kwargs else "full"
+            state["calls"].append(kind)
+            items = [{"metadata": i["metadata"]} for i in state["items"]] if kind == "metadata" else state["items"]
+            return {"metadata": {"resourceVersion": state["rv"]}, "items": items}
+
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = list_objects
+        return state
+
+    def _list(self, client):
+        return client.list_custom_resources("velero.io", "v1", "backups", namespace="open-cluster-management-backup")
+
+    def test_unchanged_collection_served_after_limit_1_probe(self, kube_client, server, tmp_path):
+        cache = kube_client.enable_list_cache(str(tmp_path))
+        assert self._list(kube_client) == self.BACKUPS
+
+        server["calls"].clear()
+        assert self._list(kube_client) == self.BACKUPS
+
+        assert server["calls"] == ["probe"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_unrelated_writes_validated_by_metadata_fingerprint(self, kube_client, server, tmp_path):
+        kube_client.enable_list_cache(str(tmp_path))
+        self._list(kube_client)
+
+        server["rv"] = "250"  # cluster-wide revision moved, items did not
+        server["calls"].clear()
+
+        assert self._list(kube_client) == self.BACKUPS
+        assert server["calls"] == ["probe", "metadata"]
+
+        # The newer resourceVersion is recorded, so the next read needs only the probe
+        server["calls"].clear()
+        self._list(kube_client)
+        assert server["calls"] == ["probe"]
+
+    def test_changed_item_triggers_full_list(self, kube_client, server, tmp_path):
+        kube_client.enable_list_cache(str(tmp_path))
+        self._list(kube_client)
+
+        updated = {"metadata": {"name": "b2", "uid": "u2", "resourceVersion": "12"}, "status": {"phase": "Failed"}}
+        server["items"][1] = updated
+        server["rv"] = "300"
+        server["calls"].clear()
+
+        assert self._list(kube_client)[1] == updated
+        assert server["calls"] == ["probe", "metadata", "full"]
+
+    def test_cache_persists_across_clients(self, mock_k8s_apis, server, tmp_path):
+        self._list(_enable(KubeClient(context="test-context"), tmp_path))
+        server["calls"].clear()
+
+        second = _enable(KubeClient(context="test-context"), tmp_path)
+
+        assert self._list(second) == self.BACKUPS
+        assert server["calls"] == ["probe"]
+
+    def test_limited_lists_bypass_cache(self, kube_client, server, tmp_path):
+        cache = kube_client.enable_list_cache(str(tmp_path))
+
+        kube_client.list_custom_resources("velero.io", "v1", "backups", namespace="ns", max_items=5)
+
+        assert (cache.hits, cache.misses) == (0, 0)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_iter_custom_resources_uses_cache(self, kube_client, server, tmp_path):
+        kube_client.enable_list_cache(str(tmp_path))
+        self._list(kube_client)
+        server["calls"].clear()
+
+        items = list(
+            kube_client.iter_custom_resources("velero.io", "v1", "backups", namespace="open-cluster-management-backup")
+        )
+
+        assert items == self.BACKUPS
+        assert server["calls"] == ["probe"]
+
+    def test_cached_path_retries_each_page_once(self, kube_client, mock_k8s_apis, tmp_path):
+        """A persistent 503 is retried by the page request only, not again around the whole list."""
+        kube_client.enable_list_cache(str(tmp_path))
+        list_objects = mock_k8s_apis["custom_api"].list_namespaced_custom_object
+        list_objects.side_effect = ApiException(status=503)
+
+        with patch("time.sleep"), pytest.raises(ApiException):
+            self._list(kube_client)
+
+        assert list_objects.call_count == 5
+
+
+def _enable(client, directory):
+    client.enable_list_cache(str(directory))
+    return client
+
+
 @pytest.mark.unit
 class TestKubeClientInitialization:
     """Test cases for KubeClient initialization."""
 
+    @pytest.fixture(autouse=True)
+    def empty_kubeconfig_store(self):
+        """Keep the parsed kubeconfig store empty so the file loader is used."""
+        with patch("lib.kube_client.get_kubeconfig_store") as mock_store:
+            mock_store.return_value.load.return_value = KubeconfigIndex({})
+            yield mock_store
+
     @patch("lib.kube_client.config.load_kube_config")
     def test_init_with_context(self, mock_load_config):
         """Test initializing with a specific context."""
         KubeClient(context="test-context")
-        mock_load_config.assert_called_once_with(context="test-context")
+        mock_load_config.assert_called_once_with(context="test-context", client_configuration=ANY, persist_config=False)
 
     @patch("lib.kube_client.config.load_kube_config")
     def test_init_without_context(self, mock_load_config):
         """Test initializing without a context."""
         KubeClient()
-        mock_load_config.assert_called_once_with(context=None)
+        mock_load_config.assert_called_once_with(context=None, client_configuration=ANY, persist_config=False)
+
+    def test_file_fallback_leaves_default_configuration_alone(self):
+        """Concurrent fleet checks must not copy another thread's cluster from the global default."""
+
+        def load_kube_config(context, client_configuration, persist_config):
+            client_configuration.host = f"https://api.{context}.example.com:6443"
+
+        default_host = client.Configuration.get_default_copy().host
+        with patch("lib.kube_client.config.load_kube_config", side_effect=load_kube_config):
+            spoke1 = KubeClient(context="spoke1")
+            spoke2 = KubeClient(context="spoke2")
+
+        assert spoke1.custom_api.api_client.configuration.host == "https://api.spoke1.example.com:6443"
+        assert spoke2.custom_api.api_client.configuration.host == "https://api.spoke2.example.com:6443"
+        assert client.Configuration.get_default_copy().host == default_host
+
+    @patch("lib.kube_client.config.load_kube_config")
+    def test_init_uses_parsed_kubeconfig(self, mock_load_config, empty_kubeconfig_store):
+        """A context found in the shared kubeconfig store is loaded without re-reading files."""
+        empty_kubeconfig_store.return_value.load.return_value = KubeconfigIndex(
+            {
+                "clusters": [{"name": "c", "cluster": {"server": "https://api.hub.example.com:6443"}}],
+                "users": [{"name": "u", "user": {"token": "hub-token"}}],
+                "contexts": [{"name": "hub", "context": {"cluster": "c", "user": "u"}}],
+            }
+        )
+
+        kube_client = KubeClient(context="hub")
+
+        mock_load_config.assert_not_called()
+        assert kube_client.custom_api.api_client.configuration.host == "https://api.hub.example.com:6443"
 
     @patch("lib.kube_client.config.load_kube_config")
     def test_init_dry_run_flag(self, mock_load_config):
@@ -622,3 +1077,81 @@ def test_file_oserror_is_not_retryable(self):
         assert is_retryable_error(OSError(errno.ENOENT, "No such file")) is False
         assert is_retryable_error(OSError(errno.EACCES, "Permission denied")) is False
         assert is_retryable_error(OSError(errno.EEXIST, "File exists")) is False
+
+
+@pytest.mark.unit
+class TestWatchHelpers:
+    """Test cases for watch stream helpers."""
+
+    def test_watch_custom_resources_starts_from_list_resource_version(self, kube_client, mock_k8s_apis):
+        """Watch resumes from the collection resourceVersion and skips bookmarks."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.return_value = {
+            "metadata": {"resourceVersion": "42"},
+            "items": [],
+        }
+        events = [{"type": "BOOKMARK", "object": {}}, {"type": "MODIFIED", "object": {"metadata": {"name": "r"}}}]
+
+        with patch("lib.kube_client.watch.Watch") as mock_watch_cls:
+            mock_watch_cls.return_value.stream.return_value = iter(events)
+            result = list(
+                kube_client.watch_custom_resources(
+                    "cluster.open-cluster-management.io",
+                    "v1beta1",
+                    "restores",
+                    namespace="test-ns",
+                    name="restore-acm",
+                    timeout_seconds=10,
+                )
+            )
+
+        assert [e["type"] for e in result] == ["MODIFIED"]
+        kwargs = mock_watch_cls.return_value.stream.call_args.kwargs
+        assert kwargs["resource_version"] == "42"
+        assert kwargs["field_selector"] == "metadata.name=restore-acm"
+        assert kwargs["timeout_seconds"] == 10
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.assert_called_once()
+        assert mock_k8s_apis["custom_api"].list_namespaced_custom_object.call_args.kwargs["limit"] == 1
+
+    def test_watch_custom_resources_resumes_from_given_resource_version(self, kube_client, mock_k8s_apis):
+        """A watch started from a previous list's resourceVersion does not re-read the current one."""
+        custom_api = mock_k8s_apis["custom_api"]
+        custom_api.list_namespaced_custom_object.side_effect = [
+            {"metadata": {"resourceVersion": "9", "continue": "t"}, "items": [{"metadata": {"name": "b1"}}]},
+            {"metadata": {"resourceVersion": "12"}, "items": [{"metadata": {"name": "b2"}}]},
+        ]
+
+        items, resource_version = kube_client.list_custom_resources_with_version(
+            "velero.io", "v1", "backups", namespace="test-ns", metadata_only=True
+        )
+        with patch("lib.kube_client.watch.Watch") as mock_watch_cls:
+            mock_watch_cls.return_value.stream.return_value = iter([])
+            list(
+                kube_client.watch_custom_resources(
+                    "velero.io", "v1", "backups", namespace="test-ns", resource_version=resource_version
+                )
+            )
+
+        # Continued pages are served from the first page's snapshot
+        assert [i["metadata"]["name"] for i in items] == ["b1", "b2"]
+        assert resource_version == "9"
+        assert mock_watch_cls.return_value.stream.call_args.kwargs["resource_version"] == "9"
+        assert custom_api.list_namespaced_custom_object.call_count == 2
+
+    def test_list_custom_resources_with_version_not_found(self, kube_client, mock_k8s_apis):
+        """A missing CRD lists as empty with no resourceVersion."""
+        mock_k8s_apis["custom_api"].list_namespaced_custom_object.side_effect = ApiException(status=404)
+
+        assert kube_client.list_custom_resources_with_version("velero.io", "v1", "backups", namespace="ns") == ([], "")
+
+    def test_watch_pods_reads_typed_resource_version(self, kube_client, mock_k8s_apis):
+        """Pod watch reads resourceVersion from the typed list response."""
+        pod_list = MagicMock()
+        pod_list.metadata.resource_version = "7"
+        mock_k8s_apis["core_api"].list_namespaced_pod.return_value = pod_list
+
+        with patch("lib.kube_client.watch.Watch") as mock_watch_cls:
+            mock_watch_cls.return_value.stream.return_value = iter([{"type": "DELETED", "object": MagicMock()}])
+            result = list(kube_client.watch_pods("test-ns", timeout_seconds=5))
+
+        assert len(result) == 1
+        assert mock_watch_cls.return_value.stream.call_args.kwargs["resource_version"] == "7"
@@ -0,0 +1,243 @@
+"""Unit tests for lib/kubeconfig_store.py.
+
+Tests cover merging KUBECONFIG files, the name and API server host indexes,
+mtime/size invalidation, size limits, relative path resolution, and the
+on-disk context index.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from lib.kubeconfig_store import KubeconfigIndex, KubeconfigStore, default_index_path, normalize_server_host
+
+HUB = """
+current-context: hub
+clusters:
+- name: hub
+  cluster:
+    server: https://api.hub.example.com:6443
+    certificate-authority: certs/ca.crt
+contexts:
+- name: hub
+  context: {cluster: hub, user: hub-admin}
+users:
+- name: hub-admin
+  user: {token: hub-token, client-key: /abs/key.pem}
+"""
+
+SPOKES = """
+current-context: spoke1
+clusters:
+- name: hub
+  cluster: {server: https://shadowed.example.com}
+- name: spoke1
+  cluster: {server: "https://API.Spoke1.example.com:6443"}
+contexts:
+- name: admin@spoke1
+  context: {cluster: spoke1, user: admin}
+- name: spoke1-alt
+  context: {cluster: spoke1, user: admin}
+users:
+- name: admin
+  user: {token: spoke-token}
+"""
+
+
+@pytest.fixture
+def kubeconfigs(tmp_path):
+    hub = tmp_path / "hub.yaml"
+    hub.write_text(HUB)
+    spokes = tmp_path / "spokes.yaml"
+    spokes.write_text(SPOKES)
+    env = {"KUBECONFIG": f"{hub}:{spokes}", "ACM_KUBECONFIG_INDEX": str(tmp_path / "cache" / "index.json")}
+    with patch.dict(os.environ, env):
+        yield hub, spokes
+
+
+@pytest.fixture
+def index_path(kubeconfigs):
+    return os.environ["ACM_KUBECONFIG_INDEX"]
+
+
+@pytest.mark.unit
+class TestNormalizeServerHost:
+    """Tests for normalize_server_host."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://API.Example.com:6443/path", "api.example.com"),
+            ("api.example.com:6443", "api.example.com"),
+            ("https://10.0.0.1", "10.0.0.1"),
+            ("", ""),
+        ],
+    )
+    def test_normalize(self, url, expected):
+        assert normalize_server_host(url) == expected
+
+
+@pytest.mark.unit
+class TestKubeconfigStore:
+    """Tests for KubeconfigStore and KubeconfigIndex."""
+
+    def test_merges_files_first_wins(self, kubeconfigs):
+        index = KubeconfigStore().load()
+
+        assert index.current_context == "hub"
+        assert set(index.contexts) == {"hub", "admin@spoke1", "spoke1-alt"}
+        # Duplicate cluster name: first file wins
+        assert index.server_for_context("hub") == "https://api.hub.example.com:6443"
+        assert index.user_for_context("admin@spoke1") == {"token": "spoke-token"}
+
+    def test_find_context_by_server_uses_host_index(self, kubeconfigs):
+        index = KubeconfigStore().load()
+
+        assert index.find_context_by_server("https://api.spoke1.example.com") == "admin@spoke1"
+        assert index.find_context_by_server("https://unknown.example.com") == ""
+
+    def test_none_context_resolves_to_current(self, kubeconfigs):
+        index = KubeconfigStore().load()
+
+        assert index.has_context(None)
+        assert index.server_for_context(None) == "https://api.hub.example.com:6443"
+
+    def test_relative_paths_resolved_against_declaring_file(self, kubeconfigs):
+        hub, _ = kubeconfigs
+        index = KubeconfigStore().load()
+
+        assert index.cluster_for_context("hub")["certificate-authority"] == str(hub.parent / "certs" / "ca.crt")
+        assert index.user_for_context("hub")["client-key"] == "/abs/key.pem"
+
+    def test_parsed_once_until_file_changes(self, kubeconfigs):
+        hub, _ = kubeconfigs
+        store = KubeconfigStore()
+
+        with patch("lib.kubeconfig_store.yaml.load", wraps=yaml.load) as mock_load:
+            first = store.load()
+            assert store.load() is first
+            assert mock_load.call_count == 2
+
+            hub.write_text(HUB.replace("hub-token", "rotated-token-with-new-size"))
+            os.utime(hub, (1, 1))
+            second = store.load()
+
+        assert second is not first
+        assert second.user_for_context("hub")["token"] == "rotated-token-with-new-size"
+
+    def test_kubeconfig_env_change_reloads(self, kubeconfigs, tmp_path):
+        store = KubeconfigStore()
+        store.load()
+
+        with patch.dict(os.environ, {"KUBECONFIG": str(tmp_path / "missing")}):
+            assert len(store.load()) == 0
+
+    def test_size_limit_skips_large_files(self, kubeconfigs):
+        store = KubeconfigStore()
+
+        limited = store.load(max_size=10)
+        unlimited = store.load(max_size=0)
+
+        assert len(limited) == 0
+        assert len(unlimited) == 3
+
+    def test_invalid_yaml_is_skipped(self, tmp_path):
+        broken = tmp_path / "broken.yaml"
+        broken.write_text("contexts: [unclosed\n")
+        good = tmp_path / "good.yaml"
+        good.write_text(HUB)
+
+        with patch.dict(os.environ, {"KUBECONFIG": f"{broken}:{good}", "ACM_KUBECONFIG_INDEX": ""}):
+            index = KubeconfigStore().load()
+
+        assert set(index.contexts) == {"hub"}
+
+    def test_contexts_for_user(self, kubeconfigs):
+        index = KubeconfigStore().load()
+
+        assert index.contexts_for_user("admin") == ["admin@spoke1", "spoke1-alt"]
+
+    def test_empty_index(self):
+        index = KubeconfigIndex({})
+
+        assert len(index) == 0
+        assert not index.has_context(None)
+        assert index.server_for_context("x") == ""
+
+
+@pytest.mark.unit
+class TestKubeconfigLookupIndex:
+    """Tests for KubeconfigStore.lookup and the on-disk index."""
+
+    def test_cold_lookup_writes_index_without_credentials(self, kubeconfigs, index_path):
+        index = KubeconfigStore().lookup()
+
+        assert index.credentials is False
+        assert index.server_for_context("admin@spoke1") == "https://API.Spoke1.example.com:6443"
+        assert index.user_for_context("hub") == {}
+        with open(index_path) as f:
+            on_disk = f.read()
+        assert "hub-token" not in on_disk and "key.pem" not in on_disk
+        assert json.loads(on_disk)["format"] == 1
+
+    def test_warm_lookup_parses_no_yaml(self, kubeconfigs, index_path):
+        KubeconfigStore().lookup()
+
+        with patch("lib.kubeconfig_store.yaml.load") as mock_load:
+            index = KubeconfigStore().lookup()
+
+        mock_load.assert_not_called()
+        assert index.current_context == "hub"
+        assert index.find_context_by_server("https://api.spoke1.example.com") == "admin@spoke1"
+        assert index.contexts["admin@spoke1"] == {"cluster": "spoke1", "user": "admin"}
+
+    def test_only_changed_file_is_reparsed(self, kubeconfigs, index_path):
+        hub, spokes = kubeconfigs
+        KubeconfigStore().lookup()
+        spokes.write_text(SPOKES.replace("spoke1-alt", "spoke1-renamed"))
+
+        with patch("lib.kubeconfig_store.yaml.load", wraps=yaml.load) as mock_load:
+            index = KubeconfigStore().lookup()
+
+        assert mock_load.call_count == 1
+        assert "spoke1-renamed" in index.contexts
+
+    def test_full_load_also_refreshes_index(self, kubeconfigs, index_path):
+        store = KubeconfigStore()
+        full = store.load()
+
+        assert store.lookup() is full
+        with patch("lib.kubeconfig_store.yaml.load") as mock_load:
+            KubeconfigStore().lookup()
+        mock_load.assert_not_called()
+
+    def test_lookup_respects_size_limit(self, kubeconfigs):
+        assert len(KubeconfigStore().lookup(max_size=10)) == 0
+
+    def test_unreadable_index_is_rebuilt(self, kubeconfigs, index_path):
+        os.makedirs(os.path.dirname(index_path))
+        with open(index_path, "w") as f:
+            f.write("{not json")
+
+        index = KubeconfigStore().lookup()
+
+        assert len(index) == 3
+        with open(index_path) as f:
+            assert json.load(f)["format"] == 1
+
+    def test_index_can_be_disabled(self, kubeconfigs, tmp_path):
+        with patch.dict(os.environ, {"ACM_KUBECONFIG_INDEX": ""}):
+            assert default_index_path() is None
+            index = KubeconfigStore().lookup()
+
+        assert len(index) == 3
+        assert not (tmp_path / "cache").exists()
+
+    def test_default_path_under_xdg_cache(self, tmp_path):
+        env = {"XDG_CACHE_HOME": str(tmp_path)}
+        with patch.dict(os.environ, env):
+            os.environ.pop("ACM_KUBECONFIG_INDEX", None)
+            assert default_index_path() == str(tmp_path / "acm-switchover" / "kubeconfig-index.json")
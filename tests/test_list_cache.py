@@ -0,0 +1,93 @@
+"""Unit tests for lib/list_cache.py.
+
+Tests cover storing and loading list entries, key isolation, tolerance of
+corrupt or unwritable cache files, and item fingerprints.
+"""
+
+import os
+import stat
+
+import pytest
+
+from lib.list_cache import ListCache, fingerprint
+
+ITEMS = [
+    {"metadata": {"name": "a", "uid": "ua", "resourceVersion": "1"}, "spec": {"x": 1}},
+    {"metadata": {"name": "b", "namespace": "ns", "resourceVersion": "2"}},
+]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ListCache(str(tmp_path / "preflight-cache"))
+
+
+def _key(**overrides):
+    params = {"context": "hub", "group": "velero.io", "version": "v1", "plural": "backups", "namespace": "ns"}
+    params.update(overrides)
+    return ListCache.make_key(**params)
+
+
+@pytest.mark.unit
+class TestListCache:
+    """Tests for ListCache."""
+
+    def test_store_and_load_round_trip(self, cache):
+        cache.store(_key(), "42", ITEMS)
+
+        entry = cache.load(_key())
+
+        assert entry["resource_version"] == "42"
+        assert entry["items"] == ITEMS
+        assert entry["fingerprint"] == fingerprint(ITEMS)
+
+    def test_missing_entry(self, cache):
+        assert cache.load(_key()) is None
+
+    def test_keys_are_isolated(self, cache):
+        cache.store(_key(), "1", ITEMS)
+
+        assert cache.load(_key(context="other-hub")) is None
+        assert cache.load(_key(label_selector="app=x")) is None
+        assert cache.load(_key(namespace=None)) is None
+
+    def test_corrupt_entry_is_ignored(self, cache):
+        cache.store(_key(), "1", ITEMS)
+        (path,) = [os.path.join(cache.directory, n) for n in os.listdir(cache.directory)]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        assert cache.load(_key()) is None
+
+    def test_entries_are_private(self, cache):
+        cache.store(_key(), "1", ITEMS)
+
+        (name,) = os.listdir(cache.directory)
+        assert stat.S_IMODE(os.stat(os.path.join(cache.directory, name)).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(cache.directory).st_mode) == 0o700
+
+    def test_unwritable_directory_does_not_raise(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = ListCache(str(blocker / "cache"))
+
+        cache.store(_key(), "1", ITEMS)
+
+        assert cache.load(_key()) is None
+
+    def test_touch_records_new_resource_version(self, cache):
+        cache.store(_key(), "1", ITEMS)
+
+        cache.touch(cache.load(_key()), "9")
+
+        assert cache.load(_key())["resource_version"] == "9"
+
+    def test_fingerprint_falls_back_to_namespaced_name(self):
+        assert fingerprint(ITEMS) == {"ua": "1", "ns/b": "2"}
+
+    def test_record_counts_hits_and_misses(self, cache):
+        cache.record(hit=True)
+        cache.record(hit=True)
+        cache.record(hit=False)
+
+        assert (cache.hits, cache.misses) == (2, 1)
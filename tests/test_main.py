@@ -581,6 +581,41 @@ def test_get_default_state_dir_falls_back_when_env_missing(self, monkeypatch: py
         monkeypatch.delenv("ACM_SWITCHOVER_STATE_DIR", raising=False)
         assert _get_default_state_dir() == ".state"
 
+    def test_preflight_cache_dir_sits_next_to_state_file(self):
+        from acm_switchover import _get_preflight_cache_dir
+
+        args = SimpleNamespace(state_file="/var/lib/acm/switchover-a__b.json", no_preflight_cache=False)
+        assert _get_preflight_cache_dir(args) == "/var/lib/acm/preflight-cache"
+
+        args.no_preflight_cache = True
+        assert _get_preflight_cache_dir(args) is None
+
+    def test_rbac_cache_dir_sits_next_to_state_file(self):
+        from acm_switchover import _get_rbac_cache_dir
+
+        args = SimpleNamespace(state_file="/var/lib/acm/switchover-a__b.json", no_rbac_cache=False)
+        assert _get_rbac_cache_dir(args) == "/var/lib/acm/rbac-cache"
+
+        args.no_rbac_cache = True
+        assert _get_rbac_cache_dir(args) is None
+
+    def test_initialize_clients_rejects_unknown_context_before_connecting(self, tmp_path, monkeypatch):
+        from acm_switchover import _initialize_clients
+        from lib.kubeconfig_store import get_kubeconfig_store
+
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text("contexts:\n- name: hub-a\n  context: {cluster: a, user: u}\n")
+        monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+        monkeypatch.setenv("ACM_KUBECONFIG_INDEX", str(tmp_path / "index.json"))
+        args = SimpleNamespace(primary_context="hub-a", secondary_context="hub-b", dry_run=False)
+
+        get_kubeconfig_store().invalidate()
+        with patch("acm_switchover.KubeClient") as kube_client:
+            with pytest.raises(ValueError, match="hub-b"):
+                _initialize_clients(args, Mock())
+
+        kube_client.assert_not_called()
+
     def test_run_decommission_uses_namespace_and_interactive_flag(self):
         from acm_switchover import run_decommission
 
@@ -4,6 +4,8 @@
 """
 
 import sys
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -21,6 +23,8 @@
     OBSERVABILITY_NAMESPACE,
 )
 from lib.exceptions import SwitchoverError
+from lib.kubeconfig_store import KubeconfigIndex, get_kubeconfig_store
+from lib.utils import StepProgress
 
 PostActivationVerification = post_activation_module.PostActivationVerification
 
@@ -57,6 +61,8 @@ def mock_state_manager():
         mock.is_step_completed,
         mock.mark_step_completed,
     )
+    # In-memory per-item progress (nothing recorded by earlier runs)
+    mock.step_progress.side_effect = lambda step_name: StepProgress(None, step_name)
     return mock
 
 
@@ -106,11 +112,86 @@ def test_klusterlet_verification_bypasses_kubeconfig_size_limit(self, mock_secon
         )
 
         with patch.object(verify, "_get_hub_api_server", return_value="https://new-hub"):
-            with patch.object(verify, "_load_kubeconfig_data", return_value={}) as mock_load:
+            with patch.object(verify, "_get_kubeconfig_lookup", return_value=KubeconfigIndex({})) as mock_load:
                 verify._verify_klusterlet_connections()
 
         mock_load.assert_called_with(max_size=0)
 
+    def test_klusterlet_verification_classifies_results_with_timeout(self, mock_secondary_client, mock_state_manager):
+        """Slow spokes are reported unreachable; other results keep their classification."""
+        verify = PostActivationVerification(
+            secondary_client=mock_secondary_client,
+            state_manager=mock_state_manager,
+            has_observability=False,
+            klusterlet_concurrency=4,
+        )
+        mock_secondary_client.list_custom_resources.return_value = [
+            {"metadata": {"name": name}, "spec": {"managedClusterClientConfigs": [{"url": f"https://api.{name}"}]}}
+            for name in ("good", "stale", "slow", "orphan")
+        ]
+
+        kubeconfig = KubeconfigIndex({"contexts": [{"name": "hub", "context": {"cluster": "hub"}}]})
+
+        def find_context(index, url, name):
+            return None if name == "orphan" else f"{name}-ctx"
+
+        def check(context_name, cluster_name, hub):
+            if cluster_name == "slow":
+                time.sleep(0.5)
+            return "wrong_hub" if cluster_name == "stale" else "verified"
+
+        with patch.object(verify, "_get_hub_api_server", return_value="https://new-hub"):
+            with patch.object(verify, "_get_kubeconfig_lookup", return_value=kubeconfig):
+                with patch.object(verify, "_find_context_by_api_url", side_effect=find_context):
+                    with patch.object(verify, "_check_klusterlet_connection", side_effect=check):
+                        with patch.object(verify, "_force_klusterlet_reconnect", return_value=True) as mock_fix:
+                            with patch.object(post_activation_module, "KLUSTERLET_CHECK_TIMEOUT", 0.1):
+                                with patch.object(post_activation_module.logger, "info") as mock_info:
+                                    verify._verify_klusterlet_connections()
+
+        mock_fix.assert_called_once_with("stale", "stale-ctx")
+        logged = [c.args for c in mock_info.call_args_list]
+        assert any(args[0].startswith("✓ Klusterlet verified") and args[2] == "good" for args in logged)
+        assert any(
+            args[0].startswith("Klusterlet verification skipped") and args[2] == "slow, orphan" for args in logged
+        )
+
+    def test_klusterlet_workers_reuse_kubeconfig_loaded_before_fan_out(self, mock_secondary_client, mock_state_manager):
+        """Workers build clients from one snapshot and never reload the kubeconfig themselves."""
+        verify = PostActivationVerification(
+            secondary_client=mock_secondary_client,
+            state_manager=mock_state_manager,
+            has_observability=False,
+            klusterlet_concurrency=4,
+        )
+        mock_secondary_client.list_custom_resources.return_value = [
+            {"metadata": {"name": f"spoke{i}"}, "spec": {"managedClusterClientConfigs": [{"url": f"https://api.{i}"}]}}
+            for i in range(8)
+        ]
+        kubeconfig = KubeconfigIndex({"contexts": [{"name": "hub", "context": {"cluster": "hub"}}]})
+        data = {"contexts": []}
+        load_threads = []
+
+        def load_kubeconfig_data(**kwargs):
+            load_threads.append(threading.current_thread())
+            return data
+
+        def check(context_name, cluster_name, hub):
+            verify._managed_cluster_api_client(context_name)
+            return "verified"
+
+        with patch.object(verify, "_get_hub_api_server", return_value="https://new-hub"):
+            with patch.object(verify, "_get_kubeconfig_lookup", return_value=kubeconfig):
+                with patch.object(verify, "_find_context_by_api_url", side_effect=lambda i, u, n: f"{n}-ctx"):
+                    with patch.object(verify, "_load_kubeconfig_data", side_effect=load_kubeconfig_data):
+                        with patch.object(verify, "_check_klusterlet_connection", side_effect=check):
+                            with patch.object(verify._api_client_pool, "get") as mock_get:
+                                verify._verify_klusterlet_connections()
+
+        assert load_threads == [threading.current_thread()]
+        assert mock_get.call_count == 8
+        assert all(c.args[1] is data for c in mock_get.call_args_list)
+
     @patch("modules.post_activation.wait_for_condition")
     def test_verify_success_with_observability(
         self, mock_wait, post_verify_with_obs, mock_secondary_client, mock_state_manager
@@ -526,7 +607,7 @@ def test_force_klusterlet_reconnect_success(self, mock_secondary_client, mock_st
         }
 
         # Mock Kubernetes client methods
-        with patch("modules.post_activation.config.load_kube_config"):
+        with patch.object(verify, "_managed_cluster_api_client") as mock_api_client:
             with patch("modules.post_activation.client.CoreV1Api") as mock_core_api:
                 with patch("modules.post_activation.client.AppsV1Api") as mock_apps_api:
                     mock_core_instance = mock_core_api.return_value
@@ -545,6 +626,41 @@ def test_force_klusterlet_reconnect_success(self, mock_secondary_client, mock_st
                     mock_secondary_client.get_secret.assert_called_once_with(
                         namespace="test-cluster", name="test-cluster-import"
                     )
+                    # Every step reuses the pooled client for the spoke context
+                    assert {c.args for c in mock_api_client.call_args_list} == {("test-context",)}
+                    mock_core_api.assert_called_with(mock_api_client.return_value)
+                    mock_apps_api.assert_called_with(mock_api_client.return_value)
+                    # Every spoke request is bounded so a blackholed spoke frees its worker
+                    spoke_calls = (
+                        mock_core_instance.delete_namespaced_secret.call_args_list
+                        + mock_core_instance.create_namespaced_secret.call_args_list
+                        + mock_core_instance.read_namespaced_secret.call_args_list
+                        + mock_apps_instance.patch_namespaced_deployment.call_args_list
+                    )
+                    assert len(spoke_calls) == 4
+                    assert all(
+                        c.kwargs["_request_timeout"] == post_activation_module.KLUSTERLET_CHECK_TIMEOUT
+                        for c in spoke_calls
+                    )
+
+    def test_check_klusterlet_connection_bounds_requests(self, mock_secondary_client, mock_state_manager):
+        """Both secret reads (including the 404 fallback) carry the per-spoke request timeout."""
+        verify = PostActivationVerification(
+            secondary_client=mock_secondary_client,
+            state_manager=mock_state_manager,
+            has_observability=False,
+        )
+
+        with patch.object(verify, "_managed_cluster_api_client"):
+            with patch("modules.post_activation.client.CoreV1Api") as mock_core_api:
+                read_secret = mock_core_api.return_value.read_namespaced_secret
+                read_secret.side_effect = [ApiException(status=404), Mock(data={})]
+
+                assert verify._check_klusterlet_connection("ctx", "cluster1", "https://hub") == "unreachable"
+
+        reads = mock_core_api.return_value.read_namespaced_secret.call_args_list
+        assert [c.kwargs["name"] for c in reads] == ["hub-kubeconfig-secret", "bootstrap-hub-kubeconfig"]
+        assert all(c.kwargs["_request_timeout"] == post_activation_module.KLUSTERLET_CHECK_TIMEOUT for c in reads)
 
     def test_force_klusterlet_reconnect_no_secret(self, mock_secondary_client, mock_state_manager):
         """Test klusterlet reconnect when import secret not found."""
@@ -742,3 +858,82 @@ def test_load_kubeconfig_default_path(self, mock_secondary_client, mock_state_ma
             # The method should not raise an exception
             data = verify._load_kubeconfig_data()
             assert isinstance(data, dict)
+
+    def test_kubeconfig_change_resets_client_pool(self, mock_secondary_client, mock_state_manager, tmp_path):
+        """Reloading a changed kubeconfig drops pooled managed-cluster clients."""
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text("contexts: [{name: a, context: {cluster: a}}]\n")
+        verify = PostActivationVerification(
+            secondary_client=mock_secondary_client,
+            state_manager=mock_state_manager,
+            has_observability=False,
+        )
+
+        with patch.dict("os.environ", {"KUBECONFIG": str(kubeconfig)}):
+            with patch.object(verify._api_client_pool, "reset") as mock_reset:
+                first = verify._get_kubeconfig_index()
+                assert verify._get_kubeconfig_index() is first
+                mock_reset.assert_not_called()
+
+                get_kubeconfig_store().invalidate()
+                assert verify._get_kubeconfig_index() is not first
+                mock_reset.assert_called_once()
+
+
+@pytest.mark.unit
+class TestKubeconfigContextLookup:
+    """Tests for hub and managed-cluster context resolution via the kubeconfig index."""
+
+    INDEX = KubeconfigIndex(
+        {
+            "clusters": [
+                {"name": "hub", "cluster": {"server": "https://api.hub.example.com:6443"}},
+                {"name": "prod1", "cluster": {"server": "https://API.prod1.example.com:6443/"}},
+            ],
+            "contexts": [
+                {"name": "hub-ctx", "context": {"cluster": "hub", "user": "u"}},
+                {"name": "admin@prod1", "context": {"cluster": "prod1", "user": "u"}},
+                {"name": "spoke2", "context": {"cluster": "other", "user": "u"}},
+            ],
+        }
+    )
+
+    @pytest.fixture
+    def verify(self, mock_secondary_client, mock_state_manager):
+        mock_secondary_client.context = "hub-ctx"
+        return PostActivationVerification(
+            secondary_client=mock_secondary_client,
+            state_manager=mock_state_manager,
+            has_observability=False,
+        )
+
+    def test_find_context_by_api_url_matches_host(self, verify):
+        assert verify._find_context_by_api_url(self.INDEX, "https://api.prod1.example.com:443", "prod1") == "admin@prod1"
+
+    def test_find_context_by_api_url_no_match(self, verify):
+        assert verify._find_context_by_api_url(self.INDEX, "https://api.unknown.example.com", "x") == ""
+
+    def test_find_context_without_url_falls_back_to_name(self, verify):
+        assert verify._find_context_by_api_url(self.INDEX, "", "spoke2") == "spoke2"
+        assert verify._find_context_by_api_url(self.INDEX, "", "missing") == ""
+
+    def test_get_hub_api_server(self, verify):
+        with patch.object(verify, "_get_kubeconfig_lookup", return_value=self.INDEX):
+            assert verify._get_hub_api_server() == "https://api.hub.example.com:6443"
+
+    def test_context_lookup_does_not_reset_client_pool(self, verify, tmp_path):
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text(
+            "contexts:\n- name: hub-ctx\n  context: {cluster: hub, user: u}\n"
+            "clusters:\n- name: hub\n  cluster: {server: https://api.hub.example.com}\n"
+        )
+        env = {"KUBECONFIG": str(kubeconfig), "ACM_KUBECONFIG_INDEX": str(tmp_path / "index.json")}
+        with patch.dict("os.environ", env):
+            get_kubeconfig_store().invalidate()
+            verify._get_kubeconfig_index(max_size=0)
+            with patch.object(verify._api_client_pool, "reset") as mock_reset:
+                assert verify._get_hub_api_server() == "https://api.hub.example.com"
+                verify._get_kubeconfig_index(max_size=0)
+            get_kubeconfig_store().invalidate()
+
+        mock_reset.assert_not_called()
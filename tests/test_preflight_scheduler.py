@@ -0,0 +1,185 @@
+"""Unit tests for modules/preflight/scheduler.py and concurrent pre-flight runs.
+
+Tests cover dependency handling, concurrency, deterministic result ordering,
+error propagation, and the PreflightValidator task graph.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from modules.preflight import ValidationReporter
+from modules.preflight.scheduler import ValidationScheduler, ValidationTask
+from modules.preflight_coordinator import PreflightValidator
+
+
+@pytest.fixture
+def reporter():
+    return ValidationReporter()
+
+
+def _reporting(reporter, check, delay=0.0, result=None):
+    def run():
+        time.sleep(delay)
+        reporter.add_result(check, True, "ok")
+        return result
+
+    return run
+
+
+@pytest.mark.unit
+class TestValidationScheduler:
+    """Tests for ValidationScheduler."""
+
+    def test_results_follow_declaration_order(self, reporter):
+        tasks = [
+            ValidationTask("slow", _reporting(reporter, "slow", delay=0.05)),
+            ValidationTask("medium", _reporting(reporter, "medium", delay=0.02)),
+            ValidationTask("fast", _reporting(reporter, "fast")),
+        ]
+
+        ValidationScheduler(reporter, max_workers=3).run(tasks)
+
+        assert [r["check"] for r in reporter.results] == ["slow", "medium", "fast"]
+
+    def test_independent_tasks_run_concurrently(self, reporter):
+        barrier = threading.Barrier(3, timeout=5)
+        tasks = [ValidationTask(f"t{i}", barrier.wait) for i in range(3)]
+
+        # Deadlocks (BrokenBarrierError) unless all three run at the same time
+        ValidationScheduler(reporter, max_workers=3).run(tasks)
+
+    def test_dependent_task_receives_outputs(self, reporter):
+        seen = {}
+
+        def consumer(versions, observability):
+            seen.update(versions=versions, observability=observability)
+
+        tasks = [
+            ValidationTask("versions", _reporting(reporter, "versions", delay=0.02, result=("2.14.0", "2.14.1"))),
+            ValidationTask("observability", lambda: (True, False)),
+            ValidationTask("consumer", consumer, requires=("versions", "observability")),
+        ]
+
+        outputs = ValidationScheduler(reporter, max_workers=4).run(tasks)
+
+        assert seen == {"versions": ("2.14.0", "2.14.1"), "observability": (True, False)}
+        assert outputs["versions"] == ("2.14.0", "2.14.1")
+
+    def test_dependency_runs_before_dependent(self, reporter):
+        events = []
+        tasks = [
+            ValidationTask("first", lambda: (time.sleep(0.02), events.append("first"))),
+            ValidationTask("second", lambda first: events.append("second"), requires=("first",)),
+        ]
+
+        ValidationScheduler(reporter, max_workers=2).run(tasks)
+
+        assert events == ["first", "second"]
+
+    def test_task_error_propagates_after_results_released(self, reporter):
+        def boom():
+            raise RuntimeError("boom")
+
+        tasks = [
+            ValidationTask("ok", _reporting(reporter, "ok", delay=0.02)),
+            ValidationTask("boom", boom),
+            ValidationTask("after", _reporting(reporter, "after"), requires=("boom",)),
+        ]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            ValidationScheduler(reporter, max_workers=2).run(tasks)
+
+        assert [r["check"] for r in reporter.results] == ["ok"]
+
+    @pytest.mark.parametrize(
+        "tasks",
+        [
+            [ValidationTask("a", Mock()), ValidationTask("a", Mock())],
+            [ValidationTask("a", Mock(), requires=("b",)), ValidationTask("b", Mock())],
+            [ValidationTask("a", Mock(), requires=("missing",))],
+        ],
+    )
+    def test_invalid_graphs_rejected(self, reporter, tasks):
+        with pytest.raises(ValueError):
+            ValidationScheduler(reporter, max_workers=2).run(tasks)
+
+
+@pytest.mark.unit
+class TestReporterThreadSafety:
+    """Tests for concurrent use of ValidationReporter."""
+
+    def test_concurrent_add_result_keeps_every_result(self, reporter):
+        def worker(n):
+            for i in range(50):
+                reporter.add_result(f"check-{n}-{i}", i % 2 == 0, "msg", critical=False)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(reporter.results) == 400
+
+    def test_deferred_results_wait_for_release(self, reporter):
+        with reporter.deferred(0):
+            reporter.add_result("held", True, "ok")
+
+        assert reporter.results == []
+
+        reporter.release(0)
+
+        assert [r["check"] for r in reporter.results] == ["held"]
+
+
+@pytest.mark.unit
+class TestPreflightValidatorGraph:
+    """Tests for the task graph built by PreflightValidator."""
+
+    @pytest.fixture
+    def validator(self):
+        return PreflightValidator(Mock(), Mock(), method="passive", skip_rbac_validation=True)
+
+    def test_task_dependencies(self, validator):
+        tasks = {t.name: t for t in validator._build_tasks()}
+
+        assert tasks["auto_import_strategy"].requires == ("versions",)
+        assert tasks["observability_prereqs"].requires == ("observability",)
+        assert "passive_sync" in tasks
+        assert {"backup_storage_primary", "backup_storage_secondary"} <= set(tasks)
+
+    def test_full_method_skips_passive_sync(self):
+        validator = PreflightValidator(Mock(), Mock(), method="full", skip_rbac_validation=True)
+
+        assert "passive_sync" not in {t.name for t in validator._build_tasks()}
+
+    def test_validate_all_wires_outputs_into_config(self, validator):
+        validator.version_validator.run = Mock(return_value=("2.14.0", "2.14.0"))
+        validator.observability_detector.detect = Mock(return_value=(False, True))
+        for name in (
+            "kubeconfig_validator",
+            "tooling_validator",
+            "namespace_validator",
+            "hub_component_validator",
+            "backup_validator",
+            "backup_schedule_validator",
+            "backup_storage_location_validator",
+            "cluster_deployment_validator",
+            "managed_cluster_backup_validator",
+            "passive_sync_validator",
+            "observability_prereq_validator",
+        ):
+            getattr(validator, name).run = Mock()
+
+        with patch("modules.preflight_coordinator.AutoImportStrategyValidator") as auto_import:
+            passed, config = validator.validate_all()
+
+        assert passed is True
+        assert config["primary_version"] == "2.14.0"
+        assert config["has_observability"] is True
+        auto_import.return_value.run.assert_called_once_with(validator.primary, validator.secondary, "2.14.0", "2.14.0")
+        validator.observability_prereq_validator.run.assert_called_once_with(validator.secondary)
+        assert validator.hub_component_validator.run.call_count == 2
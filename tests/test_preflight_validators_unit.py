@@ -7,13 +7,17 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from kubernetes.client import Configuration
 
+from lib.kube_client import KubeClient
+from lib.kubeconfig_store import KubeconfigIndex
 from modules.preflight.backup_validators import (
     BackupScheduleValidator,
     BackupStorageLocationValidator,
     BackupValidator,
     ManagedClusterBackupValidator,
     PassiveSyncValidator,
+    _names_created_after,
 )
 from modules.preflight.cluster_validators import ClusterDeploymentValidator
 from modules.preflight.namespace_validators import (
@@ -50,8 +54,8 @@ class TestBackupValidator:
     def test_no_backups_found(self, reporter, mock_kube_client):
         """Test critical failure when no backups exist."""
         validator = BackupValidator(reporter)
-        # Mock empty backup list
-        mock_kube_client.list_custom_resources.return_value = []
+        # Mock empty backup stream
+        mock_kube_client.iter_custom_resources.return_value = []
 
         validator.run(mock_kube_client)
 
@@ -72,7 +76,7 @@ def test_backup_in_progress(self, reporter, mock_kube_client, mocker):
 
         validator = BackupValidator(reporter)
         # Mock backups with one in progress - stays in progress through all polls
-        mock_kube_client.list_custom_resources.return_value = [
+        mock_kube_client.iter_custom_resources.return_value = [
             {
                 "metadata": {"name": "backup-in-progress", "creationTimestamp": "2025-12-31T10:00:00Z"},
                 "status": {"phase": "InProgress"},
@@ -97,7 +101,7 @@ def test_latest_backup_failed(self, reporter, mock_kube_client):
         """Test critical failure when latest backup failed."""
         validator = BackupValidator(reporter)
         # Mock backups with failed latest backup
-        mock_kube_client.list_custom_resources.return_value = [
+        mock_kube_client.iter_custom_resources.return_value = [
             {
                 "metadata": {"name": "backup-failed", "creationTimestamp": "2025-12-31T10:00:00Z"},
                 "status": {"phase": "Failed"},
@@ -126,7 +130,7 @@ def test_latest_backup_completed_fresh(self, reporter, mock_kube_client):
         now = datetime.now(timezone.utc)
         recent_time = (now - timedelta(minutes=5)).replace(second=0, microsecond=0).isoformat().replace("+00:00", "Z")
 
-        mock_kube_client.list_custom_resources.return_value = [
+        mock_kube_client.iter_custom_resources.return_value = [
             {
                 "metadata": {"name": "backup-fresh", "creationTimestamp": recent_time},
                 "status": {"phase": "Completed", "completionTimestamp": recent_time},
@@ -148,7 +152,7 @@ def test_latest_backup_completed_old(self, reporter, mock_kube_client):
         """Test success with old completed backup (shows age warning)."""
         validator = BackupValidator(reporter)
         # Mock old completed backup (more than 24 hours)
-        mock_kube_client.list_custom_resources.return_value = [
+        mock_kube_client.iter_custom_resources.return_value = [
             {
                 "metadata": {"name": "backup-old", "creationTimestamp": "2025-12-28T10:00:00Z"},
                 "status": {"phase": "Completed", "completionTimestamp": "2025-12-28T10:05:00Z"},
@@ -170,7 +174,7 @@ def test_api_error_handling(self, reporter, mock_kube_client):
         """Test error handling when API call fails."""
         validator = BackupValidator(reporter)
         # Mock API exception
-        mock_kube_client.list_custom_resources.side_effect = RuntimeError("API error")
+        mock_kube_client.iter_custom_resources.side_effect = RuntimeError("API error")
 
         validator.run(mock_kube_client)
 
@@ -415,6 +419,39 @@ def test_connectivity_failure(self, reporter, mock_kube_client):
         assert results[0]["critical"] is True
         assert "Cannot connect" in results[0]["message"]
 
+    def test_duplicate_users_read_from_shared_store(self, reporter):
+        """Test that a user shared by our contexts is flagged from the kubeconfig index."""
+        validator = KubeconfigValidator(reporter)
+        index = KubeconfigIndex(
+            {
+                "contexts": [
+                    {"name": "primary", "context": {"cluster": "a", "user": "admin"}},
+                    {"name": "secondary", "context": {"cluster": "b", "user": "admin"}},
+                ]
+            }
+        )
+        primary, secondary = Mock(context="primary"), Mock(context="secondary")
+
+        with patch("modules.preflight.version_validators.get_kubeconfig_store") as store:
+            store.return_value.load.return_value = index
+            validator._check_duplicate_users(primary, secondary)
+
+        assert reporter.results[0]["passed"] is False
+        assert "user 'admin'" in reporter.results[0]["message"]
+
+    def test_token_expiration_without_token(self, reporter, mock_kube_client):
+        """Test that a context without a Bearer token is reported as informational."""
+        validator = KubeconfigValidator(reporter)
+        mock_kube_client.context = "primary"
+        mock_kube_client.custom_api.api_client.configuration.api_key = {}
+
+        with patch("modules.preflight.version_validators.get_kubeconfig_store") as store:
+            store.return_value.load.return_value = KubeconfigIndex({})
+            validator._check_token_expiration(mock_kube_client, "primary")
+
+        assert reporter.results[0]["passed"] is True
+        assert "No Bearer token" in reporter.results[0]["message"]
+
 
 class TestHubComponentValidator:
     """Tests for HubComponentValidator."""
@@ -729,7 +766,7 @@ def test_no_joined_clusters(self, reporter, mock_kube_client):
         """Test that no joined clusters is handled with info message."""
         validator = ManagedClusterBackupValidator(reporter)
         # Return local-cluster only, which is excluded
-        mock_kube_client.list_custom_resources.return_value = [{"metadata": {"name": "local-cluster"}}]
+        mock_kube_client.iter_custom_resources.return_value = [{"metadata": {"name": "local-cluster"}}]
 
         validator.run(mock_kube_client)
 
@@ -748,8 +785,8 @@ def test_warns_when_cluster_created_after_backup(self, reporter, mock_kube_clien
         validator = ManagedClusterBackupValidator(reporter)
 
         # Mock joined managed clusters (one created before backup, one after)
-        mock_kube_client.list_custom_resources.side_effect = [
-            # First call: list managed clusters
+        mock_kube_client.iter_custom_resources.side_effect = [
+            # List managed clusters
             [
                 {
                     "metadata": {"name": "cluster-before", "creationTimestamp": "2025-12-01T10:00:00Z"},
@@ -760,31 +797,24 @@ def test_warns_when_cluster_created_after_backup(self, reporter, mock_kube_clien
                     "status": {"conditions": [{"type": "ManagedClusterJoined", "status": "True"}]},
                 },
             ],
-            # Second call: list backups (with required ACM label)
-            [
-                {
-                    "metadata": {
-                        "name": "acm-managed-clusters-schedule-20251210100000",
-                        "creationTimestamp": "2025-12-10T10:00:00Z",
-                        "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
-                    },
-                    "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+        ]
+        # Latest managed-clusters backup (selected server-side by the ACM schedule type label)
+        mock_kube_client.get_latest_velero_backups.return_value = [
+            {
+                "metadata": {
+                    "name": "acm-managed-clusters-schedule-20251210100000",
+                    "creationTimestamp": "2025-12-10T10:00:00Z",
+                    "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
                 },
-            ],
+                "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+            },
         ]
 
-        # Mock get_custom_resource for individual cluster lookups
-        def get_cluster(group, version, plural, name):
-            if name == "cluster-before":
-                return {"metadata": {"name": "cluster-before", "creationTimestamp": "2025-12-01T10:00:00Z"}}
-            elif name == "cluster-after":
-                return {"metadata": {"name": "cluster-after", "creationTimestamp": "2025-12-15T10:00:00Z"}}
-            return None
-
-        mock_kube_client.get_custom_resource.side_effect = get_cluster
-
         validator.run(mock_kube_client)
 
+        # Creation times come from the list response, not per-cluster GETs
+        mock_kube_client.get_custom_resource.assert_not_called()
+
         # Should have a critical failure result about cluster-after
         results = reporter.results
         warning_results = [r for r in results if "after backup" in r.get("check", "").lower()]
@@ -798,8 +828,8 @@ def test_no_warning_when_all_clusters_before_backup(self, reporter, mock_kube_cl
         validator = ManagedClusterBackupValidator(reporter)
 
         # Mock joined managed clusters (all created before backup)
-        mock_kube_client.list_custom_resources.side_effect = [
-            # First call: list managed clusters
+        mock_kube_client.iter_custom_resources.side_effect = [
+            # List managed clusters
             [
                 {
                     "metadata": {"name": "cluster-1", "creationTimestamp": "2025-12-01T10:00:00Z"},
@@ -810,35 +840,124 @@ def test_no_warning_when_all_clusters_before_backup(self, reporter, mock_kube_cl
                     "status": {"conditions": [{"type": "ManagedClusterJoined", "status": "True"}]},
                 },
             ],
-            # Second call: list backups (with required ACM label)
-            [
-                {
-                    "metadata": {
-                        "name": "acm-managed-clusters-schedule-20251210100000",
-                        "creationTimestamp": "2025-12-10T10:00:00Z",
-                        "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
-                    },
-                    "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+        ]
+        # Latest managed-clusters backup (selected server-side by the ACM schedule type label)
+        mock_kube_client.get_latest_velero_backups.return_value = [
+            {
+                "metadata": {
+                    "name": "acm-managed-clusters-schedule-20251210100000",
+                    "creationTimestamp": "2025-12-10T10:00:00Z",
+                    "labels": {"cluster.open-cluster-management.io/backup-schedule-type": "managedClusters"},
                 },
-            ],
+                "status": {"phase": "Completed", "completionTimestamp": "2025-12-10T10:05:00Z"},
+            },
         ]
 
-        # Mock get_custom_resource for individual cluster lookups
-        def get_cluster(group, version, plural, name):
-            if name == "cluster-1":
-                return {"metadata": {"name": "cluster-1", "creationTimestamp": "2025-12-01T10:00:00Z"}}
-            elif name == "cluster-2":
-                return {"metadata": {"name": "cluster-2", "creationTimestamp": "2025-12-05T10:00:00Z"}}
-            return None
-
-        mock_kube_client.get_custom_resource.side_effect = get_cluster
-
         validator.run(mock_kube_client)
 
         # Should NOT have any warning about clusters after backup
         results = reporter.results
         warning_results = [r for r in results if "after backup" in r.get("check", "").lower()]
         assert len(warning_results) == 0
+        assert any(r["check"] == "ManagedClusters in backup" and r["passed"] for r in results)
+        mock_kube_client.get_latest_velero_backups.assert_called_once_with(
+            namespace="open-cluster-management-backup", schedule_type="managedClusters"
+        )
+
+
+class TestNamesCreatedAfter:
+    """Tests for the creationTimestamp comparison used by ManagedClusterBackupValidator."""
+
+    def test_compares_canonical_and_other_formats(self):
+        cutoff = datetime(2025, 12, 10, 10, 5, 0, 500000, tzinfo=timezone.utc)
+        created = [
+            ("before", "2025-12-10T10:04:59Z"),
+            ("same-second", "2025-12-10T10:05:00Z"),
+            ("after", "2025-12-10T10:05:01Z"),
+            ("offset-after", "2025-12-10T12:05:01+02:00"),
+            ("fractional-after", "2025-12-10T10:05:00.900000Z"),
+            ("no-timestamp", ""),
+            ("garbage", "not-a-time"),
+        ]
+
+        assert _names_created_after(created, cutoff) == ["after", "offset-after", "fractional-after"]
+
+
+class TestValidatorApiCallCounts:
+    """Regression checks: API requests per validator must not grow with the fleet size."""
+
+    SCHEDULE_TYPE_LABEL = "cluster.open-cluster-management.io/backup-schedule-type"
+
+    @classmethod
+    def _fake_custom_api(cls, size):
+        """CustomObjectsApi stand-in serving a synthetic fleet (one page per list, label equality selectors)."""
+        clusters = [
+            {
+                "metadata": {"name": f"cluster-{i:05d}", "creationTimestamp": "2025-12-01T10:00:00Z"},
+                "status": {"conditions": [{"type": "ManagedClusterJoined", "status": "True"}]},
+            }
+            for i in range(size)
+        ]
+        # Weeks of retained backups across the ACM schedule types
+        backups = [
+            {
+                "metadata": {
+                    "name": f"acm-{schedule_type.lower()}-schedule-202512{day:02d}100000",
+                    "creationTimestamp": f"2025-12-{day:02d}T10:00:00Z",
+                    "labels": {cls.SCHEDULE_TYPE_LABEL: schedule_type},
+                },
+                "status": {"phase": "Completed", "completionTimestamp": f"2025-12-{day:02d}T10:05:00Z"},
+            }
+            for day in range(1, 29)
+            for schedule_type in ("credentials", "resources", "managedClusters")
+        ]
+        cluster_deployments = [
+            {
+                "metadata": {"name": f"cluster-{i:05d}", "namespace": f"cluster-{i:05d}"},
+                "spec": {"preserveOnDelete": True},
+            }
+            for i in range(size)
+        ]
+        items = {"managedclusters": clusters, "backups": backups, "clusterdeployments": cluster_deployments}
+
+        def list_objects(plural, label_selector=None, **_kwargs):
+            selected = items[plural]
+            if label_selector:
+                key, value = label_selector.split("=")
+                selected = [item for item in selected if item["metadata"].get("labels", {}).get(key) == value]
+            return {"metadata": {}, "items": selected}
+
+        def get_object(plural, name, **_kwargs):
+            return next(item for item in items[plural] if item["metadata"]["name"] == name)
+
+        api = Mock()
+        api.list_namespaced_custom_object.side_effect = list_objects
+        api.list_cluster_custom_object.side_effect = list_objects
+        api.get_namespaced_custom_object.side_effect = get_object
+        api.get_cluster_custom_object.side_effect = get_object
+        return api
+
+    @pytest.mark.parametrize(
+        "validator_cls,expected_requests",
+        [
+            # ManagedCluster list, metadata-only managed-clusters backup list, GET of the latest backup
+            (ManagedClusterBackupValidator, 3),
+            (BackupValidator, 1),
+            (ClusterDeploymentValidator, 1),
+        ],
+    )
+    @pytest.mark.parametrize("fleet_size", [10, 3000])
+    def test_api_requests_per_validator(self, reporter, validator_cls, expected_requests, fleet_size):
+        custom_api = self._fake_custom_api(fleet_size)
+        with patch("lib.kube_client._load_client_configuration", return_value=Configuration()), patch(
+            "lib.kube_client.client.CustomObjectsApi", return_value=custom_api
+        ):
+            client = KubeClient(context=f"fleet-{fleet_size}")
+
+        validator_cls(reporter).run(client)
+
+        assert all(r["passed"] for r in reporter.results), reporter.results
+        assert len(custom_api.mock_calls) == expected_requests
 
 
 class TestVersionValidator:
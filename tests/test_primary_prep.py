@@ -5,16 +5,25 @@
 
 import sys
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from kubernetes.client.rest import ApiException
 
 # Add parent to path to import modules directly
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import modules.primary_prep as primary_prep_module
-from lib.constants import OBSERVABILITY_NAMESPACE, THANOS_SCALE_DOWN_WAIT
+from lib.constants import (
+    DISABLE_AUTO_IMPORT_ANNOTATION,
+    OBSERVABILITY_NAMESPACE,
+    THANOS_SCALE_DOWN_WAIT,
+)
+from lib.exceptions import SwitchoverError
+from lib.kube_client import KubeClient
+from lib.utils import StepProgress
 
 PrimaryPreparation = primary_prep_module.PrimaryPreparation
 
@@ -41,6 +50,8 @@ def mock_primary_client():
     client = Mock()
     client.list_managed_clusters = Mock(return_value=[])
     client.patch_managed_cluster = Mock()
+    # Run the real bulk patch engine so per-cluster patch calls stay observable
+    client.bulk_patch_managed_clusters = Mock(side_effect=partial(KubeClient.bulk_patch_managed_clusters, client))
     return client
 
 
@@ -54,6 +65,8 @@ def mock_state_manager():
         mock.is_step_completed,
         mock.mark_step_completed,
     )
+    # In-memory per-item progress (nothing recorded by earlier runs)
+    mock.step_progress.side_effect = lambda step_name: StepProgress(None, step_name)
     return mock
 
 
@@ -240,6 +253,62 @@ def test_disable_auto_import_no_clusters(self, primary_prep_with_obs, mock_prima
 
         mock_primary_client.patch_managed_cluster.assert_not_called()
 
+    def test_disable_auto_import_aggregates_failures(self, primary_prep_with_obs, mock_primary_client):
+        """Patch failures are collected across clusters and raised together."""
+        mock_primary_client.list_managed_clusters.return_value = [
+            {"metadata": {"name": "cluster1"}},
+            {"metadata": {"name": "cluster2", "annotations": {DISABLE_AUTO_IMPORT_ANNOTATION: ""}}},
+            {"metadata": {"name": "cluster3"}},
+        ]
+
+        def patch_side_effect(name, patch):
+            if name == "cluster3":
+                raise ApiException(status=500)
+            return {}
+
+        mock_primary_client.patch_managed_cluster.side_effect = patch_side_effect
+
+        with pytest.raises(SwitchoverError, match="cluster3"):
+            primary_prep_with_obs._disable_auto_import()
+
+        patched = sorted(c.kwargs["name"] for c in mock_primary_client.patch_managed_cluster.call_args_list)
+        assert patched == ["cluster1", "cluster3"]
+
+    def test_disable_auto_import_resume_skips_processed_clusters(self, mock_primary_client, tmp_path):
+        """Clusters patched before a failure are not patched again on resume."""
+        from lib.utils import StateManager
+
+        state = StateManager(str(tmp_path / "state.json"))
+        prep = PrimaryPreparation(
+            primary_client=mock_primary_client,
+            state_manager=state,
+            acm_version="2.12.0",
+            has_observability=False,
+        )
+        mock_primary_client.list_managed_clusters.return_value = [
+            {"metadata": {"name": f"cluster{i}"}} for i in range(1, 5)
+        ]
+
+        def patch_side_effect(name, patch):
+            if name == "cluster3":
+                raise ApiException(status=500)
+            return {}
+
+        mock_primary_client.patch_managed_cluster.side_effect = patch_side_effect
+
+        with pytest.raises(SwitchoverError):
+            prep._disable_auto_import()
+
+        reloaded = StateManager(str(tmp_path / "state.json"))
+        assert reloaded.state["step_progress"]["disable_auto_import"] == ["cluster1", "cluster2", "cluster4"]
+
+        mock_primary_client.patch_managed_cluster.reset_mock(side_effect=True)
+        prep.state = reloaded
+        prep._disable_auto_import()
+
+        patched = [c.kwargs["name"] for c in mock_primary_client.patch_managed_cluster.call_args_list]
+        assert patched == ["cluster3"]
+
     @patch("time.sleep")
     def test_scale_down_thanos(self, mock_sleep, primary_prep_with_obs, mock_primary_client):
         """Test scaling down Thanos compactor."""
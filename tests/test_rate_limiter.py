@@ -0,0 +1,133 @@
+"""Unit tests for lib/rate_limiter.py.
+
+Tests cover the token bucket: burst capacity, refill at QPS, blocking
+acquire, timeouts, and the disabled (qps <= 0) mode.
+"""
+
+import threading
+
+import pytest
+
+from lib.rate_limiter import TokenBucket, get_context_limiter, reset_context_limiters
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_is_available_immediately(self, clock):
+        bucket = TokenBucket(qps=1, burst=3, clock=clock.time, sleep=clock.sleep)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_tokens_refill_at_qps(self, clock):
+        bucket = TokenBucket(qps=2, burst=1, clock=clock.time, sleep=clock.sleep)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+        clock.now += 0.5
+
+        assert bucket.try_acquire()
+
+    def test_refill_is_capped_at_burst(self, clock):
+        bucket = TokenBucket(qps=10, burst=2, clock=clock.time, sleep=clock.sleep)
+        bucket.try_acquire()
+        bucket.try_acquire()
+
+        clock.now += 100
+
+        assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+    def test_acquire_blocks_until_token_available(self, clock):
+        bucket = TokenBucket(qps=4, burst=1, clock=clock.time, sleep=clock.sleep)
+
+        for _ in range(3):
+            assert bucket.acquire()
+
+        # First token from burst, then one every 1/qps seconds
+        assert clock.now == pytest.approx(0.5)
+        assert clock.sleeps == [pytest.approx(0.25), pytest.approx(0.25)]
+
+    def test_acquire_times_out(self, clock):
+        bucket = TokenBucket(qps=0.1, burst=1, clock=clock.time, sleep=clock.sleep)
+        bucket.acquire()
+
+        assert bucket.acquire(timeout=1) is False
+        assert clock.now == pytest.approx(1)
+
+    def test_zero_qps_disables_limiting(self, clock):
+        bucket = TokenBucket(qps=0, burst=1, clock=clock.time, sleep=clock.sleep)
+
+        assert not bucket.enabled
+        assert all(bucket.acquire() for _ in range(100))
+        assert clock.sleeps == []
+
+    def test_concurrent_acquire_never_exceeds_burst(self):
+        bucket = TokenBucket(qps=0.001, burst=5)
+        acquired = []
+
+        def worker():
+            acquired.append(bucket.try_acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert acquired.count(True) == 5
+
+    def test_pause_blocks_until_retry_after_then_resumes_at_qps(self, clock):
+        bucket = TokenBucket(qps=10, burst=5, clock=clock.time, sleep=clock.sleep)
+
+        bucket.pause(3)
+
+        assert not bucket.try_acquire()
+        assert bucket.acquire()
+        # Waited out the pause, then one token at the sustained rate (no burst)
+        assert clock.now == pytest.approx(3.1)
+        assert not bucket.try_acquire()
+
+
+@pytest.mark.unit
+class TestContextLimiters:
+    """Tests for the process-wide per-context limiter registry."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_context_limiters()
+        yield
+        reset_context_limiters()
+
+    def test_same_context_shares_bucket(self):
+        assert get_context_limiter("hub") is get_context_limiter("hub")
+        assert get_context_limiter("hub") is not get_context_limiter("other")
+
+    def test_none_context_maps_to_default(self):
+        assert get_context_limiter(None) is get_context_limiter("default")
+
+    def test_first_caller_sets_limits(self):
+        limiter = get_context_limiter("hub", qps=3, burst=4)
+
+        assert (limiter.qps, limiter.burst) == (3.0, 4)
+        assert get_context_limiter("hub", qps=99, burst=99) is limiter
@@ -0,0 +1,165 @@
+"""Unit tests for lib/rbac_cache.py.
+
+Tests cover credential hashing, the cache key (context, credentials and
+permission matrix), TTL handling, and reuse of verdicts across validator runs.
+"""
+
+import json
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lib.rate_limiter import reset_context_limiters
+from lib.rbac_cache import RBACVerdictCache, credential_hash, role_definitions_hash
+from lib.rbac_validator import RBACValidator, prefetch_permissions
+
+
+def _client(token="Bearer hub-token", cert_file=None, context="hub"):
+    client = MagicMock()
+    client.context = context
+    client.core_v1.api_client.configuration = SimpleNamespace(
+        api_key={"authorization": token} if token else {},
+        cert_file=cert_file,
+        username=None,
+        host="https://api.hub.example.com:6443",
+    )
+    return client
+
+
+@pytest.fixture
+def definitions(tmp_path):
+    directory = tmp_path / "rbac"
+    directory.mkdir()
+    (directory / "role.yaml").write_text("kind: Role\n")
+    return directory
+
+
+@pytest.fixture
+def cache(tmp_path, definitions):
+    return RBACVerdictCache(str(tmp_path / "rbac-cache"), ttl=60, definitions_dir=str(definitions))
+
+
+@pytest.fixture
+def access_reviews():
+    """Patch SelfSubjectAccessReview to grant everything."""
+    reset_context_limiters()
+    with patch("kubernetes.client") as mock_k8s_client:
+        review = mock_k8s_client.AuthorizationV1Api.return_value.create_self_subject_access_review
+        review.return_value.status.allowed = True
+        yield review
+    reset_context_limiters()
+
+
+@pytest.mark.unit
+class TestCredentialHash:
+    """Tests for credential_hash and role_definitions_hash."""
+
+    def test_token_hash_differs_per_token(self):
+        assert credential_hash(_client("Bearer a")) != credential_hash(_client("Bearer b"))
+        assert "Bearer" not in credential_hash(_client("Bearer a"))
+
+    def test_client_certificate_hashed_by_content(self, tmp_path):
+        cert = tmp_path / "client.crt"
+        cert.write_text("cert-one")
+        first = credential_hash(_client(token=None, cert_file=str(cert)))
+        cert.write_text("cert-two")
+
+        assert first is not None
+        assert credential_hash(_client(token=None, cert_file=str(cert))) != first
+
+    def test_unknown_credentials_are_not_cached(self):
+        assert credential_hash(_client(token=None)) is None
+
+    def test_definitions_hash_tracks_file_content(self, definitions):
+        before = role_definitions_hash(str(definitions))
+        (definitions / "role.yaml").write_text("kind: Role\nrules: []\n")
+
+        assert role_definitions_hash(str(definitions)) != before
+        assert role_definitions_hash(None) == role_definitions_hash(str(definitions / "missing"))
+
+
+@pytest.mark.unit
+class TestRBACVerdictCache:
+    """Tests for RBACVerdictCache."""
+
+    def _validator(self, client=None, role="operator"):
+        return RBACValidator(client or _client(), role=role)
+
+    def test_granted_verdicts_round_trip(self, cache):
+        first = self._validator()
+        first.seed_granted_permissions([("", "namespaces", "get", None)])
+        first._verdicts[("", "nodes", "list", None)] = (False, "Forbidden")
+        cache.store(first)
+
+        second = self._validator()
+        assert cache.load(second) == 1
+        assert second.check_permission("", "namespaces", "get") == (True, "")
+        assert ("", "nodes", "list", None) in second.pending_access_reviews()
+
+    def test_other_credentials_and_roles_miss(self, cache):
+        validator = self._validator()
+        validator.seed_granted_permissions([("", "namespaces", "get", None)])
+        cache.store(validator)
+
+        assert cache.load(self._validator(_client("Bearer other"))) == 0
+        assert cache.load(self._validator(_client(context="other"))) == 0
+        assert cache.load(self._validator(role="validator")) == 0
+
+    def test_role_definition_change_invalidates(self, cache, definitions):
+        validator = self._validator()
+        validator.seed_granted_permissions([("", "namespaces", "get", None)])
+        cache.store(validator)
+        (definitions / "role.yaml").write_text("kind: Role\nrules: []\n")
+
+        reloaded = RBACVerdictCache(cache.directory, ttl=60, definitions_dir=str(definitions))
+
+        assert reloaded.load(self._validator()) == 0
+
+    def test_expired_verdicts_are_ignored(self, cache):
+        validator = self._validator()
+        validator.seed_granted_permissions([("", "namespaces", "get", None)])
+        cache.store(validator)
+
+        with patch("lib.rbac_cache.time.time", return_value=time.time() + 61):
+            assert cache.load(self._validator()) == 0
+
+    def test_rewriting_keeps_original_verification_time(self, cache):
+        validator = self._validator()
+        validator.seed_granted_permissions([("", "namespaces", "get", None)])
+        cache.store(validator)
+        (path,) = [os.path.join(cache.directory, name) for name in os.listdir(cache.directory)]
+        with open(path) as f:
+            verified_at = json.load(f)["granted"][0][4]
+
+        reused = self._validator()
+        cache.load(reused)
+        with patch("lib.rbac_cache.time.time", return_value=verified_at + 30):
+            cache.store(reused)
+
+        with open(path) as f:
+            assert json.load(f)["granted"][0][4] == verified_at
+
+    def test_unreadable_entry_is_ignored(self, cache):
+        validator = self._validator()
+        os.makedirs(cache.directory)
+        with open(cache._path(cache.make_key(validator)), "w") as f:
+            f.write("{not json")
+
+        assert cache.load(validator) == 0
+
+    def test_second_prefetch_issues_no_reviews(self, cache, access_reviews):
+        prefetch_permissions([(self._validator(), True, False)], cache=cache)
+        first_run = access_reviews.call_count
+        access_reviews.reset_mock()
+
+        validator = self._validator()
+        issued = prefetch_permissions([(validator, True, False)], cache=cache)
+        all_valid, _ = validator.validate_all_permissions(include_decommission=True)
+
+        assert first_run > 0
+        assert issued == 0
+        access_reviews.assert_not_called()
+        assert all_valid is True
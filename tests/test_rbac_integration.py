@@ -7,12 +7,17 @@
 3. check_rbac.py argument parsing handles all context combinations
 """
 
+import json
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List
+from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
 
+import check_rbac
 from lib.rbac_validator import RBACValidator
 
 
@@ -302,6 +307,57 @@ def test_kustomize_observability_role_has_secrets(self, kustomize_roles):
         assert secrets_rule is not None, "Expected secrets rule in observability operator role"
 
 
+class TestWatchPermissions:
+    """Resources the tool watches must grant ``watch`` wherever ``list`` is granted."""
+
+    WATCHED = {
+        ("cluster.open-cluster-management.io", "managedclusters"),
+        ("cluster.open-cluster-management.io", "restores"),
+        ("velero.io", "backups"),
+        ("velero.io", "restores"),
+        ("", "pods"),
+    }
+
+    @staticmethod
+    def _validator_tables():
+        yield RBACValidator.OPERATOR_CLUSTER_PERMISSIONS
+        yield RBACValidator.VALIDATOR_CLUSTER_PERMISSIONS
+        for table in (
+            RBACValidator.OPERATOR_HUB_NAMESPACE_PERMISSIONS,
+            RBACValidator.VALIDATOR_HUB_NAMESPACE_PERMISSIONS,
+        ):
+            yield from table.values()
+
+    def test_validator_tables_require_watch(self):
+        for permissions in self._validator_tables():
+            for api_group, resource, verbs in permissions:
+                if (api_group, resource) in self.WATCHED and "list" in verbs:
+                    assert "watch" in verbs, f"{api_group}/{resource} lists without watch"
+
+    @pytest.mark.parametrize(
+        "manifest",
+        [
+            "deploy/rbac/clusterrole.yaml",
+            "deploy/rbac/role.yaml",
+            "deploy/helm/acm-switchover-rbac/templates/clusterrole.yaml",
+            "deploy/helm/acm-switchover-rbac/templates/role.yaml",
+        ],
+    )
+    def test_manifests_grant_watch(self, manifest):
+        content = (Path(__file__).parent.parent / manifest).read_text()
+        # Helm templates: drop template directives so the documents parse as YAML
+        content = "\n".join(line for line in content.splitlines() if "{{" not in line)
+        checked = 0
+        for doc in yaml.safe_load_all(content):
+            for rule in (doc or {}).get("rules", []):
+                for api_group in rule.get("apiGroups", []):
+                    for resource in rule.get("resources", []):
+                        if (api_group, resource) in self.WATCHED and "list" in rule.get("verbs", []):
+                            checked += 1
+                            assert "watch" in rule["verbs"], f"{manifest}: {api_group}/{resource} lists without watch"
+        assert checked > 0
+
+
 class TestCheckRBACArgumentParsing:
     """Test check_rbac.py argument parsing handles all context combinations."""
 
@@ -361,6 +417,60 @@ class Args:
         assert context is None, "Expected None when no context specified (uses current context)"
 
 
+class TestCheckRBACFleetMode:
+    """Test check_rbac.py fleet mode context selection and argument checks."""
+
+    @pytest.fixture
+    def kubeconfig(self):
+        index = MagicMock()
+        index.contexts = {"prod-b": {}, "prod-a": {}, "dev-a": {}, "primary-hub": {}}
+        with patch("check_rbac.get_kubeconfig_store") as store, patch("check_rbac.resolve_context_server") as resolve:
+            store.return_value.lookup.return_value = index
+            yield resolve
+
+    def test_pattern_and_list_are_merged_without_duplicates(self, kubeconfig):
+        args = SimpleNamespace(contexts="prod-b, dev-a,", context_pattern="prod-*")
+
+        assert check_rbac.select_fleet_contexts(args) == ["prod-b", "dev-a", "prod-a"]
+        assert [call.args[0] for call in kubeconfig.call_args_list] == ["prod-b", "dev-a"]
+
+    def test_pattern_without_match_is_rejected(self, kubeconfig):
+        with pytest.raises(ValueError, match="No kubeconfig context matches"):
+            check_rbac.select_fleet_contexts(SimpleNamespace(contexts=None, context_pattern="stage-*"))
+
+    def test_unknown_listed_context_is_rejected(self, kubeconfig):
+        kubeconfig.side_effect = ValueError("Context 'missing' not found in kubeconfig")
+
+        with pytest.raises(ValueError, match="not found"):
+            check_rbac.select_fleet_contexts(SimpleNamespace(contexts="missing", context_pattern=None))
+
+    def test_main_prints_json_summary(self, kubeconfig, capsys):
+        summary = {"role": "operator", "contexts": 2, "passed": 1, "failed": 1, "clusters": []}
+        argv = ["check_rbac.py", "--contexts", "prod1,prod2", "--no-rbac-cache", "--concurrency", "5"]
+        with patch.object(sys, "argv", argv), patch(
+            "check_rbac.validate_managed_cluster_fleet", return_value=summary
+        ) as fleet, pytest.raises(SystemExit) as exc_info:
+            check_rbac.main()
+
+        assert exc_info.value.code == 1
+        assert json.loads(capsys.readouterr().out) == summary
+        fleet.assert_called_once_with(["prod1", "prod2"], role="operator", concurrency=5, timeout=60, cache=None)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--contexts", "prod1", "--context", "hub"],
+            ["--context-pattern", "prod-*", "--concurrency", "0"],
+            ["--contexts", "prod1", "--context-timeout", "0"],
+        ],
+    )
+    def test_invalid_fleet_arguments_exit(self, argv):
+        with patch.object(sys, "argv", ["check_rbac.py"] + argv), pytest.raises(SystemExit) as exc_info:
+            check_rbac.parse_args()
+
+        assert exc_info.value.code == 2
+
+
 class TestRBACValidatorPermissionStructure:
     """Test the structure and format of RBAC permissions."""
 
@@ -2,12 +2,22 @@
 Unit tests for RBAC validator module.
 """
 
+import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from lib.exceptions import ValidationError
-from lib.rbac_validator import RBACValidator, validate_rbac_permissions
+from lib.rate_limiter import reset_context_limiters
+from lib.rbac_validator import (
+    RBACValidator,
+    prefetch_permissions,
+    rule_allows,
+    validate_managed_cluster_fleet,
+    validate_rbac_permissions,
+)
 
 
 class TestRBACValidator:
@@ -241,6 +251,311 @@ def test_validate_managed_cluster_permissions_validator_role(self, mock_client):
         assert "get" in verbs_checked
 
 
+def _resource_rule(verbs, api_groups, resources, resource_names=None):
+    """Build a V1ResourceRule-like mock."""
+    return MagicMock(verbs=verbs, api_groups=api_groups, resources=resources, resource_names=resource_names)
+
+
+class TestRulesReview:
+    """Test cases for SelfSubjectRulesReview-based namespace validation."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock KubeClient."""
+        client = MagicMock()
+        client.context = "test-context"
+        client.namespace_exists = MagicMock(return_value=True)
+        return client
+
+    @pytest.fixture
+    def mock_auth_api(self):
+        """Patch the authorization API used for rules and access reviews."""
+        with patch("kubernetes.client") as mock_k8s_client:
+            yield mock_k8s_client.AuthorizationV1Api.return_value
+
+    @pytest.mark.parametrize(
+        "rule,request_args,expected",
+        [
+            ({"verbs": ["get"], "apiGroups": [""], "resources": ["pods"]}, ("", "pods", "get"), True),
+            ({"verbs": ["get"], "apiGroups": [""], "resources": ["pods"]}, ("", "pods", "list"), False),
+            ({"verbs": ["*"], "apiGroups": ["*"], "resources": ["*"]}, ("apps", "statefulsets/scale", "patch"), True),
+            (
+                {"verbs": ["get"], "apiGroups": ["apps"], "resources": ["*/scale"]},
+                ("apps", "statefulsets/scale", "get"),
+                True,
+            ),
+            (
+                {"verbs": ["get"], "apiGroups": ["apps"], "resources": ["statefulsets"]},
+                ("apps", "statefulsets/scale", "get"),
+                False,
+            ),
+            ({"verbs": ["get"], "apiGroups": ["velero.io"], "resources": ["backups"]}, ("", "backups", "get"), False),
+            (
+                {"verbs": ["get"], "apiGroups": [""], "resources": ["secrets"], "resourceNames": ["thanos"]},
+                ("", "secrets", "get"),
+                False,
+            ),
+        ],
+    )
+    def test_rule_allows(self, rule, request_args, expected):
+        """Rules follow RBAC wildcard, subresource and resourceNames semantics."""
+        assert rule_allows(rule, *request_args) is expected
+
+    def test_namespace_permissions_use_one_rules_review_per_namespace(self, mock_client, mock_auth_api):
+        """All namespaced checks are answered locally from a single review per namespace."""
+        mock_auth_api.create_self_subject_rules_review.return_value.status = MagicMock(
+            resource_rules=[_resource_rule(["*"], ["*"], ["*"])], incomplete=False
+        )
+        validator = RBACValidator(mock_client, use_rules_review=True)
+
+        all_valid, errors = validator.validate_namespace_permissions()
+        validator.validate_namespace_permissions()
+
+        assert all_valid is True
+        assert errors == []
+        assert mock_auth_api.create_self_subject_rules_review.call_count == len(
+            RBACValidator.OPERATOR_HUB_NAMESPACE_PERMISSIONS
+        )
+        mock_auth_api.create_self_subject_access_review.assert_not_called()
+
+    def test_complete_rules_deny_without_access_review(self, mock_client, mock_auth_api):
+        """A permission missing from a complete rule set is reported without an SSAR."""
+        mock_auth_api.create_self_subject_rules_review.return_value.status = MagicMock(
+            resource_rules=[_resource_rule(["get", "list"], ["", "apps", "route.openshift.io"], ["*"])],
+            incomplete=False,
+        )
+        validator = RBACValidator(mock_client, role="validator", use_rules_review=True)
+
+        all_valid, errors = validator.validate_namespace_permissions()
+
+        assert all_valid is False
+        assert any("get cluster.open-cluster-management.io/backupschedules" in error for error in errors)
+        mock_auth_api.create_self_subject_access_review.assert_not_called()
+
+    def test_incomplete_rules_confirm_denials_with_access_review(self, mock_client, mock_auth_api):
+        """Denials in an incomplete rule set fall back to SelfSubjectAccessReview."""
+        mock_auth_api.create_self_subject_rules_review.return_value.status = MagicMock(
+            resource_rules=[_resource_rule(["get"], [""], ["secrets", "pods"])], incomplete=True
+        )
+        mock_auth_api.create_self_subject_access_review.return_value.status.allowed = True
+        validator = RBACValidator(mock_client, role="validator", use_rules_review=True)
+
+        all_valid, _ = validator.validate_managed_cluster_permissions()
+
+        assert all_valid is True
+        # secrets/get is granted by the rules; only apps/deployments/get needs an SSAR
+        assert mock_auth_api.create_self_subject_access_review.call_count == 1
+
+    def test_failed_rules_review_falls_back_to_access_reviews(self, mock_client, mock_auth_api):
+        """A failed rules review degrades to per-permission SelfSubjectAccessReviews."""
+        mock_auth_api.create_self_subject_rules_review.side_effect = Exception("forbidden")
+        validator = RBACValidator(mock_client, role="validator", use_rules_review=True)
+        validator.check_permission = MagicMock(return_value=(True, ""))
+
+        all_valid, _ = validator.validate_managed_cluster_permissions()
+
+        assert all_valid is True
+        assert validator.check_permission.call_count == 2
+
+    def test_cluster_permissions_still_use_access_reviews(self, mock_client, mock_auth_api):
+        """Cluster-scoped permissions are never evaluated from namespace rules."""
+        validator = RBACValidator(mock_client, use_rules_review=True)
+        validator.check_permission = MagicMock(return_value=(True, ""))
+
+        validator.validate_cluster_permissions()
+
+        mock_auth_api.create_self_subject_rules_review.assert_not_called()
+        assert validator.check_permission.call_count > 0
+
+
+class TestPrefetchPermissions:
+    """Test cases for concurrent access review evaluation."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock KubeClient."""
+        client = MagicMock()
+        client.context = "test-context"
+        client.namespace_exists = MagicMock(return_value=True)
+        return client
+
+    @pytest.fixture
+    def access_reviews(self):
+        """Patch SelfSubjectAccessReview so each request's attributes reach the review mock."""
+        review = MagicMock()
+
+        def _review(body):
+            denied = body["resource"] == "managedclusters" and body["verb"] == "delete"
+            return MagicMock(status=MagicMock(allowed=not denied, reason="Forbidden" if denied else None))
+
+        review.side_effect = _review
+        # Fresh per-context limiters so earlier tests' requests don't throttle this one
+        reset_context_limiters()
+        with patch("kubernetes.client") as mock_k8s_client:
+            mock_k8s_client.V1ResourceAttributes.side_effect = lambda **attrs: attrs
+            mock_k8s_client.V1SelfSubjectAccessReviewSpec.side_effect = lambda resource_attributes: resource_attributes
+            mock_k8s_client.V1SelfSubjectAccessReview.side_effect = lambda spec: spec
+            mock_k8s_client.AuthorizationV1Api.return_value.create_self_subject_access_review = review
+            yield review
+        reset_context_limiters()
+
+    def test_validation_after_prefetch_issues_no_reviews(self, mock_client, access_reviews):
+        """Every review is issued once by the prefetch; validation and the report reuse the verdicts."""
+        validator = RBACValidator(mock_client)
+
+        issued = prefetch_permissions([(validator, True, False)])
+        all_valid, errors = validator.validate_all_permissions(include_decommission=True)
+        validator.generate_permission_report(include_decommission=True)
+
+        assert issued == access_reviews.call_count
+        assert all_valid is False
+        assert errors["cluster"] == [
+            "Missing decommission permission: delete cluster.open-cluster-management.io/managedclusters - Forbidden"
+        ]
+        assert validator.pending_access_reviews(include_decommission=True) == []
+
+    def test_prefetched_report_matches_serial_report(self, mock_client, access_reviews):
+        """The concurrent engine assembles the same report as serial validation."""
+        serial = RBACValidator(mock_client).generate_permission_report(include_decommission=True)
+        serial_calls = access_reviews.call_count
+        access_reviews.reset_mock()
+
+        validator = RBACValidator(mock_client)
+        prefetch_permissions([(validator, True, False)], max_workers=8)
+
+        assert validator.generate_permission_report(include_decommission=True) == serial
+        assert access_reviews.call_count == serial_calls
+
+    def test_reviews_for_both_hubs_share_one_bounded_pool(self, mock_client, access_reviews):
+        """Reviews of several validators run concurrently, up to max_workers at a time."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        review = access_reviews.side_effect
+
+        def _slow_review(body):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return review(body)
+
+        access_reviews.side_effect = _slow_review
+        validators = [RBACValidator(mock_client), RBACValidator(mock_client)]
+        expected = sum(len(v.pending_access_reviews(skip_observability=True)) for v in validators)
+
+        issued = prefetch_permissions([(v, False, True) for v in validators], max_workers=4)
+
+        assert issued == access_reviews.call_count == expected
+        assert 1 < max(peak) <= 4
+
+    def test_pending_reviews_skip_rules_decisions_and_known_verdicts(self, mock_client, access_reviews):
+        """Checks answered by rules or earlier verdicts are not reviewed again."""
+        validator = RBACValidator(mock_client, role="validator", use_rules_review=True)
+        validator._namespace_rules = {
+            namespace: ([{"verbs": ["*"], "apiGroups": ["*"], "resources": ["*"]}], False)
+            for namespace in validator.VALIDATOR_HUB_NAMESPACE_PERMISSIONS
+        }
+        validator.check_permission("", "namespaces", "get")
+
+        pending = validator.pending_access_reviews()
+
+        assert all(namespace is None for _, _, _, namespace in pending)
+        assert ("", "namespaces", "get", None) not in pending
+        assert len(pending) == len(set(pending))
+
+
+class TestManagedClusterFleet:
+    """Test cases for validate_managed_cluster_fleet."""
+
+    @pytest.fixture
+    def kube_clients(self):
+        """Patch KubeClient so each context gets a mock client; 'broken' fails to load."""
+
+        def _client(context):
+            if context == "broken":
+                raise ValueError("Invalid kube-config file")
+            client = MagicMock()
+            client.context = context
+            return client
+
+        with patch("lib.rbac_validator.KubeClient", side_effect=_client) as factory:
+            yield factory
+
+    def _validate(self, outcomes):
+        """Make validate_managed_cluster_permissions return or sleep per context."""
+
+        def _validate(validator):
+            outcome = outcomes[validator.client.context]
+            if isinstance(outcome, float):
+                time.sleep(outcome)
+                return True, []
+            return outcome
+
+        return patch.object(RBACValidator, "validate_managed_cluster_permissions", autospec=True, side_effect=_validate)
+
+    def test_summary_reports_each_context(self, kube_clients):
+        """Results keep input order; failures, errors and timeouts don't stop other contexts."""
+        outcomes = {
+            "prod1": (True, []),
+            "prod2": (False, ["Missing permission in open-cluster-management-agent: get core/secrets"]),
+            "slow": 1.0,
+        }
+        with self._validate(outcomes):
+            summary = validate_managed_cluster_fleet(["prod1", "prod2", "broken", "slow"], timeout=0.2)
+
+        assert [entry["context"] for entry in summary["clusters"]] == ["prod1", "prod2", "broken", "slow"]
+        assert [entry["status"] for entry in summary["clusters"]] == ["passed", "failed", "error", "timeout"]
+        assert summary["clusters"][1]["errors"] == outcomes["prod2"][1]
+        assert "Invalid kube-config file" in summary["clusters"][2]["errors"][0]
+        assert summary["clusters"][3]["seconds"] == 0.2
+        counts = {key: summary[key] for key in ("contexts", "passed", "failed", "error", "timeout")}
+        assert counts == {"contexts": 4, "passed": 1, "failed": 1, "error": 1, "timeout": 1}
+        assert all(entry["seconds"] >= 0 for entry in summary["clusters"])
+        json.dumps(summary)
+
+    def test_concurrency_is_bounded(self, kube_clients):
+        """No more than ``concurrency`` contexts are validated at once."""
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+
+        def _validate(validator):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return True, []
+
+        contexts = [f"spoke-{i}" for i in range(8)]
+        with patch.object(RBACValidator, "validate_managed_cluster_permissions", autospec=True, side_effect=_validate):
+            summary = validate_managed_cluster_fleet(contexts, concurrency=2)
+
+        assert summary["passed"] == 8
+        assert in_flight[1] == 2
+
+    def test_validators_use_rules_review_and_role(self, kube_clients):
+        """Each context gets its own rules-review validator for the requested role."""
+        seen = []
+
+        def _validate(validator):
+            seen.append((validator.client.context, validator.role, validator.use_rules_review))
+            return True, []
+
+        with patch.object(RBACValidator, "validate_managed_cluster_permissions", autospec=True, side_effect=_validate):
+            validate_managed_cluster_fleet(["prod1", "prod2"], role="validator")
+
+        assert sorted(seen) == [("prod1", "validator", True), ("prod2", "validator", True)]
+
+    def test_invalid_role_rejected(self):
+        """An unknown role fails before any cluster is contacted."""
+        with pytest.raises(ValueError, match="Invalid role"):
+            validate_managed_cluster_fleet(["prod1"], role="admin")
+
+
 class TestValidateRBACPermissions:
     """Test cases for validate_rbac_permissions function."""
 
@@ -301,18 +616,12 @@ def test_validate_secondary_failure(self, mock_validator_class, mock_primary_cli
         """Test validate_rbac_permissions when secondary validation fails."""
 
         # Primary succeeds, secondary fails
-        def mock_validate(include_decommission=False, skip_observability=False):
-            if mock_validator_class.call_count == 1:
-                # Primary validation
-                return (True, {})
-            else:
-                # Secondary validation
-                return (False, {"cluster": ["Missing permission"]})
-
-        mock_validator = MagicMock()
-        mock_validator.validate_all_permissions.side_effect = mock_validate
-        mock_validator.generate_permission_report.return_value = "Error report"
-        mock_validator_class.return_value = mock_validator
+        primary_validator = MagicMock()
+        primary_validator.validate_all_permissions.return_value = (True, {})
+        secondary_validator = MagicMock()
+        secondary_validator.validate_all_permissions.return_value = (False, {"cluster": ["Missing permission"]})
+        secondary_validator.generate_permission_report.return_value = "Error report"
+        mock_validator_class.side_effect = [primary_validator, secondary_validator]
 
         with pytest.raises(ValidationError) as exc_info:
             validate_rbac_permissions(mock_primary_client, mock_secondary_client)
@@ -11,7 +11,14 @@
 from urllib3.exceptions import HTTPError, MaxRetryError, NewConnectionError
 from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
 
-from lib.kube_client import KubeClient, is_retryable_error
+from lib.constants import RETRY_AFTER_MAX_SECONDS
+from lib.kube_client import (
+    KubeClient,
+    is_apf_rejection,
+    is_retryable_error,
+    retry_after_seconds,
+)
+from lib.rate_limiter import reset_context_limiters
 
 
 @pytest.fixture
@@ -126,3 +133,85 @@ def test_404_returns_none_without_retry(kube_client):
 
     # Verify no retries (1 call total)
     assert mock_api.call_count == 1
+
+
+@pytest.fixture
+def isolated_limiters():
+    """Give each test fresh per-context limiters so pauses don't leak between tests."""
+    reset_context_limiters()
+    yield
+    reset_context_limiters()
+
+
+def _throttled(retry_after=None, apf=False):
+    """Build a 429 ApiException with optional Retry-After and APF headers."""
+    exc = ApiException(status=429, reason="Too Many Requests")
+    headers = {}
+    if retry_after is not None:
+        headers["Retry-After"] = retry_after
+    if apf:
+        headers["X-Kubernetes-PF-PriorityLevel-UID"] = "uid-1"
+    exc.headers = headers
+    return exc
+
+
+def test_retry_after_seconds_parsing():
+    """Retry-After is read case-insensitively, capped, and ignored when invalid."""
+    exc = _throttled()
+    exc.headers = {"retry-after": "3"}
+    assert retry_after_seconds(exc) == 3
+    assert retry_after_seconds(_throttled("100000")) == RETRY_AFTER_MAX_SECONDS
+    assert retry_after_seconds(_throttled("soon")) is None
+    assert retry_after_seconds(_throttled()) is None
+    assert retry_after_seconds(ApiException(status=500)) is None
+
+
+def test_is_apf_rejection():
+    """APF rejections are identified by their flow-control response headers."""
+    assert is_apf_rejection(_throttled("1", apf=True))
+    assert not is_apf_rejection(_throttled("1"))
+    assert not is_apf_rejection(ApiException(status=503))
+
+
+def test_retry_honors_retry_after(kube_client, isolated_limiters):
+    """A 429 with Retry-After waits the server-requested delay instead of exponential backoff."""
+    mock_api = kube_client.core_v1.read_namespace
+    mock_api.side_effect = [
+        _throttled("7", apf=True),
+        MagicMock(to_dict=lambda: {"metadata": {"name": "test"}}),
+    ]
+
+    with patch.object(KubeClient.get_namespace.retry, "sleep") as mock_sleep, patch.object(
+        kube_client._rate_limiter, "pause"
+    ) as mock_pause:
+        result = kube_client.get_namespace("test")
+
+    assert result["metadata"]["name"] == "test"
+    mock_sleep.assert_called_once_with(7.0)
+    mock_pause.assert_called_once_with(7.0)
+
+
+def test_clients_share_limiter_per_context(isolated_limiters):
+    """KubeClients for the same context draw from a single token bucket."""
+    with patch("kubernetes.config.load_kube_config"), patch("kubernetes.client.CoreV1Api"), patch(
+        "kubernetes.client.AppsV1Api"
+    ), patch("kubernetes.client.CustomObjectsApi"):
+        first = KubeClient(context="hub-a")
+        second = KubeClient(context="hub-a")
+        other = KubeClient(context="hub-b")
+
+    assert first._rate_limiter is second._rate_limiter
+    assert first._rate_limiter is not other._rate_limiter
+
+
+def test_each_attempt_takes_a_token(kube_client, isolated_limiters):
+    """Retries pass through the limiter too, so retry storms are throttled."""
+    mock_api = kube_client.core_v1.read_namespace
+    mock_api.side_effect = [ApiException(status=503), MagicMock(to_dict=lambda: {"metadata": {}})]
+
+    with patch.object(KubeClient.get_namespace.retry, "sleep"), patch.object(
+        kube_client._rate_limiter, "acquire", return_value=True
+    ) as mock_acquire:
+        kube_client.get_namespace("test")
+
+    assert mock_acquire.call_count == 2
@@ -79,6 +79,19 @@ def test_load_state_success_and_errors(self, tmp_path: Path, capsys):
         assert "Error: State file not found" in captured
         assert "Error: Invalid JSON in state file" in captured
 
+    def test_load_state_includes_unfolded_journal_records(self, tmp_path: Path):
+        state_file = tmp_path / "switchover-a__b.json"
+        state_file.write_text(json.dumps({"current_phase": "init", "completed_steps": []}), encoding="utf-8")
+        (tmp_path / "switchover-a__b.json.journal").write_text(
+            '{"seq":1,"ts":"2026-01-01T00:00:00+00:00","op":"phase","value":"preflight_validation"}\n',
+            encoding="utf-8",
+        )
+
+        state = load_state(str(state_file))
+
+        assert state["current_phase"] == "preflight_validation"
+        assert state["last_updated"] == "2026-01-01T00:00:00+00:00"
+
 
 @pytest.mark.unit
 class TestShowStateMain:
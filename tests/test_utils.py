@@ -4,7 +4,11 @@
 Tests cover StateManager, Phase enum, version comparison, and logging setup.
 """
 
+import json
 import os
+import signal
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +17,7 @@
     Phase,
     StateManager,
     StepContext,
+    StepProgress,
     dry_run_skip,
     is_acm_version_ge,
     setup_logging,
@@ -383,6 +388,333 @@ def test_get_state_age_malformed_timestamp(self, mock_logging, tmp_path):
         assert "Could not parse state timestamp" in call_args[0]
 
 
+@pytest.mark.unit
+class TestCompletedStepIndex:
+    """Test cases for the StateManager completed-step index."""
+
+    def test_bulk_queries(self, state_manager):
+        state_manager.mark_step_completed("a")
+        state_manager.mark_step_completed("c")
+
+        assert state_manager.are_steps_completed(["a", "b", "c"]) == {"a": True, "b": False, "c": True}
+        assert state_manager.pending_steps(["c", "b", "d", "a"]) == ["b", "d"]
+        assert state_manager.get_completed_step("a")["name"] == "a"
+        assert state_manager.get_completed_step("b") is None
+
+    def test_index_rebuilt_on_load_and_reset(self, state_manager, temp_state_file):
+        state_manager.mark_step_completed("step1")
+
+        reloaded = StateManager(str(temp_state_file))
+        assert reloaded.is_step_completed("step1")
+
+        reloaded.reset()
+        assert not reloaded.is_step_completed("step1")
+
+    def test_index_follows_state_replacement(self, state_manager):
+        state_manager.state = {"completed_steps": [{"name": "x", "timestamp": "t1"}, {"name": "x", "timestamp": "t2"}]}
+
+        assert state_manager.is_step_completed("x")
+        assert state_manager.get_completed_step("x")["timestamp"] == "t1"
+
+    def test_journal_mode_updates_index(self, temp_state_file):
+        sm = StateManager(str(temp_state_file), journal=True)
+        sm.mark_step_completed("step1")
+        sm.mark_step_completed("step1")
+
+        assert sm.is_step_completed("step1")
+        assert len(sm.state["completed_steps"]) == 1
+        assert StateManager(str(temp_state_file)).is_step_completed("step1")
+
+
+@pytest.mark.unit
+class TestStepProgress:
+    """Test cases for per-item progress of bulk steps."""
+
+    def test_progress_is_flushed_in_batches(self, state_manager, temp_state_file):
+        progress = StepProgress(state_manager, "bulk", flush_every=2)
+
+        progress.add("c")
+        assert "bulk" not in json.loads(temp_state_file.read_text()).get("step_progress", {})
+
+        progress.add("a")
+        assert json.loads(temp_state_file.read_text())["step_progress"]["bulk"] == ["a", "c"]
+
+        with progress:
+            progress.add("b")
+        assert StateManager(str(temp_state_file)).step_progress("bulk").done == {"a", "b", "c"}
+
+    def test_progress_dropped_when_step_completes(self, state_manager):
+        state_manager.record_step_progress("bulk", ["x"])
+
+        state_manager.mark_step_completed("bulk")
+
+        assert len(state_manager.step_progress("bulk")) == 0
+        assert "bulk" not in state_manager.state["step_progress"]
+
+    def test_concurrent_adds_are_all_recorded(self, state_manager):
+        progress = state_manager.step_progress("bulk")
+
+        def worker(n):
+            for i in range(100):
+                progress.add(f"c{n}-{i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        progress.flush()
+
+        assert len(state_manager.state["step_progress"]["bulk"]) == 400
+
+    def test_journal_mode_records_and_replays_progress(self, temp_state_file):
+        sm = StateManager(str(temp_state_file), journal=True)
+        with sm.step_progress("bulk") as progress:
+            progress.add("a")
+            progress.add("b")
+
+        records = [json.loads(line) for line in open(sm.journal_file)]
+        assert [r["op"] for r in records] == ["progress"]
+        assert StateManager(str(temp_state_file)).step_progress("bulk").done == {"a", "b"}
+
+    def test_tracker_without_state_manager_is_in_memory(self):
+        progress = StepProgress(None, "bulk", flush_every=1)
+        progress.add("a")
+
+        assert "a" in progress
+
+
+@pytest.mark.unit
+class TestBackgroundStateWriter:
+    """Test cases for the coalescing background state writer."""
+
+    def _read(self, path):
+        return json.loads(path.read_text())
+
+    def test_updates_within_window_coalesce_into_one_write(self, temp_state_file):
+        sm = StateManager(str(temp_state_file), flush_interval=0.2)
+
+        with patch.object(sm, "_write_state", wraps=sm._write_state) as mock_write:
+            for i in range(50):
+                sm.set_config(f"key{i}", i)
+            assert mock_write.call_count == 0
+            sm.close()
+
+        assert mock_write.call_count == 1
+        assert len(self._read(temp_state_file)["config"]) == 50
+
+    def test_writer_flushes_after_window(self, temp_state_file):
+        sm = StateManager(str(temp_state_file), flush_interval=0.05)
+        sm.mark_step_completed("step1")
+
+        deadline = time.monotonic() + 5
+        while not self._read(temp_state_file)["completed_steps"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert self._read(temp_state_file)["completed_steps"][0]["name"] == "step1"
+        sm.close()
+
+    def test_critical_checkpoints_write_synchronously(self, temp_state_file):
+        sm = StateManager(str(temp_state_file), flush_interval=60)
+        sm.set_config("pending", True)
+
+        sm.set_phase(Phase.PRIMARY_PREP)
+
+        on_disk = self._read(temp_state_file)
+        assert on_disk["current_phase"] == Phase.PRIMARY_PREP.value
+        assert on_disk["config"]["pending"] is True
+
+        sm.add_error("boom")
+        assert self._read(temp_state_file)["errors"][0]["error"] == "boom"
+        sm.close()
+
+    def test_exit_handler_flushes_pending_updates(self, temp_state_file):
+        sm = StateManager(str(temp_state_file), flush_interval=60)
+        sm.set_config("pending", True)
+
+        sm._flush_on_exit()
+
+        assert self._read(temp_state_file)["config"]["pending"] is True
+
+    def test_signal_handler_flushes_pending_updates(self, temp_state_file):
+        sm = StateManager(str(temp_state_file), flush_interval=60)
+        sm.set_config("pending", True)
+
+        with patch.object(sm, "_forward_signal") as mock_forward:
+            sm._flush_on_signal(signal.SIGTERM, None)
+
+        assert self._read(temp_state_file)["config"]["pending"] is True
+        mock_forward.assert_called_once()
+        sm.close()
+
+    def test_signal_handler_does_not_block_on_busy_writer(self, temp_state_file):
+        """The interrupted thread holds _journal_lock while the writer holds _write_lock and waits for it."""
+        sm = StateManager(str(temp_state_file), journal=True, flush_interval=60)
+        sm.set_config("pending", True)
+        sm._dirty = True
+        writer_waiting = threading.Event()
+
+        def busy_writer():
+            with sm._write_lock:
+                writer_waiting.set()
+                if sm._journal_lock.acquire(timeout=5):  # Gives up so a regression fails instead of hanging
+                    sm._journal_lock.release()
+
+        def interrupted_append():
+            with sm._journal_lock:
+                writer.start()
+                writer_waiting.wait(5)
+                with patch.object(sm, "_forward_signal") as mock_forward:
+                    sm._flush_on_signal(signal.SIGTERM, None)
+                mock_forward.assert_called_once()
+
+        writer = threading.Thread(target=busy_writer, daemon=True)
+        interrupted = threading.Thread(target=interrupted_append, daemon=True)
+        interrupted.start()
+        interrupted.join(5)
+
+        assert not interrupted.is_alive()
+        writer.join(5)
+        assert self._read(temp_state_file)["config"]["pending"] is True
+        assert os.path.exists(sm.journal_file)  # Not discarded without the locks
+        sm.close()
+
+
+@pytest.mark.unit
+class TestStateJournal:
+    """Test cases for StateManager journal mode."""
+
+    @pytest.fixture
+    def journaled(self, temp_state_file):
+        return StateManager(str(temp_state_file), journal=True)
+
+    def test_updates_append_records_without_rewriting_snapshot(self, journaled, temp_state_file):
+        snapshot = temp_state_file.read_text()
+
+        journaled.mark_step_completed("step1")
+        journaled.set_config("key", {"nested": [1, 2]})
+        journaled.set_phase(Phase.PREFLIGHT)
+        journaled.add_error("boom")
+
+        assert temp_state_file.read_text() == snapshot
+        records = [json.loads(line) for line in open(journaled.journal_file)]
+        assert [r["op"] for r in records] == ["step", "config", "phase", "error"]
+        assert [r["seq"] for r in records] == [1, 2, 3, 4]
+
+    def test_reload_replays_journal_and_compacts(self, journaled, temp_state_file):
+        journaled.mark_step_completed("step1")
+        journaled.set_config("key", "value")
+        journaled.set_phase(Phase.ACTIVATION)
+        journaled.add_error("boom")
+
+        reloaded = StateManager(str(temp_state_file))
+
+        assert reloaded.is_step_completed("step1")
+        assert reloaded.get_config("key") == "value"
+        assert reloaded.get_current_phase() == Phase.ACTIVATION
+        assert reloaded.get_errors()[0]["phase"] == Phase.ACTIVATION.value
+        assert not os.path.exists(reloaded.journal_file)
+        assert json.loads(temp_state_file.read_text())["config"] == {"key": "value"}
+
+    def test_torn_last_record_is_ignored(self, journaled, temp_state_file):
+        journaled.set_config("kept", 1)
+        with open(journaled.journal_file, "a") as f:
+            f.write('{"seq": 2, "op": "config", "key": "lost"')
+
+        reloaded = StateManager(str(temp_state_file), journal=True)
+
+        assert reloaded.get_config("kept") == 1
+        assert reloaded.get_config("lost") is None
+
+    def test_records_already_in_snapshot_are_not_reapplied(self, journaled, temp_state_file):
+        journaled.add_error("once")
+        with open(journaled.journal_file) as f:
+            journal = f.read()
+        journaled.flush_state()
+        # Simulate a crash between writing the snapshot and removing the journal
+        with open(journaled.journal_file, "w") as f:
+            f.write(journal)
+
+        reloaded = StateManager(str(temp_state_file))
+
+        assert len(reloaded.get_errors()) == 1
+
+    def test_compacts_after_record_threshold(self, journaled, temp_state_file):
+        with patch("lib.utils.STATE_JOURNAL_COMPACT_RECORDS", 3):
+            for i in range(3):
+                journaled.mark_step_completed(f"step{i}")
+
+        assert not os.path.exists(journaled.journal_file)
+        snapshot = json.loads(temp_state_file.read_text())
+        assert [s["name"] for s in snapshot["completed_steps"]] == ["step0", "step1", "step2"]
+        assert snapshot["journal_seq"] == 3
+
+        journaled.mark_step_completed("step3")
+        assert json.loads(open(journaled.journal_file).readline())["seq"] == 4
+
+    def test_only_critical_records_are_fsynced(self, journaled):
+        with patch("lib.utils.os.fsync") as mock_fsync:
+            journaled.mark_step_completed("step1")
+            journaled.set_config("key", "value")
+            assert mock_fsync.call_count == 0
+
+            journaled.set_phase(Phase.PREFLIGHT)
+            journaled.add_error("boom")
+            assert mock_fsync.call_count == 2
+
+    def test_reset_discards_journal(self, journaled):
+        journaled.mark_step_completed("step1")
+
+        journaled.reset()
+
+        assert not os.path.exists(journaled.journal_file)
+        assert not journaled.is_step_completed("step1")
+
+    def test_concurrent_appends_and_flushes_keep_every_record(self, temp_state_file):
+        """--state-journal with --state-flush-interval: workers append while flushes discard the journal."""
+        sm = StateManager(str(temp_state_file), journal=True, flush_interval=0.01)
+        errors = []
+        stop = threading.Event()
+        real_fsync = os.fsync
+
+        def slow_fsync(fd):
+            if threading.current_thread() is not flusher:
+                time.sleep(0.002)  # Widen the window between writing a record and syncing it
+            real_fsync(fd)
+
+        def append(worker):
+            try:
+                for i in range(20):
+                    sm.set_config(f"w{worker}-{i}", i)
+                    sm.add_error(f"w{worker}-{i}")
+            except Exception as e:  # pragma: no cover - only reached on a regression
+                errors.append(e)
+
+        def flush():
+            try:
+                while not stop.is_set():
+                    sm.flush_state()
+            except Exception as e:  # pragma: no cover - only reached on a regression
+                errors.append(e)
+
+        flusher = threading.Thread(target=flush)
+        with patch("lib.utils.STATE_JOURNAL_COMPACT_RECORDS", 7), patch("lib.utils.os.fsync", slow_fsync):
+            flusher.start()
+            workers = [threading.Thread(target=append, args=(w,)) for w in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            stop.set()
+            flusher.join()
+            sm.close()
+
+        assert errors == []
+        reloaded = StateManager(str(temp_state_file), journal=True)
+        assert len(reloaded.state["config"]) == 80
+        assert len(reloaded.get_errors()) == 80
+
+
 @pytest.mark.unit
 class TestPhaseEnum:
     """Test cases for Phase enum."""
@@ -200,6 +200,44 @@ def test_disable_observability_requires_secondary_action(self):
         with pytest.raises(ValidationError):
             InputValidator.validate_all_cli_args(args)
 
+    def test_klusterlet_concurrency_must_be_positive(self):
+        """--klusterlet-concurrency rejects zero and negative values."""
+        args = MockArgs(
+            primary_context="primary-hub",
+            secondary_context="secondary-hub",
+            method="passive",
+            old_hub_action="secondary",
+            klusterlet_concurrency=0,
+            decommission=False,
+        )
+
+        with pytest.raises(ValidationError, match="klusterlet-concurrency"):
+            InputValidator.validate_all_cli_args(args)
+
+        args.klusterlet_concurrency = 250
+        InputValidator.validate_all_cli_args(args)
+
+    def test_state_flush_interval_must_be_non_negative(self):
+        """--state-flush-interval rejects negative and non-finite values."""
+        args = MockArgs(
+            primary_context="primary-hub",
+            secondary_context="secondary-hub",
+            method="passive",
+            old_hub_action="secondary",
+            state_flush_interval=-1.0,
+            decommission=False,
+        )
+
+        with pytest.raises(ValidationError, match="state-flush-interval"):
+            InputValidator.validate_all_cli_args(args)
+
+        args.state_flush_interval = float("inf")
+        with pytest.raises(ValidationError, match="state-flush-interval"):
+            InputValidator.validate_all_cli_args(args)
+
+        args.state_flush_interval = 0.5
+        InputValidator.validate_all_cli_args(args)
+
 
 class TestKubernetesResourceValidation:
     """Test Kubernetes resource name validation."""
@@ -7,8 +7,9 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from kubernetes.client.rest import ApiException
 
-from lib.waiter import wait_for_condition
+from lib.waiter import WATCH_MAX_FAILURES, wait_for_condition
 
 
 @pytest.fixture
@@ -117,3 +118,87 @@ def test_wait_timeout_no_last_chance(self, mock_time, mock_logger):
         )
 
         assert result is False
+
+
+@pytest.mark.unit
+class TestWaitForConditionWatch:
+    """Tests for the watch-driven mode of wait_for_condition."""
+
+    @patch("lib.waiter.time")
+    def test_event_triggers_reevaluation_without_sleep(self, mock_time, mock_logger):
+        """Test condition is re-evaluated on a watch event instead of sleeping."""
+        mock_time.time.return_value = 0
+        mock_time.monotonic.return_value = 0
+        condition = Mock(side_effect=[(False, "waiting"), (True, "done")])
+        watch_fn = Mock(return_value=iter([{"type": "MODIFIED"}]))
+
+        result = wait_for_condition(
+            description="test watch",
+            condition_fn=condition,
+            interval=30,
+            watch_fn=watch_fn,
+            logger=mock_logger,
+        )
+
+        assert result is True
+        assert condition.call_count == 2
+        watch_fn.assert_called_once_with(30)
+        mock_time.sleep.assert_not_called()
+
+    @patch("lib.waiter.time")
+    def test_watch_error_falls_back_to_polling(self, mock_time, mock_logger):
+        """Test watch failures (e.g. 410 Gone) fall back to a poll sleep."""
+        mock_time.time.return_value = 0
+        mock_time.monotonic.return_value = 0
+        condition = Mock(side_effect=[(False, "waiting"), (True, "done")])
+        watch_fn = Mock(side_effect=ApiException(status=410))
+
+        result = wait_for_condition(
+            description="test gone",
+            condition_fn=condition,
+            interval=5,
+            watch_fn=watch_fn,
+            logger=mock_logger,
+        )
+
+        assert result is True
+        mock_time.sleep.assert_called_once_with(5)
+
+    @patch("lib.waiter.time")
+    def test_repeated_watch_failures_switch_to_polling(self, mock_time, mock_logger):
+        """Test the watch is abandoned after WATCH_MAX_FAILURES consecutive failures."""
+        mock_time.time.return_value = 0
+        mock_time.monotonic.return_value = 0
+        condition = Mock(side_effect=[(False, "waiting")] * (WATCH_MAX_FAILURES + 2) + [(True, "done")])
+        watch_fn = Mock(side_effect=ConnectionError("refused"))
+
+        result = wait_for_condition(
+            description="test fallback",
+            condition_fn=condition,
+            interval=5,
+            watch_fn=watch_fn,
+            logger=mock_logger,
+        )
+
+        assert result is True
+        assert watch_fn.call_count == WATCH_MAX_FAILURES
+        assert mock_time.sleep.call_count == WATCH_MAX_FAILURES + 2
+
+    @patch("lib.waiter.time")
+    def test_immediately_closed_watch_does_not_spin(self, mock_time, mock_logger):
+        """Test an empty stream that closes instantly is treated as a failure."""
+        mock_time.time.return_value = 0
+        mock_time.monotonic.return_value = 0
+        condition = Mock(side_effect=[(False, "waiting"), (True, "done")])
+        watch_fn = Mock(return_value=iter([]))
+
+        result = wait_for_condition(
+            description="test empty",
+            condition_fn=condition,
+            interval=5,
+            watch_fn=watch_fn,
+            logger=mock_logger,
+        )
+
+        assert result is True
+        mock_time.sleep.assert_called_once_with(5)